@@ -3,19 +3,25 @@
 # Description:  Starting point for the Gess game.
 
 
+import time
+
+# Startup is measured from here for --startup-time
+_start = time.perf_counter()
+
+import atexit
+import os
 import sys
 from models.Game import Game
 from models.Player import Player
 from models.Board import Board
 from models.History import History
 from controllers.BoardController import BoardController
-from controllers.HistoryController import HistoryController
 from views.GameView import GameView
 from views.BoardView import BoardView
 from views.SquareView import SquareView
 from views.StatusView import StatusView
-from views.HistoryView import HistoryView
 from PySide2.QtWidgets import QApplication
+from PySide2.QtCore import QEvent, QTimer
 
 
 class Gess(QApplication):
@@ -23,6 +29,21 @@ class Gess(QApplication):
     def __init__(self, sys_argv):
         super(Gess, self).__init__(sys_argv)
 
+        # Profiling is switched on with --profile or GESS_PROFILE=1 and must be
+        # installed before the models and views connect their signals
+        self._profiler = None
+        if "--profile" in sys_argv or os.environ.get("GESS_PROFILE", "0") not in {"", "0"}:
+            from tools.Profiler import Profiler
+            self._profiler = Profiler()
+            self._profiler.install()
+            atexit.register(self._profiler.dump, os.environ.get("GESS_PROFILE_OUTPUT"))
+
+        # With --startup-time, report the time to the first painted frame and quit
+        self._measure_startup = "--startup-time" in sys_argv
+
+        # With --computer, the engine plays white once the board is shown
+        self._play_computer = "--computer" in sys_argv
+
         # Models
         self._board = Board()
         # TODO: Move to external file of constants
@@ -32,18 +53,109 @@ class Gess(QApplication):
 
         # Controllers
         self._board_controller = BoardController(self._game)
-        self._history_controller = HistoryController(self._game)
 
         board_size = len(self._board.get_squares())
 
-        # Views
+        # Views; the history sidebar is added once the board has been shown
         self._square_views = [[SquareView((i, j)) for j in range(board_size)] for i in range(board_size)]
         self._board_view = BoardView(self._square_views, self._game, self._board_controller)
         self._status_view = StatusView(self._game)
-        self._history_view = HistoryView(self._history, self._history_controller)
-        self._game_view = GameView(self._board_view, self._status_view, self._history_view)
+        self._history_view = None
+        self._review = None
+        self._review_enabled = True
+        self._analysis = None
+        self._engine = None
+        self._game_view = GameView(self._board_view, self._status_view)
+        self._board_view.installEventFilter(self)
         self._game_view.show()
 
+    def eventFilter(self, watched, event):
+        """ Waits for the first paint of the board, then finishes starting up
+            once control returns to the event loop. """
+        if watched is self._board_view and event.type() == QEvent.Paint:
+            self._board_view.removeEventFilter(self)
+            QTimer.singleShot(0, self.on_first_frame)
+
+        return False
+
+    def on_first_frame(self):
+        """ Runs after the board is first painted.  Reports the startup time if
+            asked for, otherwise builds the views which were not needed for
+            the first frame. """
+        if self._measure_startup:
+            print("First frame after {:.0f} ms".format((time.perf_counter() - _start) * 1000))
+            self.quit()
+            return
+
+        from views.HistoryView import HistoryView
+        self._history_view = HistoryView(self._history, None)
+        self._game_view.set_history_view(self._history_view)
+
+        from PySide2.QtGui import QKeySequence
+        from PySide2.QtWidgets import QShortcut
+
+        # Ctrl+R starts or ends a review of the moves played
+        self._review_shortcut = QShortcut(QKeySequence("Ctrl+R"), self._game_view)
+        self._review_shortcut.activated.connect(self.toggle_review)
+
+        # Ctrl+A starts or stops analysing the position in the background
+        self._analysis_shortcut = QShortcut(QKeySequence("Ctrl+A"), self._game_view)
+        self._analysis_shortcut.activated.connect(self.toggle_analysis)
+
+        if self._play_computer:
+            from engine.EnginePlayer import EnginePlayer
+            self._engine = EnginePlayer(self._game, self._board_controller, 'w')
+            self.aboutToQuit.connect(self._engine.shutdown)
+            self._engine.start()
+
+        # Ctrl+Shift+P prints the timings recorded so far
+        if self._profiler is not None:
+            self._profile_shortcut = QShortcut(QKeySequence("Ctrl+Shift+P"), self._game_view)
+            self._profile_shortcut.activated.connect(self._profiler.dump)
+
+    def toggle_review(self):
+        """ Shows the game's moves under review on the board, where they can be
+            stepped through, or returns to the game.  Clicks on the board are
+            ignored during a review, and the engine's moves are held until it
+            ends. """
+        if self._review is None:
+            from models.Review import Review
+            from views.ReviewView import ReviewView
+            self._board.set_selected(None)
+            self._review_enabled = self._board_controller.is_enabled()
+            self._board_controller.set_enabled(False)
+            if self._engine is not None:
+                self._engine.set_paused(True)
+            self._review = Review(self._board.get_squares(), self._history.get_history())
+            self._review.squares_changed.connect(self._board_view.update_changed)
+            review_view = ReviewView(self._review)
+            self._game_view.set_review_view(review_view)
+            review_view.focus()
+        else:
+            self._game_view.set_review_view(None)
+            self._review = None
+            self._board_view.update_squares()
+            self._board_controller.set_enabled(self._review_enabled)
+            if self._engine is not None:
+                self._engine.set_paused(False)
+
+    def toggle_analysis(self):
+        """ Shows the engine's analysis of the game, updated after every move,
+            or hides it. The engine runs in its own process, started the
+            first time analysis is shown. """
+        if self._analysis is None:
+            from engine.AnalysisService import AnalysisService
+            self._analysis = AnalysisService(self._game)
+            self.aboutToQuit.connect(self._analysis.shutdown)
+
+        if self._analysis.is_running():
+            self._analysis.stop()
+            self._game_view.set_analysis_view(None)
+        else:
+            from views.AnalysisView import AnalysisView
+            self._game_view.set_analysis_view(AnalysisView(self._analysis))
+            self._analysis.start()
+
 
 if __name__ == "__main__":
     app = Gess(sys.argv)
@@ -0,0 +1,225 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Times move generation and rule checking over a fixed corpus of
+#               positions, saves the results as JSON and flags regressions
+#               against a saved baseline.
+
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from models.Board import Board
+from models.Game import Game
+from models.GameRecord import GameRecord
+from models.Notation import Notation
+from models.Player import Player
+from models.Position import PLAYABLE, Position, SIZE
+from controllers.BoardController import BoardController
+
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games.txt")
+
+
+class Benchmark:
+    """ Times the hot paths of the rules over the initial position and the
+        positions reached after every plies_between moves of each corpus game.
+        Each case is timed over every sampled move of every position, repeat
+        times; the median of the repeats is reported in nanoseconds per call. """
+    def __init__(self, corpus=CORPUS, plies_between=20, moves_per_position=20, repeat=5):
+        self._repeat = repeat
+        self._positions = [Position()]
+        self._moves = []
+
+        for record in GameRecord.read_archive(corpus):
+            position = Position()
+            for ply, (origin, destination) in enumerate(record.get_moves(), 1):
+                position.make_move(Notation.to_center(origin), Notation.to_center(destination))
+                if ply % plies_between == 0 and position.get_game_state() == 'UNFINISHED':
+                    self._positions.append(position.copy())
+
+        # Sample the same legal moves every run so results are comparable
+        sampler = random.Random(0)
+        for position in self._positions:
+            moves = position.legal_moves()
+            self._moves.append(sampler.sample(moves, min(moves_per_position, len(moves))))
+
+        self._cases = {
+            "Board.move_piece": self.time_move_piece,
+            "Board.check_for_rings": self.time_check_for_rings,
+            "BoardController.get_piece": self.time_get_piece,
+            "BoardController.is_legal_move": self.time_is_legal_move,
+            "Game.make_move": self.time_make_move
+        }
+
+    def get_positions(self):
+        """ Returns the positions of the corpus. """
+        return self._positions
+
+    def run(self, names=None):
+        """ Runs the named cases, or all of them.  Returns the results in the
+            form {name: {"calls": n, "median_ns": t, "min_ns": t}}. """
+        results = {}
+
+        for name, case in self._cases.items():
+            if names and name not in names:
+                continue
+
+            timings = []
+            calls = 0
+            for _ in range(self._repeat):
+                elapsed, calls = case()
+                timings.append(elapsed / calls)
+
+            results[name] = {
+                "calls": calls,
+                "median_ns": statistics.median(timings),
+                "min_ns": min(timings)
+            }
+
+        return results
+
+    @staticmethod
+    def compare(results, baseline, threshold=0.1):
+        """ Returns the names of cases whose median time grew by more than
+            threshold, a fraction, over the baseline. """
+        return [name for name, result in results.items()
+                if name in baseline and result["median_ns"] > baseline[name]["median_ns"] * (1 + threshold)]
+
+    def _games(self):
+        """ Yields a Game set up at each position of the corpus, with its
+            controller, the squares to restore and the sampled moves as pieces. """
+        for position, moves in zip(self._positions, self._moves):
+            board = Board()
+            game = Game((Player('b'), Player('w')), board)
+            game.load_position(position)
+            controller = BoardController(game)
+
+            pieces = [(controller.get_piece(divmod(source, SIZE)), controller.get_piece(divmod(target, SIZE)))
+                      for source, target in moves]
+
+            yield game, controller, [row[:] for row in board.get_squares()], pieces
+
+    def time_move_piece(self):
+        """ Times Board.move_piece, restoring the squares after each call. """
+        elapsed = calls = 0
+
+        for game, _, squares, pieces in self._games():
+            board = game.get_board()
+            for source, target in pieces:
+                start = time.perf_counter_ns()
+                board.move_piece(source, target)
+                elapsed += time.perf_counter_ns() - start
+                calls += 1
+                board.get_squares()[:] = [row[:] for row in squares]
+                board.count_stones()
+
+        return elapsed, calls
+
+    def time_check_for_rings(self):
+        """ Times Board.check_for_rings. """
+        elapsed = calls = 0
+
+        for game, _, _, _ in self._games():
+            board = game.get_board()
+            start = time.perf_counter_ns()
+            for _ in range(10):
+                board.check_for_rings()
+            elapsed += time.perf_counter_ns() - start
+            calls += 10
+
+        return elapsed, calls
+
+    def time_get_piece(self):
+        """ Times BoardController.get_piece at every playable center. """
+        elapsed = calls = 0
+        centers = [divmod(center, SIZE) for center in PLAYABLE]
+
+        for _, controller, _, _ in self._games():
+            start = time.perf_counter_ns()
+            for center in centers:
+                controller.get_piece(center)
+            elapsed += time.perf_counter_ns() - start
+            calls += len(centers)
+
+        return elapsed, calls
+
+    def time_is_legal_move(self):
+        """ Times BoardController.is_legal_move on the sampled moves and on the
+            same moves reversed, which are mostly illegal. """
+        elapsed = calls = 0
+
+        for _, controller, _, pieces in self._games():
+            start = time.perf_counter_ns()
+            for source, target in pieces:
+                controller.is_legal_move(source, target)
+                controller.is_legal_move(target, source)
+            elapsed += time.perf_counter_ns() - start
+            calls += 2 * len(pieces)
+
+        return elapsed, calls
+
+    def time_make_move(self):
+        """ Times Game.make_move, restoring the game after each call. """
+        elapsed = calls = 0
+
+        for game, _, _, pieces in self._games():
+            position = Position.from_game(game)
+
+            for source, target in pieces:
+                start = time.perf_counter_ns()
+                game.make_move(source, target)
+                elapsed += time.perf_counter_ns() - start
+                calls += 1
+
+                game.load_position(position)
+
+        return elapsed, calls
+
+
+def main():
+    """ Runs the benchmarks, writes the results and compares them to a baseline.
+        Exits with status 1 if any case regressed. """
+    parser = argparse.ArgumentParser(description="Times the Gess rules over a corpus of positions.")
+    parser.add_argument("cases", nargs="*", help="the cases to run; all by default")
+    parser.add_argument("--corpus", default=CORPUS, help="an archive of recorded games")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of times to run each case")
+    parser.add_argument("-o", "--output", help="a file to write the results to")
+    parser.add_argument("--baseline", help="a results file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="also write the results to --baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="the slowdown counted as a regression")
+    args = parser.parse_args()
+
+    benchmark = Benchmark(args.corpus, repeat=args.repeat)
+    results = benchmark.run(args.cases)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    elif args.baseline and args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+
+    regressions = Benchmark.compare(results, baseline, args.threshold)
+
+    print("{} positions".format(len(benchmark.get_positions())))
+    for name, result in results.items():
+        change = ""
+        if name in baseline:
+            change = "{:+.1%}".format(result["median_ns"] / baseline[name]["median_ns"] - 1)
+        flag = "REGRESSION" if name in regressions else ""
+        print("{:32} {:>12.0f} ns {:>8} {}".format(name, result["median_ns"], change, flag))
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Measures the memory taken by each stored move, position and
+#               player, comparing the compact records with the objects they
+#               replace.
+
+
+import argparse
+import json
+import tracemalloc
+from benchmarks.Benchmark import CORPUS
+from models.GameRecord import GameRecord
+from models.Layout import LAYOUT
+from models.Move import Move
+from models.Notation import Notation
+from models.Player import Player
+from models.Position import Position, SIZE
+
+
+class DictPlayer:
+    """ A Player as it was before __slots__, keeping a per-instance dict. """
+    def __init__(self, stone):
+        self._stone = stone
+        self._color = "BLACK" if stone == 'b' else "WHITE"
+        self._rings = LAYOUT.get_initial_rings(stone)
+
+
+class MemoryBenchmark:
+    """ Replays the corpus and stores every move and position reached in each
+        representation, measuring the bytes allocated per item with tracemalloc. """
+    def __init__(self, corpus=CORPUS):
+        # In the form [(position, source, target)] before each move
+        self._moves = []
+
+        for record in GameRecord.read_archive(corpus):
+            position = Position()
+            for origin, destination in record.get_moves():
+                source, target = Notation.to_center(origin), Notation.to_center(destination)
+                self._moves.append((position.copy(), source, target))
+                position.make_move(source, target)
+
+        self._cases = {
+            "move (pieces)": lambda: [self.get_pieces(*move) for move in self._moves],
+            "move (Move)": lambda: [Move.from_pieces(*self.get_pieces(*move)) for move in self._moves],
+            "position (squares)": lambda: [[list(row) for row in position.get_squares()]
+                                           for position, _, _ in self._moves],
+            "position (Position)": lambda: [position.copy() for position, _, _ in self._moves],
+            "player (dict)": lambda: [DictPlayer('bw'[i % 2]) for i in range(len(self._moves))],
+            "player (slots)": lambda: [Player('bw'[i % 2]) for i in range(len(self._moves))]
+        }
+
+    def get_count(self):
+        """ Returns the number of items stored by each case. """
+        return len(self._moves)
+
+    @staticmethod
+    def get_pieces(position, source, target):
+        """ Returns the origin and destination pieces of a move the way
+            BoardController.get_piece built them before the coordinates were
+            shared, with a new tuple for every square. """
+        cells = position.get_cells()
+        pieces = []
+
+        for center in (source, target):
+            row, col = divmod(center, SIZE)
+            piece = {}
+            for i in range(3):
+                for j in range(3):
+                    square = row - 1 + i, col - 1 + j
+                    piece[square[0], square[1]] = cells[square[0] * SIZE + square[1]]
+            pieces.append(piece)
+
+        return tuple(pieces)
+
+    def run(self, names=None):
+        """ Runs the named cases, or all of them.  Returns the results in the
+            form {name: {"items": n, "bytes_per_item": b}}. """
+        results = {}
+
+        for name, case in self._cases.items():
+            if names and name not in names:
+                continue
+
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            stored = case()
+            after = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            results[name] = {
+                "items": len(stored),
+                "bytes_per_item": (after - before) / len(stored)
+            }
+            del stored
+
+        return results
+
+
+def main():
+    """ Runs the memory benchmark and prints the bytes per stored item. """
+    parser = argparse.ArgumentParser(description="Measures the memory of stored Gess moves and positions.")
+    parser.add_argument("cases", nargs="*", help="the cases to run; all by default")
+    parser.add_argument("--corpus", default=CORPUS, help="an archive of recorded games")
+    parser.add_argument("-o", "--output", help="a file to write the results to")
+    args = parser.parse_args()
+
+    results = MemoryBenchmark(args.corpus).run(args.cases)
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    for name, result in results.items():
+        print("{:24} {:>10.0f} bytes".format(name, result["bytes_per_item"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Replays a corpus of recorded games through the Game and
+#               BoardController, checking each against its recorded final
+#               board, rings and result, and measuring moves per second.
+
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import time
+from models.GameRecord import GameRecord
+from models.GessGame import GessGame
+from models.Notation import Notation
+
+
+REPLAYS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replays.jsonl")
+
+
+def describe(game):
+    """ Returns the final state of a GessGame in the form of a corpus case:
+        the board as rows of 'b', 'w' and '.', the ring centers of each player
+        in notation, the player to move and the game state. """
+    board = ["".join(stone or "." for stone in row) for row in game.get_board().get_squares()]
+
+    return {
+        "board": board,
+        "rings": {player.get_stone(): sorted(Notation.to_notation(ring) for ring in player.get_rings())
+                  for player in game.get_game().get_players()},
+        "active": game.get_active_player().get_stone(),
+        "result": game.get_game_state()
+    }
+
+
+def replay(case):
+    """ Replays the moves of a corpus case one at a time, as clicks would.
+        Returns (moves made, seconds taken, mismatches), where mismatches is a
+        list of [field, expected, actual]. """
+    game = GessGame()
+    moves = [tuple(move.split("-")) for move in case["moves"].split()]
+    made = 0
+
+    start = time.perf_counter()
+    for origin, destination in moves:
+        if not game.make_move(origin, destination):
+            break
+        made += 1
+    seconds = time.perf_counter() - start
+
+    mismatches = []
+    if made != len(moves):
+        mismatches.append(["moves", len(moves), made])
+
+    state = describe(game)
+    for field, actual in state.items():
+        if case[field] != actual:
+            mismatches.append([field, case[field], actual])
+
+    return made, seconds, mismatches
+
+
+class ReplayRunner:
+    """ Replays every case of a corpus, in processes worker processes, or in
+        this process if processes is 1.  Each case holds the moves of a game,
+        as in an archive line, and the expected state after the last move, in
+        the form returned by describe. """
+    def __init__(self, corpus=REPLAYS, processes=None):
+        self._processes = processes or os.cpu_count() or 1
+
+        with open(corpus) as corpus_file:
+            self._cases = [json.loads(line) for line in corpus_file if line.strip()]
+
+    def get_cases(self):
+        """ Returns the cases of the corpus. """
+        return self._cases
+
+    def run(self):
+        """ Replays the corpus. Returns a report in the form {"games": n,
+            "moves": n, "seconds": wall time, "moves_per_second": n,
+            "moves_per_second_per_process": n, "mismatches": [{"game": index,
+            "field": name, "expected": value, "actual": value}]}. """
+        start = time.perf_counter()
+
+        if self._processes == 1:
+            results = [replay(case) for case in self._cases]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(self._processes) as pool:
+                chunksize = max(1, len(self._cases) // (self._processes * 4))
+                results = list(pool.map(replay, self._cases, chunksize=chunksize))
+
+        seconds = time.perf_counter() - start
+        moves = sum(made for made, _, _ in results)
+
+        return {
+            "games": len(results),
+            "moves": moves,
+            "seconds": seconds,
+            "moves_per_second": moves / seconds if seconds else 0.0,
+            # Moves per second of a single process, without the cost of starting workers
+            "moves_per_second_per_process": moves / sum(taken for _, taken, _ in results) if moves else 0.0,
+            "mismatches": [{"game": index, "field": field, "expected": expected, "actual": actual}
+                           for index, (_, _, mismatches) in enumerate(results)
+                           for field, expected, actual in mismatches]
+        }
+
+    @staticmethod
+    def record(archives, path):
+        """ Writes a corpus of the games in the archives, with the state each
+            reaches under the current rules as the expected state. Games stop
+            at their first illegal move. Returns the number of games written. """
+        games = 0
+
+        with open(path, "w") as corpus_file:
+            for archive in archives:
+                for record in GameRecord.read_archive(archive):
+                    game = GessGame()
+                    moves = []
+                    for origin, destination in record.get_moves():
+                        if not game.make_move(origin, destination):
+                            break
+                        moves.append((origin, destination))
+
+                    case = {"moves": GameRecord(moves).to_line().partition("\t")[2]}
+                    case.update(describe(game))
+                    corpus_file.write(json.dumps(case) + "\n")
+                    games += 1
+
+        return games
+
+
+def main():
+    """ Replays the corpus and reports mismatches and speed. Exits with status
+        1 if any game ended differently than recorded. """
+    parser = argparse.ArgumentParser(description="Replays recorded Gess games and checks their final states.")
+    parser.add_argument("--corpus", default=REPLAYS, help="the corpus of games with their expected states")
+    parser.add_argument("--processes", type=int, help="the number of worker processes; all cores by default")
+    parser.add_argument("--record", nargs="+", metavar="ARCHIVE",
+                        help="write the corpus from these archives instead of replaying it")
+    args = parser.parse_args()
+
+    if args.record:
+        games = ReplayRunner.record(args.record, args.corpus)
+        print("Recorded", games, "games to", args.corpus)
+        return
+
+    report = ReplayRunner(args.corpus, args.processes).run()
+
+    print("{} games, {} moves in {:.2f} s: {:.0f} moves per second ({:.0f} per process)".format(
+        report["games"], report["moves"], report["seconds"], report["moves_per_second"],
+        report["moves_per_second_per_process"]))
+    for mismatch in report["mismatches"]:
+        print("Game {game}: {field} expected {expected}, got {actual}".format(**mismatch))
+
+    if report["mismatches"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
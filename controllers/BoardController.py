@@ -3,6 +3,8 @@
 # Description:  Accepts user input from the Board View.
 
 
+from models.Layout import LAYOUT
+from models.Move import Move
 from PySide2.QtCore import QObject, Signal
 
 
@@ -17,12 +19,26 @@ class BoardController(QObject):
         self._game = model
         self._board = model.get_board()
 
+        # Clicks are ignored while the board shows something else, such as a review
+        self._enabled = True
+
         # noinspection PyUnresolvedReferences
         self.move_legal.connect(self._game.make_move)
 
+    def set_enabled(self, enabled):
+        """ Sets whether clicks on the board are handled. """
+        self._enabled = enabled
+
+    def is_enabled(self):
+        """ Returns True if clicks on the board are handled. """
+        return self._enabled
+
     def handle_square_click(self, coords):
         """ Validates a piece selection or move
             updates the Board. """
+        if not self._enabled:
+            return
+
         source = self._board.get_selected()
 
         if self._game.get_game_state() != 'UNFINISHED':
@@ -71,19 +87,14 @@ class BoardController(QObject):
             returns a dictionary of the piece's squares in the form
             {(row, col): stone}. """
         # Prevent index wraparound due to gutter selection
-        board_size = len(self._board.get_squares()) - 1
-        if center[0] in {0, board_size} or center[1] in {0, board_size}:
+        if not LAYOUT.is_playable(center[0], center[1]):
             raise IndexError
 
+        # The coordinates are shared by every piece at the same center
+        squares = self._board.get_squares()
         piece = {}
-        sw_corner = center[0] - 1, center[1] - 1
-
-        # From SW corner, all other squares of the piece are positive offsets away
-        for row in range(3):
-            for col in range(3):
-                # Position on the board (row, col)
-                square = sw_corner[0] + row, sw_corner[1] + col
-                piece[square[0], square[1]] = self._board.get_squares()[square[0]][square[1]]
+        for square in Move.get_footprint(center):
+            piece[square] = squares[square[0]][square[1]]
 
         return piece
 
@@ -114,10 +125,9 @@ class BoardController(QObject):
         """ Determines if a pieces center is in the gutter. """
         # The forth element in the piece is the center square
         center = list(piece.keys())[4]
-        gutter_indices = (0, len(self._board.get_squares()) - 1)
 
         # Check if row is in in a gutter row or column is in a gutter column
-        if center[0] in gutter_indices or center[1] in gutter_indices:
+        if not LAYOUT.is_playable(center[0], center[1]):
             return True
 
         return False
@@ -0,0 +1,157 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Analyses the position of a game in a separate process and
+#               reports the results through Qt signals.
+
+
+import multiprocessing
+import queue
+from models.Notation import Notation
+from models.Position import Position
+from PySide2.QtCore import QObject, QTimer, Signal
+
+
+class Superseded:
+    """ Tells a search to stop once a newer position has been sent for
+        analysis, in the form of the stop argument of Search.search. """
+    def __init__(self, latest, generation):
+        self._latest = latest
+        self._generation = generation
+
+    def is_set(self):
+        return self._latest.value != self._generation
+
+
+def analyse(requests, results, latest, settings):
+    """ Runs in the worker process. Searches each requested position until it
+        is finished or a newer one arrives, putting a result on results after
+        every depth in the form (generation, depth, score, variation, nodes),
+        and (generation, None, None, None, None) when done. """
+    from engine.Search import Search
+    search = Search(**settings)
+
+    while True:
+        request = requests.get()
+        if request is None:
+            return
+
+        # Skip positions which were replaced while waiting
+        generation, squares, active, game_state, depth = request
+        if latest.value != generation:
+            continue
+
+        def report(reached, score, variation, nodes):
+            results.put((generation, reached, score, variation, nodes))
+
+        position = Position(squares, active, game_state)
+        if game_state == 'UNFINISHED':
+            search.search(position, depth, stop=Superseded(latest, generation), callback=report)
+        results.put((generation, None, None, None, None))
+
+
+class AnalysisService(QObject):
+    """ Searches the position of a Game in a worker process, so the event loop
+        is never blocked, and restarts whenever Game.board_updated fires.  Each
+        completed depth is emitted with analysis_updated as the depth, the
+        score for the player to move, the principal variation in the form
+        ["l6-l9"] and the number of positions searched.  Results of replaced
+        positions are dropped.  settings are passed to Search. """
+    analysis_updated = Signal(int, int, list, int)
+    analysis_finished = Signal()
+
+    # How often results are collected from the worker, in milliseconds
+    POLL_INTERVAL = 16
+
+    def __init__(self, game, depth=4, settings=None):
+        super(AnalysisService, self).__init__()
+
+        self._game = game
+        self._depth = depth
+        self._generation = 0
+        self._running = False
+
+        # Spawned rather than forked, as the parent has Qt running
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._latest = context.Value('i', 0, lock=False)
+        self._worker = context.Process(target=analyse, daemon=True,
+                                       args=(self._requests, self._results, self._latest, settings or {}))
+
+        self._timer = QTimer()
+        self._timer.setInterval(self.POLL_INTERVAL)
+        self._timer.timeout.connect(self.collect_results)
+
+    def is_running(self):
+        """ Returns True while analysis is switched on. """
+        return self._running
+
+    def start(self):
+        """ Starts analysing the game's position and every position after it. """
+        if self._running:
+            return
+
+        if not self._worker.is_alive():
+            self._worker.start()
+
+        self._running = True
+        self._game.board_updated.connect(self.restart)
+        self._timer.start()
+        self.restart()
+
+    def stop(self):
+        """ Stops the analysis. The worker waits for the next start. """
+        if not self._running:
+            return
+
+        self._running = False
+        self._game.board_updated.disconnect(self.restart)
+        self._timer.stop()
+        self._generation += 1
+        self._latest.value = self._generation
+
+    def shutdown(self):
+        """ Stops the analysis and ends the worker process. """
+        self.stop()
+
+        if self._worker.is_alive():
+            self._requests.put(None)
+            self._worker.join(1)
+            if self._worker.is_alive():
+                self._worker.terminate()
+
+    def restart(self):
+        """ Cancels the search in progress and analyses the game's position. """
+        position = Position.from_game(self._game)
+
+        self._generation += 1
+        self._latest.value = self._generation
+        self._requests.put((self._generation, position.get_squares(), position.get_active(),
+                            position.get_game_state(), self._depth))
+
+    def collect_results(self):
+        """ Emits the results the worker has sent for the current position. """
+        while True:
+            try:
+                generation, depth, score, variation, nodes = self._results.get_nowait()
+            except queue.Empty:
+                return
+
+            if generation != self._generation:
+                continue
+
+            if depth is None:
+                # noinspection PyUnresolvedReferences
+                self.analysis_finished.emit()
+            else:
+                # noinspection PyUnresolvedReferences
+                self.analysis_updated.emit(depth, score, [self.to_notation(move) for move in variation], nodes)
+
+    @staticmethod
+    def to_notation(move):
+        """ Returns a move between flat centers in the form "l6-l9". """
+        return Notation.from_center(move[0]) + "-" + Notation.from_center(move[1])
+
+
+if __name__ == "__main__":
+    pass
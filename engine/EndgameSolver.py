@@ -0,0 +1,171 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Proves wins and losses within a move horizon for positions
+#               where the players have few rings left.
+
+
+import os
+import struct
+from engine.ThreatDetector import ATTACK_CENTERS, ThreatDetector
+from models.IllegalMove import IllegalMove
+
+
+# Results from the point of view of the player to move
+WIN = 1
+LOSS = -1
+UNKNOWN = 0
+
+
+class EndgameSolver:
+    """ Searches positions with at most max_rings rings on the board for a
+        forced win of either player.  A win needs a move breaking the opponent's
+        last ring, so at the horizon only those moves are tried.  Results are
+        kept by position hash and can be saved to cache_path and reused. """
+    # Position hash, result, plies to the end (or depth searched if unknown), source, target
+    ENTRY = struct.Struct("<QbBHH")
+
+    def __init__(self, max_rings=2, cache_path=None):
+        self._max_rings = max_rings
+        self._cache_path = cache_path
+        self._threat_detector = ThreatDetector()
+        self._nodes = 0
+
+        # In the form {hash: (result, plies, move)}
+        self._cache = {}
+        if cache_path is not None and os.path.exists(cache_path):
+            self.load_cache(cache_path)
+
+    def get_nodes(self):
+        """ Returns the number of positions searched since the solver was made. """
+        return self._nodes
+
+    def is_endgame(self, position):
+        """ Returns True if the position has few enough rings to be solved. """
+        return len(position.get_rings()) <= self._max_rings
+
+    def probe(self, position):
+        """ Returns a proven result from the cache in the form (result, plies, move),
+            or None if the position has not been solved. """
+        entry = self._cache.get(position.get_hash())
+        if entry is None or entry[0] == UNKNOWN:
+            return None
+
+        return entry
+
+    def solve(self, position, depth):
+        """ Searches the position depth plies deep. Returns (result, plies, move)
+            where move is the best move in the form (source, target), or None if
+            no move was found, and plies is the number of moves to the end of
+            the game when the result is proven.  Positions which are not an
+            endgame, see is_endgame, are not searched and are UNKNOWN. """
+        if position.get_game_state() == 'UNFINISHED' and not self.is_endgame(position):
+            return UNKNOWN, 0, None
+
+        return self._solve(position, depth)
+
+    def _solve(self, position, depth):
+        """ Searches the position depth plies deep, as solve, whatever its
+            rings, as moves may make new ones. """
+        self._nodes += 1
+
+        if position.get_game_state() != 'UNFINISHED':
+            # The player who just moved broke the last ring
+            return LOSS, 0, None
+
+        position_hash = position.get_hash()
+        entry = self._cache.get(position_hash)
+        if entry is not None and (entry[0] != UNKNOWN or entry[1] >= depth):
+            return entry
+
+        if depth == 0:
+            return UNKNOWN, 0, None
+
+        # A move breaking the opponent's last ring wins at once
+        winning_move = self.find_winning_move(position)
+        if winning_move is not None:
+            return self._store(position_hash, WIN, 1, winning_move)
+
+        # Without a winning move now, one more move cannot change the result
+        if depth == 1:
+            return self._store(position_hash, UNKNOWN, depth, None)
+
+        best = None
+        longest_loss = -1
+        unknown = False
+
+        for source, target in self._ordered_moves(position):
+            try:
+                undo = position.make_move(source, target)
+            except IllegalMove:
+                continue
+
+            result, plies, _ = self._solve(position, depth - 1)
+            position.unmake_move(undo)
+
+            if result == LOSS and (best is None or plies + 1 < best[1]):
+                # The opponent loses; keep the quickest win
+                best = WIN, plies + 1, (source, target)
+                if plies == 0:
+                    break
+            elif result == UNKNOWN:
+                unknown = True
+            elif result == WIN and plies + 1 > longest_loss:
+                longest_loss = plies + 1
+                longest_move = source, target
+
+        if best is not None:
+            return self._store(position_hash, *best)
+
+        if unknown or longest_loss < 0:
+            # A player with no legal moves is not lost by the rules
+            return self._store(position_hash, UNKNOWN, depth, None)
+
+        # Every move loses; delay the loss as long as possible
+        return self._store(position_hash, LOSS, longest_loss, longest_move)
+
+    def find_winning_move(self, position):
+        """ Returns a legal move breaking every ring of the opponent in the form
+            (source, target), or None. """
+        moves = self._threat_detector.get_winning_moves(position)
+
+        return moves[0] if moves else None
+
+    def _ordered_moves(self, position):
+        """ Returns the pseudo legal moves with those landing near a ring first,
+            as they are the most likely to decide the game. """
+        near = set()
+        for ring in position.get_rings():
+            near.update(ATTACK_CENTERS[ring])
+
+        moves = list(position.pseudo_legal_moves())
+        moves.sort(key=lambda move: move[1] not in near)
+
+        return moves
+
+    def _store(self, position_hash, result, plies, move):
+        """ Caches and returns a result. """
+        entry = result, plies, move
+        self._cache[position_hash] = entry
+
+        return entry
+
+    def load_cache(self, path):
+        """ Adds the proven results saved in a cache file. """
+        with open(path, "rb") as cache:
+            data = cache.read()
+
+        for position_hash, result, plies, source, target in self.ENTRY.iter_unpack(data):
+            self._cache[position_hash] = result, plies, (source, target) if source != target else None
+
+    def save_cache(self, path=None):
+        """ Writes the proven results to the cache file. Unknown results depend
+            on the depth searched and are not saved. """
+        with open(path or self._cache_path, "wb") as cache:
+            for position_hash, (result, plies, move) in self._cache.items():
+                if result != UNKNOWN:
+                    source, target = move if move is not None else (0, 0)
+                    cache.write(self.ENTRY.pack(position_hash, result, plies, source, target))
+
+
+if __name__ == "__main__":
+    pass
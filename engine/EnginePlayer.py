@@ -0,0 +1,352 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Plays one side of a game with the engine in a separate
+#               process, managing its clock and thinking on the opponent's
+#               time, and reports through Qt signals.
+
+
+import functools
+import multiprocessing
+import queue
+import time
+from engine.AnalysisService import AnalysisService
+from engine.TimeControl import TimeControl
+from models.IllegalMove import IllegalMove
+from models.Notation import Notation
+from models.Position import Position, SIZE
+from PySide2.QtCore import QObject, QTimer, Signal
+
+
+class Deadline:
+    """ Tells a search to stop once a newer position has been sent or the
+        shared deadline has passed, in the form of the stop argument of
+        Search.search.  A deadline of 0 is no deadline, used while pondering,
+        and may be set while the search runs. """
+    def __init__(self, latest, generation, deadline):
+        self._latest = latest
+        self._generation = generation
+        self._deadline = deadline
+
+    def is_set(self):
+        if self._latest.value != self._generation:
+            return True
+
+        deadline = self._deadline.value
+        return 0 < deadline < time.monotonic()
+
+
+def think(requests, results, latest, deadline, settings):
+    """ Runs in the worker process. Searches each requested position until the
+        deadline passes or a newer one arrives, putting a result on results
+        after every depth in the form (generation, depth, score, variation,
+        nodes), and (generation, None, score, variation, move) when done. """
+    from engine.Search import Search
+    search = Search(**settings)
+
+    while True:
+        request = requests.get()
+        if request is None:
+            return
+
+        # Skip positions which were replaced while waiting
+        generation, squares, active, depth = request
+        if latest.value != generation:
+            continue
+
+        def report(reached, score, variation, nodes):
+            results.put((generation, reached, score, variation, nodes))
+
+        position = Position(squares, active)
+        move, score, variation = search.search(position, depth, stop=Deadline(latest, generation, deadline),
+                                               callback=report)
+        results.put((generation, None, score, variation, move))
+
+
+class EnginePlayer(QObject):
+    """ Plays stone in a Game through its BoardController, searching in a
+        worker process so the event loop is never blocked.  Each move is
+        searched until the time given by time_control runs out, or to
+        max_depth.  With ponder, while the opponent is to move the engine
+        searches the position after the reply it expects; if that reply is
+        played the search carries on instead of starting over, and the time
+        it has already run counts towards the time for the move.  Clicks on
+        the board are ignored while the engine is to move.  While paused, as
+        during a review, a finished move is held until play resumes.
+        settings are passed to Search. """
+    thinking_started = Signal()
+    pondering_started = Signal(str)
+    ponder_finished = Signal(bool)
+    search_updated = Signal(int, int, list, int)
+    move_played = Signal(str, str)
+
+    # How often results are collected from the worker, in milliseconds
+    POLL_INTERVAL = 16
+
+    def __init__(self, game, controller, stone='w', time_control=None, ponder=True, max_depth=64, settings=None):
+        super(EnginePlayer, self).__init__()
+
+        self._game = game
+        self._controller = controller
+        self._stone = stone
+        self._time_control = time_control or TimeControl()
+        self._ponder = ponder
+        self._max_depth = max_depth
+        self._generation = 0
+        self._running = False
+        self._paused = False
+
+        # A move found while paused, as (move, variation), and whether clicks
+        # were enabled before the engine disabled them, or None if it has not
+        self._held = None
+        self._enabled = None
+
+        # The reply expected from the opponent, as (source, target), the hash
+        # of the position it leads to and when pondering it began, and the
+        # result of a ponder search which finished before the reply was played
+        self._prediction = None
+        self._ponder_hash = None
+        self._ponder_started = 0.0
+        self._pondered = None
+        self._ponder_hits = 0
+
+        # Spawned rather than forked, as the parent has Qt running
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._latest = context.Value('i', 0, lock=False)
+        self._deadline = context.Value('d', 0.0, lock=False)
+        self._worker = context.Process(target=think, daemon=True,
+                                       args=(self._requests, self._results, self._latest, self._deadline,
+                                             settings or {}))
+
+        self._timer = QTimer()
+        self._timer.setInterval(self.POLL_INTERVAL)
+        self._timer.timeout.connect(self.collect_results)
+
+    def get_stone(self):
+        """ Returns the stone the engine plays. """
+        return self._stone
+
+    def get_time_control(self):
+        """ Returns the clocks of the game. """
+        return self._time_control
+
+    def get_ponder_hits(self):
+        """ Returns the number of replies the engine predicted while pondering. """
+        return self._ponder_hits
+
+    def is_running(self):
+        """ Returns True while the engine is playing. """
+        return self._running
+
+    def is_paused(self):
+        """ Returns True while the engine holds its moves. """
+        return self._paused
+
+    def is_pondering(self):
+        """ Returns True while the engine searches on the opponent's time. """
+        return self._ponder_hash is not None
+
+    def start(self):
+        """ Starts playing from the game's position. """
+        if self._running:
+            return
+
+        if not self._worker.is_alive():
+            self._worker.start()
+
+        self._running = True
+        self._game.board_updated.connect(self.on_board_updated)
+        self._timer.start()
+        self._start_turn()
+
+    def stop(self):
+        """ Stops playing, abandoning any search. The worker waits for the next start. """
+        if not self._running:
+            return
+
+        self._running = False
+        self._game.board_updated.disconnect(self.on_board_updated)
+        self._timer.stop()
+        self._time_control.stop()
+        self._cancel()
+        self._held = None
+        self._restore_enabled()
+
+    def shutdown(self):
+        """ Stops playing and ends the worker process. """
+        self.stop()
+
+        if self._worker.is_alive():
+            self._requests.put(None)
+            self._worker.join(1)
+            if self._worker.is_alive():
+                self._worker.terminate()
+
+    def set_paused(self, paused):
+        """ Holds any move the engine finds, or plays the move held. The
+            controller is left as it is, so whoever paused the engine may
+            disable it. """
+        self._paused = paused
+        if paused or self._held is None:
+            return
+
+        held, self._held = self._held, None
+        self.play(*held)
+
+    def on_board_updated(self):
+        """ Switches clocks after a move, and starts the engine's search or its
+            pondering. """
+        self._time_control.stop()
+        self._start_turn()
+
+    def collect_results(self):
+        """ Emits the results the worker has sent for the current search, and
+            plays the move once a search against the clock is done. """
+        while True:
+            try:
+                generation, depth, score, variation, detail = self._results.get_nowait()
+            except queue.Empty:
+                return
+
+            if generation != self._generation:
+                continue
+
+            if depth is not None:
+                # noinspection PyUnresolvedReferences
+                self.search_updated.emit(depth, score, [AnalysisService.to_notation(move) for move in variation],
+                                         detail)
+            elif self.is_pondering():
+                # Kept in case the predicted reply is played
+                self._pondered = detail, variation
+            else:
+                self.play(detail, variation)
+                return
+
+    def play(self, move, variation):
+        """ Makes the engine's move in the game, remembering the reply it
+            expects. Resigns if it has no legal move. Holds the move while
+            paused. """
+        if self._paused:
+            self._held = move, variation
+            return
+
+        self._prediction = variation[1] if len(variation) > 1 and variation[0] == move else None
+        self._cancel()
+
+        if move is None:
+            self._game.resign_game()
+            self._restore_enabled()
+            return
+
+        source = self._controller.get_piece(divmod(move[0], SIZE))
+        target = self._controller.get_piece(divmod(move[1], SIZE))
+        origin, destination = Notation.from_center(move[0]), Notation.from_center(move[1])
+
+        self._restore_enabled()
+        self._game.make_move(source, target)
+        # noinspection PyUnresolvedReferences
+        self.move_played.emit(origin, destination)
+
+    def _start_turn(self):
+        """ Starts the clock of the player to move and the search fitting the
+            turn. """
+        if self._game.get_game_state() != 'UNFINISHED':
+            self._cancel()
+            self._restore_enabled()
+            return
+
+        active = self._game.get_active_player().get_stone()
+        self._time_control.start(active)
+        position = Position.from_game(self._game)
+
+        if active != self._stone:
+            self._restore_enabled()
+            self._start_pondering(position)
+            return
+
+        self._disable()
+
+        if self.is_pondering():
+            hit = position.get_hash() == self._ponder_hash
+            pondered, self._pondered = self._pondered, None
+            self._ponder_hash = None
+            # noinspection PyUnresolvedReferences
+            self.ponder_finished.emit(hit)
+
+            if hit:
+                # The search already under way continues, now against the
+                # clock, counting the time spent pondering as time thought
+                self._ponder_hits += 1
+                self._deadline.value = max(self._ponder_started + self._time_control.allocate(self._stone),
+                                           time.monotonic() + TimeControl.MIN_MOVE_TIME)
+                if pondered is not None:
+                    # Played once control returns to the event loop, after
+                    # every view has seen the opponent's move
+                    QTimer.singleShot(0, functools.partial(self._play_pondered, self._generation, *pondered))
+                # noinspection PyUnresolvedReferences
+                self.thinking_started.emit()
+                return
+
+        self._request(position, time.monotonic() + self._time_control.allocate(self._stone))
+        # noinspection PyUnresolvedReferences
+        self.thinking_started.emit()
+
+    def _play_pondered(self, generation, move, variation):
+        """ Plays the result of a finished ponder search unless the engine was
+            stopped since. """
+        if generation == self._generation:
+            self.play(move, variation)
+
+    def _start_pondering(self, position):
+        """ Searches the position after the opponent's expected reply, if any. """
+        prediction, self._prediction = self._prediction, None
+        self._cancel()
+        if not self._ponder or prediction is None or not position.is_legal_move(*prediction):
+            return
+
+        try:
+            position.make_move(*prediction)
+        except IllegalMove:
+            return
+        if position.get_game_state() != 'UNFINISHED':
+            return
+
+        self._ponder_hash = position.get_hash()
+        self._ponder_started = time.monotonic()
+        self._request(position, 0.0)
+        # noinspection PyUnresolvedReferences
+        self.pondering_started.emit(AnalysisService.to_notation(prediction))
+
+    def _request(self, position, deadline):
+        """ Replaces any search with one of position, stopping at deadline,
+            or only when replaced if deadline is 0. """
+        self._generation += 1
+        self._latest.value = self._generation
+        self._deadline.value = deadline
+        self._requests.put((self._generation, position.get_squares(), position.get_active(), self._max_depth))
+
+    def _disable(self):
+        """ Ignores clicks on the board, remembering whether they were
+            enabled. """
+        if self._enabled is None:
+            self._enabled = self._controller.is_enabled()
+        self._controller.set_enabled(False)
+
+    def _restore_enabled(self):
+        """ Enables clicks on the board again if they were before the engine
+            disabled them. """
+        if self._enabled is not None:
+            self._controller.set_enabled(self._enabled)
+            self._enabled = None
+
+    def _cancel(self):
+        """ Abandons the search under way and any ponder result. """
+        self._generation += 1
+        self._latest.value = self._generation
+        self._ponder_hash = None
+        self._pondered = None
+
+
+if __name__ == "__main__":
+    pass
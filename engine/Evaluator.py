@@ -0,0 +1,24 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  The interface Search scores positions through.
+
+
+class Evaluator:
+    """ Scores positions from the point of view of the player to move, higher
+        being better, in the units of Search.  Subclasses implement evaluate
+        for a batch of positions.  Evaluators which are much cheaper per
+        position on a batch set batched, and Search then gathers the children
+        of a node and scores them together before searching them. """
+    batched = False
+
+    def evaluate(self, positions):
+        """ Returns the scores of a sequence of Positions as a list. """
+        raise NotImplementedError
+
+    def evaluate_position(self, position):
+        """ Returns the score of a single Position. """
+        return self.evaluate([position])[0]
+
+
+if __name__ == "__main__":
+    pass
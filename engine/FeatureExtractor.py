@@ -0,0 +1,146 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Computes fixed length feature vectors of Gess positions for
+#               tuning and statistics, a whole batch at a time.
+
+
+import numpy as np
+from models.Layout import LAYOUT
+from models.Position import DIRECTIONS, SIZE
+
+
+class FeatureExtractor:
+    """ Turns positions into rows of a NumPy array.  Features are counted from
+        the point of view of the player to move: their stones, rings, pieces
+        able to move in each direction, stones in the center and stones next
+        to the gutter, then the same for the opponent where it applies.
+        Positions are either Position objects or (Board, Player) pairs. """
+    FEATURES = (
+        ("stones", "opponent_stones", "rings", "opponent_rings")
+        + tuple("mobility_{}_{}".format(*direction) for direction in DIRECTIONS)
+        + ("center", "opponent_center", "gutter", "opponent_gutter")
+    )
+
+    # Rows and columns counted as the center of the board, 7 to 12 in the
+    # standard layout
+    CENTER = slice(SIZE // 2 - 3, SIZE // 2 + 3)
+
+    # Width of the gutter around the playable squares
+    GUTTER = LAYOUT.get_gutter()
+
+    def __init__(self, batch_size=4096):
+        self._batch_size = batch_size
+
+        # Targets must stay out of the gutter for a piece to move one square
+        self._in_bounds = []
+        playable = SIZE - 2 * self.GUTTER
+        for row_delta, col_delta in DIRECTIONS:
+            mask = np.zeros((playable, playable), dtype=bool)
+            mask[max(0, -row_delta):playable - max(0, row_delta),
+                 max(0, -col_delta):playable - max(0, col_delta)] = True
+            self._in_bounds.append(mask)
+
+        # Playable squares next to the gutter
+        gutter = self.GUTTER
+        self._edge = np.zeros((SIZE, SIZE), dtype=bool)
+        self._edge[gutter:SIZE - gutter, gutter:SIZE - gutter] = True
+        self._edge[gutter + 1:SIZE - gutter - 1, gutter + 1:SIZE - gutter - 1] = False
+
+    def size(self):
+        """ Returns the number of features per position. """
+        return len(self.FEATURES)
+
+    def extract(self, board, player):
+        """ Returns the features of a Board with player to move. """
+        return self.extract_batch([(board, player)])[0]
+
+    def extract_batch(self, positions, out=None):
+        """ Fills out, an array of shape (len(positions), size()), with the
+            features of each position and returns it. A float32 array is
+            created if out is not given. Positions are encoded batch_size
+            at a time to bound memory. """
+        count = len(positions)
+        if out is None:
+            out = np.empty((count, self.size()), dtype=np.float32)
+
+        for start in range(0, count, self._batch_size):
+            batch = positions[start:start + self._batch_size]
+            own, opponent = self._encode(batch)
+            self._fill(own, opponent, out[start:start + len(batch)])
+
+        return out
+
+    @staticmethod
+    def _encode(batch):
+        """ Returns boolean arrays of shape (len(batch), SIZE, SIZE) marking the
+            stones of the player to move and of the opponent. """
+        cells = np.empty((len(batch), SIZE * SIZE), dtype=np.uint8)
+        active = np.empty((len(batch), 1), dtype=np.uint8)
+
+        for i, position in enumerate(batch):
+            if isinstance(position, tuple):
+                board, player = position
+                squares = "".join(stone or "." for row in board.get_squares() for stone in row)
+                stone = player.get_stone()
+            else:
+                squares = "".join(stone or "." for stone in position.get_cells())
+                stone = position.get_active()
+            cells[i] = np.frombuffer(squares.encode(), dtype=np.uint8)
+            active[i] = ord(stone)
+
+        occupied = cells != ord(".")
+        own = cells == active
+        opponent = occupied & ~own
+
+        return own.reshape(-1, SIZE, SIZE), opponent.reshape(-1, SIZE, SIZE)
+
+    def _fill(self, own, opponent, out):
+        """ Writes the features of encoded positions into the rows of out. """
+        empty = ~(own | opponent)
+        playable = slice(self.GUTTER, SIZE - self.GUTTER)
+
+        out[:, 0] = own.sum(axis=(1, 2))
+        out[:, 1] = opponent.sum(axis=(1, 2))
+        out[:, 2] = self._count_rings(own, empty)
+        out[:, 3] = self._count_rings(opponent, empty)
+
+        # A piece belongs to the player if it has one of their stones and none of the opponent's
+        has_own = np.zeros((len(own), SIZE - 2 * self.GUTTER, SIZE - 2 * self.GUTTER), dtype=bool)
+        has_opponent = np.zeros_like(has_own)
+        for row_delta in (-1, 0, 1):
+            for col_delta in (-1, 0, 1):
+                window = (slice(None), self._shift(playable, row_delta), self._shift(playable, col_delta))
+                has_own |= own[window]
+                has_opponent |= opponent[window]
+        player_piece = has_own & ~has_opponent
+
+        # Any piece may move one square towards a stone on its edge without being blocked
+        for i, (row_delta, col_delta) in enumerate(DIRECTIONS):
+            direction_stone = own[:, self._shift(playable, row_delta), self._shift(playable, col_delta)]
+            out[:, 4 + i] = (player_piece & direction_stone & self._in_bounds[i]).sum(axis=(1, 2))
+
+        out[:, 12] = own[:, self.CENTER, self.CENTER].sum(axis=(1, 2))
+        out[:, 13] = opponent[:, self.CENTER, self.CENTER].sum(axis=(1, 2))
+        out[:, 14] = (own & self._edge).sum(axis=(1, 2))
+        out[:, 15] = (opponent & self._edge).sum(axis=(1, 2))
+
+    def _count_rings(self, stones, empty):
+        """ Counts the rings formed by stones, the same as Board.check_for_rings. """
+        centers = slice(self.GUTTER + 1, SIZE - self.GUTTER)
+        rings = empty[:, centers, centers].copy()
+
+        for row_delta in (-1, 0, 1):
+            for col_delta in (-1, 0, 1):
+                if row_delta or col_delta:
+                    rings &= stones[:, self._shift(centers, row_delta), self._shift(centers, col_delta)]
+
+        return rings.sum(axis=(1, 2))
+
+    @staticmethod
+    def _shift(window, delta):
+        """ Returns the slice window moved by delta. """
+        return slice(window.start + delta, window.stop + delta)
+
+
+if __name__ == "__main__":
+    pass
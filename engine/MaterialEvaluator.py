@@ -0,0 +1,34 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Scores Gess positions by the stones and rings of each player.
+
+
+from engine.Evaluator import Evaluator
+from models.Position import OPPONENT
+
+
+class MaterialEvaluator(Evaluator):
+    """ Scores a position by the difference in stones and rings between the
+        player to move and the opponent, weighted by stone_weight and
+        ring_weight.  Cheap enough to be called one position at a time. """
+    def __init__(self, stone_weight=1, ring_weight=40):
+        self._stone_weight = stone_weight
+        self._ring_weight = ring_weight
+
+    def evaluate(self, positions):
+        """ Returns the scores of a sequence of Positions as a list. """
+        return [self.evaluate_position(position) for position in positions]
+
+    def evaluate_position(self, position):
+        """ Returns the score of a single Position. """
+        stone = position.get_active()
+        opponent = OPPONENT[stone]
+
+        stones = position.get_stones(stone) - position.get_stones(opponent)
+        rings = len(position.get_rings(stone)) - len(position.get_rings(opponent))
+
+        return stones * self._stone_weight + rings * self._ring_weight
+
+
+if __name__ == "__main__":
+    pass
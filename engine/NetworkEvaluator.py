@@ -0,0 +1,122 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Scores Gess positions with a small NumPy network over the
+#               input planes of the training data.
+
+
+import numpy as np
+from engine.Evaluator import Evaluator
+from models.Position import SIZE, SYMMETRIES
+from models.PositionCodec import PLANES, PositionCodec
+
+
+# Inputs of the first layer, the flattened planes of PositionCodec.to_planes
+INPUTS = len(PLANES) * SIZE * SIZE
+
+# The square each square of a symmetric position is taken from, for every
+# symmetry, which are their own inverses
+_SYMMETRY_SQUARES = [np.array(squares, dtype=np.intp) for squares, _ in SYMMETRIES]
+
+
+class NetworkEvaluator(Evaluator):
+    """ Scores positions with a multilayer perceptron.  layers is a list of
+        (weights, bias) with weights of shape (inputs, outputs); the first
+        takes the INPUTS planes of a position, hidden layers use ReLU and the
+        last has a single output, squashed with tanh into a value from -1 to 1
+        for the player to move, as in the results of TrainingDataWriter, and
+        multiplied by scale.  With a single layer this is a linear model.
+        Positions are scored as their canonical form, see
+        Position.get_canonical, so symmetric positions, which share an entry
+        in the table of Search, get the same score.  Weights are kept in .npz
+        files as weights_0, bias_0, weights_1, ... """
+    batched = True
+
+    def __init__(self, layers, scale=100):
+        if not layers or len(layers[0][0]) != INPUTS or np.shape(layers[-1][0])[1] != 1:
+            raise ValueError("Layers must take {} inputs and give 1 output".format(INPUTS))
+
+        self._layers = [(np.asarray(weights, dtype=np.float32), np.asarray(bias, dtype=np.float32))
+                        for weights, bias in layers]
+        self._scale = scale
+
+    @classmethod
+    def load(cls, path, scale=100):
+        """ Returns the evaluator with the weights in an .npz file. Raises
+            ValueError if the file does not hold a network for these planes. """
+        with np.load(path) as data:
+            layers = [(data["weights_{}".format(i)], data["bias_{}".format(i)])
+                      for i in range(len(data.files) // 2)]
+
+        return cls(layers, scale)
+
+    @classmethod
+    def initialize(cls, hidden=(), seed=0, scale=100):
+        """ Returns an evaluator with random weights and hidden layers of the
+            passed sizes, a starting point for training. """
+        rng = np.random.default_rng(seed)
+        sizes = (INPUTS,) + tuple(hidden) + (1,)
+        layers = [(rng.normal(0, np.sqrt(2 / inputs), (inputs, outputs)), np.zeros(outputs))
+                  for inputs, outputs in zip(sizes, sizes[1:])]
+
+        return cls(layers, scale)
+
+    def get_layers(self):
+        """ Returns the layers in the form [(weights, bias)]. """
+        return self._layers
+
+    def save(self, path):
+        """ Writes the weights to an .npz file. """
+        arrays = {}
+        for i, (weights, bias) in enumerate(self._layers):
+            arrays["weights_{}".format(i)] = weights
+            arrays["bias_{}".format(i)] = bias
+
+        np.savez(path, **arrays)
+
+    def evaluate(self, positions):
+        """ Returns the scores of a sequence of Positions as a list. """
+        if not positions:
+            return []
+
+        planes = PositionCodec.to_planes(PositionCodec.encode(positions))
+        symmetries = np.array([position.get_canonical()[1] for position in positions])
+        for symmetry in np.unique(symmetries[symmetries != 0]):
+            chosen = symmetries == symmetry
+            planes[chosen] = self.transform_planes(planes[chosen], symmetry)
+
+        return self.evaluate_planes(planes).tolist()
+
+    @staticmethod
+    def transform_planes(planes, symmetry):
+        """ Returns an array of planes seen through one of SYMMETRIES, as
+            from PositionCodec.to_planes of the transformed positions. """
+        squares, swap = SYMMETRIES[symmetry]
+        flat = planes.reshape(len(planes), len(PLANES), SIZE * SIZE)
+        transformed = flat[:, :, _SYMMETRY_SQUARES[symmetry]]
+
+        # The gutter plane is the same for every position
+        transformed[:, 3] = flat[:, 3]
+        if swap:
+            transformed[:, [0, 1]] = transformed[:, [1, 0]]
+            transformed[:, 2] = 1 - transformed[:, 2]
+
+        return transformed.reshape(planes.shape)
+
+    def evaluate_planes(self, planes):
+        """ Returns the scores of an array of planes, as from
+            PositionCodec.to_planes, as an array of ints. """
+        values = planes.reshape(len(planes), INPUTS).astype(np.float32)
+
+        for weights, bias in self._layers[:-1]:
+            values = values @ weights
+            values += bias
+            np.maximum(values, 0, out=values)
+
+        weights, bias = self._layers[-1]
+        values = np.tanh(values @ weights + bias)[:, 0]
+
+        return np.rint(values * self._scale).astype(np.int64)
+
+
+if __name__ == "__main__":
+    pass
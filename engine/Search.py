@@ -0,0 +1,376 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Searches Gess positions for the best move with an alpha-beta
+#               search, extended by a quiescence search through captures.
+
+
+import time
+from engine.MaterialEvaluator import MaterialEvaluator
+from models.IllegalMove import IllegalMove
+from models.Position import FOOTPRINTS, OPPONENT, RING_NEIGHBORS
+
+
+# Bounds stored in the transposition table
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+class SearchStopped(Exception):
+    """ Raised inside a search when it runs out of time or is stopped. """
+    pass
+
+
+class Search:
+    """ Finds moves by iterative deepening alpha-beta search over Positions.
+        Moves are classified by the opponent stones they capture and the
+        opponent rings they break, and searched most valuable capture first.
+        At the horizon the search continues through captures only, up to
+        quiescence_depth more plies, so it does not stop in the middle of an
+        exchange. Scores are from the point of view of the player to move,
+        given by evaluator, by default a MaterialEvaluator with stone_weight
+        and ring_weight.  With a batched evaluator the children of nodes next
+        to the horizon are scored together before they are searched. """
+    WIN_SCORE = 1000000
+
+    # Scores beyond this are forced wins or losses, counted in plies
+    MATE_SCORE = WIN_SCORE - 1000
+
+    # Children scored together before the first is searched, with a batched
+    # evaluator
+    FIRST_BATCH = 8
+
+    def __init__(self, depth=2, quiescence_depth=4, stone_weight=1, ring_weight=40, solver=None,
+                 table_size=1 << 20, evaluator=None):
+        self._depth = depth
+        self._quiescence_depth = quiescence_depth
+        self._evaluator = evaluator or MaterialEvaluator(stone_weight, ring_weight)
+        self._solver = solver
+        self._table_size = table_size
+
+        # In the form {canonical hash: (depth, score, bound, move)}, with moves
+        # as seen from the canonical position, see Position.get_canonical
+        self._table = {}
+        # Scores of positions gathered by a batched evaluator, in the form
+        # {hash: score}, kept for one search
+        self._evaluations = {}
+        self._nodes = 0
+        self._stop = None
+        self._deadline = None
+
+    def get_nodes(self):
+        """ Returns the number of positions visited by the last search. """
+        return self._nodes
+
+    def clear(self):
+        """ Forgets the positions searched so far. """
+        self._table.clear()
+
+    def search(self, position, depth=None, stop=None, deadline=None, callback=None):
+        """ Searches a copy of the position one ply deeper at a time, up to depth
+            plies. Stops early once stop.is_set() or time.monotonic() passes
+            deadline. callback is called after each completed depth with
+            (depth, score, principal_variation, nodes). Returns (move, score,
+            principal_variation) for the deepest completed depth; move is in the
+            form (source, target) and is None if there are no legal moves. """
+        position = position.copy()
+        self._nodes = 0
+        self._stop = stop
+        self._deadline = deadline
+        self._evaluations.clear()
+
+        if len(self._table) > self._table_size:
+            self._table.clear()
+
+        # Proven endgames are played without searching
+        if self._solver is not None and self._solver.is_endgame(position):
+            result, plies, move = self._solver.solve(position, 3)
+            if result > 0 and move is not None:
+                return move, self.WIN_SCORE - plies, [move]
+
+        moves = position.legal_moves()
+        if not moves:
+            return None, 0, []
+        best = moves[0], 0, [moves[0]]
+
+        for current_depth in range(1, (depth or self._depth) + 1):
+            try:
+                score = self.negamax(position, current_depth, -self.WIN_SCORE - 1, self.WIN_SCORE + 1, 0)
+            except SearchStopped:
+                break
+
+            variation = self.get_principal_variation(position, current_depth)
+            if variation:
+                best = variation[0], score, variation
+            if callback is not None:
+                callback(current_depth, score, variation, self._nodes)
+
+            # A forced win or loss will not change with more depth
+            if abs(score) > self.MATE_SCORE:
+                break
+
+        return best
+
+    def negamax(self, position, depth, alpha, beta, ply):
+        """ Returns the score of the position searched depth plies deep. """
+        self._count_node()
+
+        if position.get_game_state() != 'UNFINISHED':
+            # The player who just moved broke the last ring
+            return -self.WIN_SCORE + ply
+
+        if depth <= 0:
+            return self.quiesce(position, alpha, beta, ply, self._quiescence_depth)
+
+        if self._solver is not None:
+            solved = self._solver.probe(position)
+            if solved is not None:
+                return (self.WIN_SCORE - ply - solved[1]) * solved[0]
+
+        position_hash, symmetry = position.get_canonical()
+        entry = self._table.get(position_hash)
+        table_move = None
+        if entry is not None:
+            if entry[3] is not None:
+                table_move = position.transform_move(entry[3], symmetry)
+            if entry[0] >= depth:
+                score = self.from_table(entry[1], ply)
+                if entry[2] == EXACT:
+                    return score
+                if entry[2] == LOWER and score >= beta:
+                    return score
+                if entry[2] == UPPER and score <= alpha:
+                    return score
+
+        original_alpha = alpha
+        best_score = None
+        best_move = None
+
+        moves = self.order_moves(position, position.pseudo_legal_moves(), table_move)
+        # Every child is scored when its quiescence search starts
+        batches = self.batch_moves(position, moves) if depth == 1 and self._evaluator.batched else moves
+
+        for source, target in batches:
+            try:
+                undo = position.make_move(source, target)
+            except IllegalMove:
+                continue
+
+            score = -self.negamax(position, depth - 1, -beta, -alpha, ply + 1)
+            position.unmake_move(undo)
+
+            if best_score is None or score > best_score:
+                best_score = score
+                best_move = source, target
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_move is None:
+            # No legal moves; the rules do not end the game
+            return self.evaluate(position)
+
+        if best_score <= original_alpha:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        best_move = position.transform_move(best_move, symmetry)
+        self._table[position_hash] = depth, self.to_table(best_score, ply), bound, best_move
+
+        return best_score
+
+    @staticmethod
+    def to_table(score, ply):
+        """ Returns a score found ply plies from the root as stored in the
+            table, with forced wins and losses counted from the position
+            instead of from the root. """
+        if score > Search.MATE_SCORE:
+            return score + ply
+        if score < -Search.MATE_SCORE:
+            return score - ply
+
+        return score
+
+    @staticmethod
+    def from_table(score, ply):
+        """ Returns a score stored in the table as found ply plies from the
+            root, the reverse of to_table. """
+        if score > Search.MATE_SCORE:
+            return score - ply
+        if score < -Search.MATE_SCORE:
+            return score + ply
+
+        return score
+
+    def quiesce(self, position, alpha, beta, ply, depth):
+        """ Returns the score of the position once no captures are left, or
+            after depth more captures. """
+        self._count_node()
+
+        if position.get_game_state() != 'UNFINISHED':
+            return -self.WIN_SCORE + ply
+
+        standing = self.evaluate(position)
+        if depth == 0 or standing >= beta:
+            return standing
+        if standing > alpha:
+            alpha = standing
+
+        captures = self.order_moves(position, self.get_captures(position))
+        if self._evaluator.batched:
+            captures = self.batch_moves(position, captures)
+
+        for source, target in captures:
+            try:
+                undo = position.make_move(source, target)
+            except IllegalMove:
+                continue
+
+            score = -self.quiesce(position, -beta, -alpha, ply + 1, depth - 1)
+            position.unmake_move(undo)
+
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+    def evaluate(self, position):
+        """ Scores the position for the player to move with the evaluator. """
+        if self._evaluator.batched:
+            score = self._evaluations.get(position.get_hash())
+            if score is not None:
+                return score
+
+        return self._evaluator.evaluate_position(position)
+
+    def batch_moves(self, position, moves):
+        """ Yields the moves, first scoring the positions after the next few
+            in one batch. Batches double in size while the moves are being
+            searched, as a node which was not cut off early is likely to need
+            every child, so few children are scored in vain. """
+        start, size = 0, self.FIRST_BATCH
+        while start < len(moves):
+            batch = moves[start:start + size]
+            self.prefetch(position, batch)
+            yield from batch
+            start, size = start + size, size * 2
+
+    def prefetch(self, position, moves):
+        """ Scores the positions after each of the moves in one batch, for
+            evaluate to look up. """
+        children = []
+
+        for source, target in moves:
+            try:
+                undo = position.make_move(source, target)
+            except IllegalMove:
+                continue
+            if position.get_game_state() == 'UNFINISHED' and position.get_hash() not in self._evaluations:
+                children.append(position.copy())
+            position.unmake_move(undo)
+
+        for child, score in zip(children, self._evaluator.evaluate(children)):
+            self._evaluations[child.get_hash()] = score
+
+    @staticmethod
+    def classify_move(position, source, target, opponent_rings=None):
+        """ Returns (captured, rings) for a move: the number of opponent stones
+            the piece overwrites and the number of opponent rings it breaks.
+            opponent_rings is the set of the opponent's ring centers, if known. """
+        cells = position.get_cells()
+        opponent = OPPONENT[position.get_active()]
+        if opponent_rings is None:
+            opponent_rings = set(position.get_rings(opponent))
+
+        captured = 0
+        for square in FOOTPRINTS[target]:
+            if cells[square] == opponent:
+                captured += 1
+
+        rings = 0
+        if captured:
+            for ring in RING_NEIGHBORS[target]:
+                if ring in opponent_rings:
+                    rings += 1
+
+        return captured, rings
+
+    def get_captures(self, position):
+        """ Yields the pseudo legal moves capturing at least one stone. """
+        cells = position.get_cells()
+        opponent = OPPONENT[position.get_active()]
+
+        for source, target in position.pseudo_legal_moves():
+            for square in FOOTPRINTS[target]:
+                if cells[square] == opponent:
+                    yield source, target
+                    break
+
+    def order_moves(self, position, moves, first=None):
+        """ Returns the moves with first, then ring breaks, then the largest
+            captures made with the fewest stones, then the quiet moves. """
+        cells = position.get_cells()
+        stone = position.get_active()
+        opponent_rings = set(position.get_rings(OPPONENT[stone]))
+        keyed = []
+
+        for source, target in moves:
+            # Keys start with the tier of the move, so first is ahead of any
+            # ring break
+            if (source, target) == first:
+                keyed.append(((0, 0, 0, 0), source, target))
+                continue
+
+            captured, rings = self.classify_move(position, source, target, opponent_rings)
+            if captured:
+                attackers = sum(1 for square in FOOTPRINTS[source] if cells[square] == stone)
+                keyed.append(((1, -rings, -captured, attackers), source, target))
+            else:
+                keyed.append(((2, 0, 0, 0), source, target))
+
+        keyed.sort(key=lambda item: item[0])
+
+        return [(source, target) for _, source, target in keyed]
+
+    def get_principal_variation(self, position, depth):
+        """ Returns the best line found, following moves in the table. """
+        variation = []
+        undos = []
+
+        while len(variation) < depth:
+            position_hash, symmetry = position.get_canonical()
+            entry = self._table.get(position_hash)
+            if entry is None or entry[3] is None:
+                break
+            move = position.transform_move(entry[3], symmetry)
+            if not position.is_legal_move(*move):
+                break
+            try:
+                undos.append(position.make_move(*move))
+            except IllegalMove:
+                break
+            variation.append(move)
+
+        for undo in reversed(undos):
+            position.unmake_move(undo)
+
+        return variation
+
+    def _count_node(self):
+        """ Counts a node and checks whether the search should stop. """
+        self._nodes += 1
+
+        if self._nodes & 1023 == 0:
+            if self._stop is not None and self._stop.is_set():
+                raise SearchStopped
+            if self._deadline is not None and time.monotonic() > self._deadline:
+                raise SearchStopped
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,132 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Finds the moves which break a ring, for move ordering in
+#               searches and for warning players of threats.
+
+
+from models.Layout import LAYOUT
+from models.Position import DIRECTIONS, FOOTPRINTS, OPPONENT, PLAYABLE, RING_CENTERS, SIZE
+
+
+def _build_attack_centers():
+    """ Returns, for every ring center, the centers a piece must land on for its
+        footprint to overlap the ring. """
+    attack_centers = {}
+
+    for ring in RING_CENTERS:
+        attack_centers[ring] = tuple(center for center in PLAYABLE
+                                     if abs(center // SIZE - ring // SIZE) <= 2
+                                     and abs(center % SIZE - ring % SIZE) <= 2)
+
+    return attack_centers
+
+
+def _build_approaches():
+    """ Returns, for every target and direction, the centers a piece moving in
+        that direction could start from, nearest first. """
+    approaches = [()] * (SIZE * SIZE)
+
+    for target in PLAYABLE:
+        row, col = divmod(target, SIZE)
+        target_approaches = []
+
+        for row_delta, col_delta in DIRECTIONS:
+            sources = []
+            step = 1
+            while LAYOUT.is_playable(row - row_delta * step, col - col_delta * step):
+                sources.append((row - row_delta * step) * SIZE + col - col_delta * step)
+                step += 1
+            target_approaches.append(tuple(sources))
+
+        approaches[target] = tuple(target_approaches)
+
+    return tuple(approaches)
+
+
+ATTACK_CENTERS = _build_attack_centers()
+APPROACHES = _build_approaches()
+
+
+class ThreatDetector:
+    """ Finds the legal moves which break rings without generating every move.
+        Only a piece landing on a ring can break it, because a piece cannot
+        hold the owner's stones.  So for each ring the detector walks back from
+        the centers overlapping it (ATTACK_CENTERS) along each direction
+        (APPROACHES) until the path is blocked, and checks only those moves. """
+
+    def get_ring_breaks(self, position):
+        """ Returns the legal moves of the player to move which break at least
+            one ring of the opponent, in the form [(source, target, rings)]
+            where rings are the centers of the rings broken. """
+        opponent_rings = position.get_rings(OPPONENT[position.get_active()])
+        if not opponent_rings or position.get_game_state() != 'UNFINISHED':
+            return []
+
+        # In the form {target: [rings]}
+        targets = {}
+        for ring in opponent_rings:
+            for center in ATTACK_CENTERS[ring]:
+                targets.setdefault(center, []).append(ring)
+
+        breaks = []
+        occupied = self.get_occupied(position)
+        for target, rings in targets.items():
+            for source in self.get_sources(position, target, occupied):
+                if position.keeps_a_ring(source, target):
+                    breaks.append((source, target, tuple(rings)))
+
+        return breaks
+
+    def get_winning_moves(self, position):
+        """ Returns the legal moves of the player to move which break every
+            ring of the opponent, in the form [(source, target)]. """
+        count = len(position.get_rings(OPPONENT[position.get_active()]))
+
+        return [(source, target) for source, target, rings in self.get_ring_breaks(position) if len(rings) == count]
+
+    def get_threats(self, position):
+        """ Returns the moves the opponent could make next which break at least
+            one ring of the player to move, in the form [(source, target, rings)]. """
+        undo = position.make_null_move()
+        try:
+            return self.get_ring_breaks(position)
+        finally:
+            position.unmake_move(undo)
+
+    @staticmethod
+    def get_occupied(position):
+        """ Returns the set of squares holding a stone. """
+        return {square for square, stone in enumerate(position.get_cells()) if stone != ""}
+
+    @staticmethod
+    def get_sources(position, target, occupied=None):
+        """ Yields every center the player to move can legally move a piece
+            from to reach target, not checking the player's own last ring.
+            occupied is the result of get_occupied, if already known. """
+        if occupied is None:
+            occupied = ThreatDetector.get_occupied(position)
+
+        cells = position.get_cells()
+        stone = position.get_active()
+
+        for direction, sources in enumerate(APPROACHES[target]):
+            row_delta, col_delta = DIRECTIONS[direction]
+            # Index of the stone the piece needs on the side it moves towards
+            edge = (row_delta + 1) * 3 + col_delta + 1
+            blocked = None
+
+            for distance, source in enumerate(sources, 1):
+                # A piece further away than 2 centers past a blocked center
+                # would have to pass over stones outside its own footprint
+                if blocked is not None and distance >= blocked + 3:
+                    break
+
+                if cells[FOOTPRINTS[source][edge]] == stone and position.is_legal_move(source, target):
+                    yield source
+
+                if blocked is None and not occupied.isdisjoint(FOOTPRINTS[source]):
+                    blocked = distance
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,77 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Keeps the clocks of both players and decides how long the
+#               engine may think about each move.
+
+
+import time
+
+
+class TimeControl:
+    """ A clock for each stone, starting with total seconds, with increment
+        seconds added after every move.  Only the clock started last runs.
+        allocate spreads the remaining time over moves_to_go more moves,
+        never using more than MAX_SHARE of what is left. clock returns the
+        current time in seconds. """
+    # Most of the remaining time a single move may take
+    MAX_SHARE = 0.5
+
+    # Least time given to a move, in seconds, while any time is left
+    MIN_MOVE_TIME = 0.05
+
+    def __init__(self, total=300.0, increment=0.0, moves_to_go=30, clock=time.monotonic):
+        self._increment = increment
+        self._moves_to_go = moves_to_go
+        self._clock = clock
+        self._remaining = {'b': float(total), 'w': float(total)}
+
+        # The stone whose clock is running and when it was started
+        self._running = None
+        self._started = 0.0
+
+    def get_remaining(self, stone):
+        """ Returns the seconds left on a stone's clock, which may be negative. """
+        remaining = self._remaining[stone]
+        if stone == self._running:
+            remaining -= self._clock() - self._started
+
+        return remaining
+
+    def is_flagged(self, stone):
+        """ Returns True if a stone has run out of time. """
+        return self.get_remaining(stone) <= 0
+
+    def get_running(self):
+        """ Returns the stone whose clock is running, or None. """
+        return self._running
+
+    def start(self, stone):
+        """ Stops the running clock, if any, and starts a stone's clock. """
+        self.stop()
+        self._running = stone
+        self._started = self._clock()
+
+    def stop(self):
+        """ Stops the running clock, adding the increment for the move just
+            made. Returns the seconds it ran. """
+        if self._running is None:
+            return 0.0
+
+        elapsed = self._clock() - self._started
+        self._remaining[self._running] += self._increment - elapsed
+        self._running = None
+
+        return elapsed
+
+    def allocate(self, stone):
+        """ Returns the seconds a stone may think about its next move. """
+        remaining = self.get_remaining(stone)
+        if remaining <= 0:
+            return 0.0
+
+        budget = remaining / self._moves_to_go + self._increment
+        return max(min(budget, remaining * self.MAX_SHARE), min(self.MIN_MOVE_TIME, remaining))
+
+
+if __name__ == "__main__":
+    pass
@@ -4,6 +4,7 @@
 #               testing and executing moves.
 
 
+from models.Layout import LAYOUT
 from PySide2.QtCore import QObject, Signal
 
 
@@ -15,42 +16,48 @@ class Board(QObject):
 
     def __init__(self):
         super(Board, self).__init__()
-        # 20x20 matrix which includes gutters for 18x18 playable space
-        self._squares = [['' for _ in range(20)] for _ in range(20)]
+        # Square matrix which includes the gutters around the playable space;
+        # 20x20 with an 18x18 playable space in the standard layout
+        self._squares = LAYOUT.get_initial_squares()
         self._selected = None
 
-        # TODO: Move this to and load from a data file
-        # There are 3 initial layouts for rows
-        row_type_1 = [2, 4, 6, 7, 8, 9, 10, 11, 12, 13, 15, 17]
-        row_type_2 = [1, 2, 3, 5, 7, 8, 9, 10, 12, 14, 16, 17, 18]
-        row_type_3 = [2, 5, 8, 11, 14, 17]
-
-        # TODO: Move this to and load from a data file
-        # The layouts for rows by color
-        white_rows = {1: row_type_1, 2: row_type_2, 3: row_type_1, 6: row_type_3}
-        black_rows = {13: row_type_3, 16: row_type_1, 17: row_type_2, 18: row_type_1}
-
-        # TODO: Move this to and load from a data file
-        # Initial placement of stones on the board
-        for row_num, row_type in black_rows.items():
-            for col_num in row_type:
-                self._squares[row_num][col_num] = 'b'
-        for row_num, row_type in white_rows.items():
-            for col_num in row_type:
-                self._squares[row_num][col_num] = 'w'
+        # Stones of each color on the board, kept up to date as squares change
+        self._stones = {'b': 0, 'w': 0}
+        self.count_stones()
+        self._initial_stones = dict(self._stones)
 
     def get_squares(self):
         """ Has no parameters.  Returns the squares on the board in the
-            form of a 20x20 matrix. """
+            form of a matrix, 20x20 in the standard layout. """
         return self._squares
 
+    def get_stones(self, stone):
+        """ Has 1 parameter, a stone, 'b' or 'w'. Returns the number of stones
+            of that color on the board without scanning the squares. """
+        return self._stones[stone]
+
+    def get_stones_lost(self, stone):
+        """ Has 1 parameter, a stone, 'b' or 'w'. Returns the number of stones
+            of that color removed since the start of the game. """
+        return self._initial_stones[stone] - self._stones[stone]
+
+    def count_stones(self):
+        """ Has no parameters. Recounts the stones of each color, for when the
+            squares are replaced without remove_piece and place_piece. Returns
+            nothing. """
+        for stone in self._stones:
+            self._stones[stone] = sum(row.count(stone) for row in self._squares)
+
     def get_selected(self):
         """ Returns the currently selected piece. """
         return self._selected
 
-    def set_selected(self, piece):
-        """ Sets the currently selected piece. """
+    def set_selected(self, piece, notify=True):
+        """ Sets the currently selected piece. Emits piece_selected or
+            piece_deselected unless notify is False. """
         self._selected = piece
+        if not notify:
+            return
         if self._selected is not None:
             # noinspection PyUnresolvedReferences
             self.piece_selected.emit(piece)
@@ -69,7 +76,10 @@ class Board(QObject):
             the stones from the board at the locations indicated by the
             piece. Returns nothing. """
         for location in piece.keys():
-            self._squares[location[0]][location[1]] = ""
+            stone = self._squares[location[0]][location[1]]
+            if stone != "":
+                self._stones[stone] -= 1
+                self._squares[location[0]][location[1]] = ""
 
     def place_piece(self, origin_piece, target_piece=None):
         """ Has 2 parameters, pieces, in the form {(row, col): stone}.
@@ -86,19 +96,25 @@ class Board(QObject):
 
         # Place the source stone at the target location
         for i in range(len(origin_stones)):
-            self._squares[target_squares[i][0]][target_squares[i][1]] = origin_stones[i]
+            row, col = target_squares[i]
+            if self._squares[row][col] != "":
+                self._stones[self._squares[row][col]] -= 1
+            if origin_stones[i] != "":
+                self._stones[origin_stones[i]] += 1
+            self._squares[row][col] = origin_stones[i]
 
     def clear_gutter(self):
         """ Has no parameters. Clears the gutters of stones. Returns nothing. """
         # The board is a square so any length is ok for rows and columns
         length = len(self._squares) - 1
 
-        # Clear the first and last row and column
-        for i in range(length):
-            self._squares[0][i] = ""
-            self._squares[i][0] = ""
-            self._squares[length][i] = ""
-            self._squares[i][length] = ""
+        # Clear the first and last rows and columns, as wide as the gutter
+        for width in range(LAYOUT.get_gutter()):
+            for i in range(length):
+                for row, col in ((width, i), (i, width), (length - width, i), (i, length - width)):
+                    if self._squares[row][col] != "":
+                        self._stones[self._squares[row][col]] -= 1
+                        self._squares[row][col] = ""
 
     def check_for_rings(self):
         """ Has no parameters. Checks the entire board for any players rings.
@@ -106,9 +122,12 @@ class Board(QObject):
             corresponding to the center of the ring. """
         rings = {}
         # Returns rings in the form {(center_row, center_col): color}
-        # Only goes up to 18 to prevent list out of index
-        for row_num in range(1, 18):
-            for col_num in range(1, 18):
+        # Starts at the first playable corner; stops before the far gutter to
+        # prevent list out of index (corners 1 through 17 in the standard layout)
+        first = LAYOUT.get_gutter()
+        last = len(self._squares) - 1 - first
+        for row_num in range(first, last):
+            for col_num in range(first, last):
                 stone = self._squares[row_num][col_num]
                 if stone != "":
                     # Starts at the southwest corner and checks a "piece" for a ring
@@ -13,8 +13,10 @@ class Game(QObject):
         maintains players and updates them.  Allows for making a move and resigning.
         Will have a Board object for communicating player input to the Board.  Will have
         2 Player objects for updating and checking their list of rings. Has no parameters. """
-    # Passes along an origin and destination piece
-    board_updated = Signal(dict, dict)
+    # Passes along an origin and destination piece, and everything the move
+    # changed in the form {"squares": {(row, col): stone}, "status": bool,
+    # "deselected": bool}, so views refresh once per move
+    board_updated = Signal(dict, dict, dict)
     status_updated = Signal()
 
     def __init__(self, players, board):
@@ -26,6 +28,9 @@ class Game(QObject):
         self._players = players
         self._active = 0
 
+        # Changes collected while a move is made, see board_updated
+        self._changes = None
+
     def get_board(self):
         """ Returns the 20x20 board. """
         return self._board
@@ -37,21 +42,35 @@ class Game(QObject):
     def set_status_message(self, msg):
         """ Sets the status message with a new string. """
         self._status_message = msg
-        # noinspection PyUnresolvedReferences
-        self.status_updated.emit()
+        self.update_status()
+
+    def update_status(self):
+        """ Emits status_updated, or notes the change for board_updated while
+            a move is made. """
+        if self._changes is not None:
+            self._changes["status"] = True
+        else:
+            # noinspection PyUnresolvedReferences
+            self.status_updated.emit()
 
     def get_game_state(self):
         """ Has no parameters. Returns the state of the game. For tracking if the
             game has been won. """
         return self._game_state
 
+    def get_players(self):
+        """ Has no parameters. Returns both players, black first. """
+        return self._players
+
     def get_active_player(self):
         """ Has no parameters. Returns the active player. For tracking whose turn
             it is. """
         return self._players[self._active]
 
     def make_move(self, source, target):
-        """ Moves the piece and updates the state of the game. """
+        """ Moves the piece and updates the state of the game. Returns False
+            if the move was undone for breaking the player's last ring,
+            otherwise True. """
         self._board.move_piece(source, target)
 
         # Remove gutter stones
@@ -66,15 +85,56 @@ class Game(QObject):
             self.status_updated.emit()
             for piece in (source, target):
                 self._board.place_piece(piece)
-            return
+            return False
 
-        self._board.set_selected(None)
-        self.check_win_condition()
-        self.switch_turn()
+        # Collect the changes to the board, selection and status and signal
+        # them together
+        self._changes = {"squares": self.get_changed_squares(source, target), "status": False, "deselected": True}
+        try:
+            self._board.set_selected(None, False)
+            self.check_win_condition()
+            self.switch_turn()
+        finally:
+            changes, self._changes = self._changes, None
 
         # Signals the board is updated
         # noinspection PyUnresolvedReferences
-        self.board_updated.emit(source, target)
+        self.board_updated.emit(source, target, changes)
+
+        return True
+
+    def get_changed_squares(self, source, target):
+        """ Has 2 parameters, the pieces of a move made, holding the stones
+            from before the move. Returns the squares the move changed in the
+            form {(row, col): stone}. Only squares under the two pieces can
+            change, the gutter being empty before every move. """
+        squares = self._board.get_squares()
+        changed = {}
+
+        for piece in (source, target):
+            for (row, col), stone in piece.items():
+                if squares[row][col] != stone:
+                    changed[row, col] = squares[row][col]
+
+        return changed
+
+    def load_position(self, position):
+        """ Has 1 parameter, a Position. Replaces the stones on the board, the
+            players' rings, the active player and the game state with those of
+            the position. Emits no signals. Returns nothing. """
+        squares = self._board.get_squares()
+        size = len(squares)
+        cells = position.get_cells()
+
+        for row in range(size):
+            squares[row][:] = cells[row * size:(row + 1) * size]
+        self._board.count_stones()
+
+        for player in self._players:
+            player.set_rings([divmod(center, size) for center in position.get_rings(player.get_stone())])
+
+        self._active = 0 if self._players[0].get_stone() == position.get_active() else 1
+        self._game_state = position.get_game_state()
 
     def resign_game(self):
         """ Has no parameters. Allows the active player to quit the game with a
@@ -104,8 +164,7 @@ class Game(QObject):
             turns. Returns nothing. """
         self._active ^= 1
 
-        # noinspection PyUnresolvedReferences
-        self.status_updated.emit()
+        self.update_status()
 
     def check_win_condition(self):
         """ Has no parameters. Checks if a player is without rings and updates the status of the game. """
@@ -118,5 +177,4 @@ class Game(QObject):
 
                 # Update the status message
                 self._status_message = self._game_state.title().replace("_", " ")
-                # noinspection PyUnresolvedReferences
-                self.status_updated.emit()
+                self.update_status()
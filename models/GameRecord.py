@@ -0,0 +1,52 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  A recorded game of Gess, its moves and its result.  Reads and
+#               writes archives holding one game per line.
+
+
+class GameRecord:
+    """ Represents a recorded game.  Moves are kept in notation in the form
+        [('f6', 'f9')] and the result is a game state such as 'BLACK_WON'.
+        An archive line holds the result, a tab, then the moves in the form
+        'f6-f9' separated by spaces. """
+    def __init__(self, moves=None, result='UNFINISHED'):
+        self._moves = moves if moves is not None else []
+        self._result = result
+
+    def get_moves(self):
+        """ Returns the list of moves in the form [(origin, destination)]. """
+        return self._moves
+
+    def get_result(self):
+        """ Returns the final state of the game. """
+        return self._result
+
+    def to_line(self):
+        """ Returns the game as a line of an archive, without a newline. """
+        return self._result + "\t" + " ".join(origin + "-" + destination for origin, destination in self._moves)
+
+    @staticmethod
+    def from_line(line):
+        """ Creates a GameRecord from a line of an archive. """
+        result, _, moves = line.strip().partition("\t")
+        return GameRecord([tuple(move.split("-")) for move in moves.split()], result)
+
+    @staticmethod
+    def read_archive(path):
+        """ Yields the games of an archive one at a time. Blank lines and
+            lines starting with '#' are skipped. """
+        with open(path) as archive:
+            for line in archive:
+                if line.strip() and not line.startswith("#"):
+                    yield GameRecord.from_line(line)
+
+    @staticmethod
+    def write_archive(path, records):
+        """ Writes the games to an archive, replacing the file. """
+        with open(path, "w") as archive:
+            for record in records:
+                archive.write(record.to_line() + "\n")
+
+
+if __name__ == "__main__":
+    pass
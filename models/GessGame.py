@@ -0,0 +1,115 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  A game of Gess without a user interface, played with moves in
+#               notation, for bots and scripted clients.
+
+
+from controllers.BoardController import BoardController
+from models.Board import Board
+from models.Game import Game
+from models.IllegalMove import IllegalMove
+from models.Notation import CENTERS
+from models.Player import Player
+from models.Position import Position, SIZE
+
+
+class GessGame:
+    """ Represents a game of Gess played with moves in notation such as
+        make_move('f6', 'f9'). Single moves go through the BoardController and
+        Game like clicks on the board; apply_moves plays many moves at once on a
+        Position and updates the Game when done. Has no parameters. """
+    def __init__(self):
+        self._board = Board()
+        self._players = (Player('b'), Player('w'))
+        self._game = Game(self._players, self._board)
+        self._controller = BoardController(self._game)
+
+    def get_game(self):
+        """ Returns the Game being played. """
+        return self._game
+
+    def get_board(self):
+        """ Returns the Board of the game. """
+        return self._board
+
+    def get_game_state(self):
+        """ Returns the state of the game. """
+        return self._game.get_game_state()
+
+    def get_active_player(self):
+        """ Returns the player whose turn it is. """
+        return self._game.get_active_player()
+
+    def get_status_message(self):
+        """ Returns the message explaining the last rejected move, if any. """
+        return self._game.get_status_message()
+
+    def resign_game(self):
+        """ The active player resigns. """
+        self._game.resign_game()
+
+    def update_rings(self):
+        """ Updates the players' rings from the board. Raises IllegalMove if the
+            active player has no ring left. """
+        self._game.update_rings()
+
+    def switch_turn(self):
+        """ Makes the other player active. """
+        self._game.switch_turn()
+
+    def check_win_condition(self):
+        """ Updates the game state if a player has no rings. """
+        self._game.check_win_condition()
+
+    def make_move(self, origin, destination):
+        """ Has 2 parameters, the centers of the piece before and after the move
+            in notation such as 'f6'. Makes the move if it is legal. Returns True
+            if the move was made, otherwise False. """
+        source = CENTERS.get(origin)
+        target = CENTERS.get(destination)
+        if source is None or target is None or self._game.get_game_state() != 'UNFINISHED':
+            return False
+
+        controller = self._controller
+        try:
+            source_piece = controller.get_piece(divmod(source, SIZE))
+            target_piece = controller.get_piece(divmod(target, SIZE))
+        except IndexError:
+            return False
+
+        if controller.is_piece_empty(source_piece) or source_piece == target_piece:
+            return False
+
+        if not controller.is_legal_move(source_piece, target_piece):
+            return False
+
+        return self._game.make_move(source_piece, target_piece)
+
+    def apply_moves(self, moves):
+        """ Has 1 parameter, a list of moves in the form [('f6', 'f9')]. Makes
+            the moves in order, stopping at the first one which is not legal.
+            Returns the index of that move, or None if every move was made.
+            No signals are emitted for the moves. """
+        position = Position.from_game(self._game)
+        failed = None
+
+        for index, (origin, destination) in enumerate(moves):
+            source = CENTERS.get(origin)
+            target = CENTERS.get(destination)
+            if source is None or target is None or not position.is_legal_move(source, target):
+                failed = index
+                break
+
+            try:
+                position.make_move(source, target)
+            except IllegalMove:
+                failed = index
+                break
+
+        self._game.load_position(position)
+
+        return failed
+
+
+if __name__ == "__main__":
+    pass
@@ -3,38 +3,44 @@
 # Description:  Maintains a list of moves throughout the game.
 
 
+from models.Move import Move
 from PySide2.QtCore import QObject, Signal
 
 
 class History(QObject):
     move_added = Signal(dict, dict)
+    move_removed = Signal()
 
     def __init__(self, game):
         super(History, self).__init__()
 
         self._game = game
 
-        # Move history is a stack in the form [(origin, destination)]
-        # Origin and destination are in the form {(row, col): stone}
+        # Move history is a stack of Move records; the pieces passed with
+        # board_updated are not kept, as long games would hold many of them
         self._history = []
 
         # Connect to game's update signal
         self._game.board_updated.connect(self.add_move)
 
     def get_history(self):
-        """ Returns the history stack. """
+        """ Returns the history stack in the form [Move]. """
         return self._history
 
     def add_move(self, origin, destination):
         """ Adds a move to the list of historical moves. """
-        self._history.append((origin, destination))
+        self._history.append(Move.from_pieces(origin, destination))
 
         # noinspection PyUnresolvedReferences
         self.move_added.emit(origin, destination)
 
     def remove_move(self):
+        """ Removes the last move from the history. """
         del self._history[-1]
 
+        # noinspection PyUnresolvedReferences
+        self.move_removed.emit()
+
     @staticmethod
     def center_from_piece(piece):
         """ Returns coordinates for the center square of a piece. """
@@ -0,0 +1,84 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Presents the History as a list of numbered rows, one per pair
+#               of moves, for display in a list view.
+
+
+from models.Notation import Notation
+from PySide2.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class HistoryListModel(QAbstractListModel):
+    """ A list model over a History. Row n holds move n + 1 of black and the
+        reply of white. Rows are formatted when the view asks for them, so
+        only the visible rows are built, and each new move inserts or updates
+        a single row. """
+    def __init__(self, history):
+        super(HistoryListModel, self).__init__()
+
+        self._history = history
+
+        # The rows the attached views know of; updated between the begin and
+        # end calls so views see the change at the right time
+        self._rows = (len(history.get_history()) + 1) // 2
+
+        self._history.move_added.connect(self.add_move)
+        self._history.move_removed.connect(self.remove_move)
+
+    def rowCount(self, parent=QModelIndex()):
+        """ Returns the number of rows, one per pair of moves. """
+        if parent.isValid():
+            return 0
+
+        return self._rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ Returns the text of a row in the form "1.  l6 - l9       l15 - l12". """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+
+        moves = self._history.get_history()[index.row() * 2:index.row() * 2 + 2]
+        text = "{}.  {}".format(index.row() + 1, self.to_notation(moves[0]))
+        if len(moves) > 1:
+            text = text.ljust(18) + self.to_notation(moves[1])
+
+        return text
+
+    @staticmethod
+    def to_notation(move):
+        """ Returns a Move in the form "l6 - l9". """
+        return Notation.to_notation(move.get_source()) + " - " + Notation.to_notation(move.get_target())
+
+    def add_move(self):
+        """ Responds to a move added to the History. The move has already been
+            appended, so it either starts a new row or completes the last one. """
+        count = len(self._history.get_history())
+        row = (count - 1) // 2
+
+        if count % 2 != 0:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows += 1
+            self.endInsertRows()
+        else:
+            index = self.index(row)
+            # noinspection PyUnresolvedReferences
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def remove_move(self):
+        """ Responds to the last move being removed from the History. """
+        count = len(self._history.get_history())
+        row = count // 2
+
+        if count % 2 == 0:
+            # The removed move was alone on the last row
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._rows -= 1
+            self.endRemoveRows()
+        else:
+            index = self.index(row)
+            # noinspection PyUnresolvedReferences
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,195 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Loads the size, gutter and starting stones of the board from a
+#               layout file and compiles the tables the rules are checked with.
+
+
+import json
+import os
+
+
+# Directory of the layout files shipped with the game
+LAYOUTS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "layouts")
+
+# The 8 directions as (row_delta, col_delta); the piece must have a stone at the
+# peripheral square in the direction of the move
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (1, -1), (-1, 1))
+
+
+class Layout:
+    """ Represents a board layout: a square board of size rows and columns,
+        the width of the gutter around the playable area, and the starting
+        stones. Layout files are JSON in the form
+        {"size": 20, "gutter": 1, "row_types": {name: [col]},
+         "stones": {stone: {row: name or [col]}}}.
+        Squares in the tables are flat indices, row * size + col. """
+    def __init__(self, size, gutter, stones):
+        if size > 26:
+            # Columns are lettered 'a' to 'z' in notation
+            raise ValueError("Boards are at most 26 squares wide")
+
+        self._size = size
+        self._gutter = gutter
+
+        # Centers a piece may be selected at or moved to
+        low, high = gutter, size - 1 - gutter
+        self._playable = tuple(row * size + col for row in range(low, high + 1) for col in range(low, high + 1))
+
+        # Centers a ring may be found at; Board.check_for_rings scans from the
+        # first playable corner
+        self._ring_centers = tuple(row * size + col for row in range(low + 1, high + 1)
+                                   for col in range(low + 1, high + 1))
+
+        # Gutter squares cleared after every move. Board.clear_gutter never
+        # reaches the last square of the board, so it is left out here as well.
+        self._gutter_squares = frozenset(row * size + col for row in range(size) for col in range(size)
+                                         if not (low <= row <= high and low <= col <= high)) - {size * size - 1}
+
+        self._initial_squares = tuple(tuple(stones.get((row, col), "") for col in range(size)) for row in range(size))
+
+        self._footprints = self._build_footprints()
+        self._rays = self._build_rays()
+        self._ring_neighbors = self._build_ring_neighbors()
+        self._initial_rings = self._find_rings()
+
+    @classmethod
+    def load(cls, path):
+        """ Returns the layout in a layout file. """
+        with open(path) as layout_file:
+            data = json.load(layout_file)
+
+        row_types = data.get("row_types", {})
+        stones = {}
+        for stone, rows in data["stones"].items():
+            for row, cols in rows.items():
+                for col in row_types[cols] if isinstance(cols, str) else cols:
+                    stones[int(row), col] = stone
+
+        return cls(data["size"], data.get("gutter", 1), stones)
+
+    def get_size(self):
+        """ Returns the number of rows and columns of the board. """
+        return self._size
+
+    def get_gutter(self):
+        """ Returns the width of the gutter. """
+        return self._gutter
+
+    def get_playable(self):
+        """ Returns the centers a piece may be at. """
+        return self._playable
+
+    def is_playable(self, row, col):
+        """ Returns True if a piece may be centered at (row, col). """
+        return self._gutter <= row < self._size - self._gutter and self._gutter <= col < self._size - self._gutter
+
+    def get_ring_centers(self):
+        """ Returns the centers a ring may be at. """
+        return self._ring_centers
+
+    def get_gutter_squares(self):
+        """ Returns the set of squares cleared after every move. """
+        return self._gutter_squares
+
+    def get_footprints(self):
+        """ Returns the 9 squares of the piece at every center, in the order of
+            BoardController.get_piece.  Gutter centers have no footprint. """
+        return self._footprints
+
+    def get_rays(self):
+        """ Returns, for every center and direction, the reachable targets in
+            order as (target, squares_to_check).  squares_to_check are the
+            squares entered when the piece passes through that target on its
+            way further out. """
+        return self._rays
+
+    def get_ring_neighbors(self):
+        """ Returns, for every center, the ring centers whose ring overlaps the
+            piece at that center. """
+        return self._ring_neighbors
+
+    def get_initial_squares(self):
+        """ Returns the starting stones as a new size x size matrix. """
+        return [list(row) for row in self._initial_squares]
+
+    def get_initial_rings(self, stone):
+        """ Returns the centers of the starting rings of a stone in the form
+            [(row, col)]. """
+        return [divmod(center, self._size) for center, ring_stone in self._initial_rings if ring_stone == stone]
+
+    def _build_footprints(self):
+        """ Returns the footprint of every playable center. """
+        size = self._size
+        footprints = [()] * (size * size)
+
+        for center in self._playable:
+            row, col = divmod(center, size)
+            footprints[center] = tuple((row + i) * size + col + j for i in (-1, 0, 1) for j in (-1, 0, 1))
+
+        return tuple(footprints)
+
+    def _build_rays(self):
+        """ Returns the rays of every playable center. """
+        size = self._size
+        rays = [()] * (size * size)
+
+        for center in self._playable:
+            row, col = divmod(center, size)
+            origin = set(self._footprints[center])
+            center_rays = []
+
+            for row_delta, col_delta in DIRECTIONS:
+                ray = []
+                step = 1
+                while self.is_playable(row + row_delta * step, col + col_delta * step):
+                    target = (row + row_delta * step) * size + col + col_delta * step
+                    entered = tuple(square for square in self._footprints[target] if square not in origin)
+                    ray.append((target, entered))
+                    step += 1
+                center_rays.append(tuple(ray))
+
+            rays[center] = tuple(center_rays)
+
+        return tuple(rays)
+
+    def _build_ring_neighbors(self):
+        """ Returns the ring centers near every playable center. """
+        size = self._size
+        neighbors = [()] * (size * size)
+
+        for center in self._playable:
+            row, col = divmod(center, size)
+            neighbors[center] = tuple(ring for ring in self._ring_centers
+                                      if abs(ring // size - row) <= 2 and abs(ring % size - col) <= 2)
+
+        return tuple(neighbors)
+
+    def _find_rings(self):
+        """ Returns the rings of the starting stones in the form [(center, stone)]. """
+        rings = []
+
+        for center in self._ring_centers:
+            row, col = divmod(center, self._size)
+            stone = self._initial_squares[row - 1][col - 1]
+            ring = [self._initial_squares[row + i][col + j] for i in (-1, 0, 1) for j in (-1, 0, 1)]
+            if stone != "" and ring == [stone] * 4 + [""] + [stone] * 4:
+                rings.append((center, stone))
+
+        return rings
+
+
+def _load_layout():
+    """ Returns the layout named by GESS_LAYOUT, either a layout file or the
+        name of one in assets/layouts, or the standard layout. """
+    name = os.environ.get("GESS_LAYOUT", "") or "standard"
+    path = name if os.path.exists(name) else os.path.join(LAYOUTS, name + ".json")
+
+    return Layout.load(path)
+
+
+# The layout played; every table of the rules is compiled from it once
+LAYOUT = _load_layout()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,74 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  A compact record of a move made in the game, for keeping long
+#               histories of moves in memory.
+
+
+# Coordinates of the 9 squares of the piece at every center, in the order of
+# BoardController.get_piece.  Built once per center and shared by every piece.
+_footprints = {}
+
+# Every distinct tuple of 9 stones recorded so far, shared by every move
+_stones = {}
+
+
+class Move:
+    """ Represents a move as the centers of the origin and destination pieces
+        in the form (row, col), the stones of the origin piece and the stones
+        the destination piece held before the move.  The centers and stones are
+        shared between moves, so each move costs one small fixed-size object
+        instead of the two dictionaries passed by Game.board_updated. """
+    __slots__ = ("_source", "_target", "_stones", "_captured")
+
+    def __init__(self, source, target, stones, captured):
+        self._source = self.get_footprint(source)[4]
+        self._target = self.get_footprint(target)[4]
+        stones = tuple(stones)
+        captured = tuple(captured)
+        self._stones = _stones.setdefault(stones, stones)
+        self._captured = _stones.setdefault(captured, captured)
+
+    @classmethod
+    def from_pieces(cls, origin, destination):
+        """ Returns the move between two pieces in the form {(row, col): stone}. """
+        return cls(list(origin.keys())[4], list(destination.keys())[4], origin.values(), destination.values())
+
+    @staticmethod
+    def get_footprint(center):
+        """ Returns the shared tuple of the 9 squares of the piece at center. """
+        footprint = _footprints.get(center)
+
+        if footprint is None:
+            footprint = tuple((center[0] + row, center[1] + col) for row in (-1, 0, 1) for col in (-1, 0, 1))
+            _footprints[footprint[4]] = footprint
+
+        return footprint
+
+    def get_source(self):
+        """ Returns the center of the origin piece in the form (row, col). """
+        return self._source
+
+    def get_target(self):
+        """ Returns the center of the destination piece in the form (row, col). """
+        return self._target
+
+    def get_stones(self):
+        """ Returns the 9 stones of the origin piece. """
+        return self._stones
+
+    def get_captured(self):
+        """ Returns the 9 stones under the destination piece before the move. """
+        return self._captured
+
+    def get_origin(self):
+        """ Returns the origin piece in the form {(row, col): stone}. """
+        return dict(zip(self.get_footprint(self._source), self._stones))
+
+    def get_destination(self):
+        """ Returns the destination piece as it was before the move, in the
+            form {(row, col): stone}. """
+        return dict(zip(self.get_footprint(self._target), self._captured))
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,51 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Converts between matrix indices and the letter, number notation
+#               shown on the board and in the history sidebar.
+
+
+from models.Layout import LAYOUT
+
+
+# Every square of the board by notation, so many moves can be parsed with lookups
+CENTERS = {chr(col + 97) + str(LAYOUT.get_size() - row): row * LAYOUT.get_size() + col
+           for row in range(LAYOUT.get_size()) for col in range(LAYOUT.get_size())}
+
+
+class Notation:
+    """ Utility for converting board coordinates. Columns are lettered from 'a'
+        and rows are numbered from the bottom of the displayed board, so the
+        matrix index (14, 5) is written 'f6'. """
+    board_size = LAYOUT.get_size()
+
+    @staticmethod
+    def to_indices(coords):
+        """ Converts a letter, number combination such as 'f6' to matrix
+            indices in the form (row, col). """
+        return Notation.board_size - int(coords[1:]), ord(coords[0]) - 97
+
+    @staticmethod
+    def to_notation(indices):
+        """ Converts matrix indices in the form (row, col) to a letter,
+            number combination such as 'f6'. """
+        return chr(indices[1] + 97) + str(Notation.board_size - indices[0])
+
+    @staticmethod
+    def to_center(coords):
+        """ Converts a letter, number combination to the flat index of the
+            square, row * board_size + col, as used by Position. Raises
+            ValueError if it names no square of the board. """
+        center = CENTERS.get(coords)
+        if center is None:
+            raise ValueError("Not a square: " + repr(coords))
+
+        return center
+
+    @staticmethod
+    def from_center(center):
+        """ Converts the flat index of a square to a letter, number combination. """
+        return Notation.to_notation(divmod(center, Notation.board_size))
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,92 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Looks up moves in an opening book file written by the
+#               OpeningBookBuilder.
+
+
+import mmap
+import struct
+from collections import namedtuple
+from models.Position import Position
+
+
+# A move played from a book position, with the games it was played in and the
+# wins and losses of the player making it
+BookMove = namedtuple("BookMove", ["source", "target", "games", "wins", "losses"])
+
+
+class OpeningBook:
+    """ Represents an opening book on disk.  Entries are sorted by position hash
+        and memory mapped, so opening a book is instant and each lookup is a
+        binary search. Positions are kept by their canonical hash, so mirror
+        images share their moves. Has one parameter, path, the location of the
+        book. """
+    # Books before canonical hashes were written as b"GESSBOOK"
+    MAGIC = b"GESSBK02"
+    # Magic and number of entries
+    HEADER = struct.Struct("<8sI")
+    # Position hash, source and target centers, games, wins and losses
+    ENTRY = struct.Struct("<QHHIII")
+
+    def __init__(self, path):
+        with open(path, "rb") as book:
+            self._data = mmap.mmap(book.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._size = self.HEADER.unpack_from(self._data)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError("Not an opening book: " + str(path))
+
+    def __len__(self):
+        return self._size
+
+    def close(self):
+        """ Releases the book file. """
+        self._data.close()
+
+    def get_moves(self, position):
+        """ Takes a Position, or its canonical hash, and returns the book moves
+            played from it as a list of BookMove, the most played first. Moves
+            of a hash are those of the canonical position. """
+        if isinstance(position, int):
+            position_hash, symmetry = position, 0
+        else:
+            position_hash, symmetry = position.get_canonical()
+        entry = self._find(position_hash)
+        moves = []
+
+        while entry < self._size:
+            fields = self.ENTRY.unpack_from(self._data, self.HEADER.size + entry * self.ENTRY.size)
+            if fields[0] != position_hash:
+                break
+            source, target = Position.transform_move(fields[1:3], symmetry)
+            moves.append(BookMove(source, target, *fields[3:]))
+            entry += 1
+
+        return moves
+
+    def get_move(self, position):
+        """ Returns the most played move from the position in the form
+            (source, target), or None if the position is not in the book. """
+        moves = self.get_moves(position)
+        if not moves:
+            return None
+
+        return moves[0].source, moves[0].target
+
+    def _find(self, position_hash):
+        """ Returns the index of the first entry with a hash not less than position_hash. """
+        low, high = 0, self._size
+
+        while low < high:
+            middle = (low + high) // 2
+            if struct.unpack_from("<Q", self._data, self.HEADER.size + middle * self.ENTRY.size)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,99 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Builds an opening book from archived games in a single pass.
+
+
+import argparse
+from models.GameRecord import GameRecord
+from models.IllegalMove import IllegalMove
+from models.Notation import Notation
+from models.OpeningBook import OpeningBook
+from models.Position import Position
+
+
+class OpeningBookBuilder:
+    """ Replays archived games and counts, for every position reached within the
+        first max_plies moves, how often each move was played and how the game
+        ended for the player making it. Has one optional parameter, max_plies. """
+    def __init__(self, max_plies=20):
+        self._max_plies = max_plies
+        self._games = 0
+
+        # In the form {(canonical hash, source, target): [games, wins, losses]},
+        # with moves as seen from the canonical position
+        self._entries = {}
+
+    def get_games(self):
+        """ Returns the number of games added. """
+        return self._games
+
+    def add_archive(self, path):
+        """ Adds every game of an archive, reading one game at a time. """
+        for record in GameRecord.read_archive(path):
+            self.add_game(record)
+
+    def add_game(self, record):
+        """ Replays a GameRecord and counts its opening moves. Replaying stops at
+            the first illegal or unreadable move, so a damaged record only counts
+            up to it. """
+        position = Position()
+        winner = {"BLACK_WON": 'b', "WHITE_WON": 'w'}.get(record.get_result())
+        self._games += 1
+
+        for ply, (origin, destination) in enumerate(record.get_moves()):
+            if ply == self._max_plies:
+                break
+
+            try:
+                source = Notation.to_center(origin)
+                target = Notation.to_center(destination)
+            except ValueError:
+                break
+            if not position.is_legal_move(source, target):
+                break
+
+            position_hash, symmetry = position.get_canonical()
+            key = (position_hash,) + position.transform_move((source, target), symmetry)
+            mover = position.get_active()
+            try:
+                position.make_move(source, target)
+            except IllegalMove:
+                break
+
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [0, 0, 0]
+            entry[0] += 1
+            if winner is not None:
+                entry[1 if winner == mover else 2] += 1
+
+    def save(self, path, min_games=1):
+        """ Writes the book, leaving out moves played in fewer than min_games games. """
+        entries = sorted((key[0], -counts[0], key[1], key[2], counts)
+                         for key, counts in self._entries.items() if counts[0] >= min_games)
+
+        with open(path, "wb") as book:
+            book.write(OpeningBook.HEADER.pack(OpeningBook.MAGIC, len(entries)))
+            for position_hash, _, source, target, counts in entries:
+                book.write(OpeningBook.ENTRY.pack(position_hash, source, target, *counts))
+
+
+def main():
+    """ Builds an opening book from the archives given on the command line. """
+    parser = argparse.ArgumentParser(description="Builds a Gess opening book from archived games.")
+    parser.add_argument("archives", nargs="+", help="archives with one game per line")
+    parser.add_argument("-o", "--output", default="book.bin", help="the book file to write")
+    parser.add_argument("--plies", type=int, default=20, help="the number of opening moves to count")
+    parser.add_argument("--min-games", type=int, default=1, help="leave out rarer moves")
+    args = parser.parse_args()
+
+    builder = OpeningBookBuilder(args.plies)
+    for path in args.archives:
+        builder.add_archive(path)
+    builder.save(args.output, args.min_games)
+
+    print("Added", builder.get_games(), "games to", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,27 @@
 # Description:  Creates a player for the Gess Game which maintains its color, stones, and rings.
 
 
+from models.Layout import LAYOUT
+
+
 class Player:
     """ Represents a player of the Gess game. Has no knowledge of any other classes.
         Maintains, updates, and provides information on its own list of rings, its
         stone marker, and its own color. Has one parameters, a stone, in the form
         of a character, either 'w' or 'b' """
+    __slots__ = ("_stone", "_color", "_rings")
 
     def __init__(self, stone):
         self._stone = stone
         self._color = ""
-        self._rings = []
-
-        # Sets the initial rings and color for each player
+        # Sets the initial rings from the layout and the color for each player
+        self._rings = LAYOUT.get_initial_rings(stone)
         if stone == "b":
-            self._rings.append((17, 11))
             self._color = "BLACK"
         elif stone == "w":
-            self._rings.append((2, 11))
             self._color = "WHITE"
 
-    # TODO: Add stone tracking to the player.
+    # Stones are counted by the Board, see Board.get_stones and count_stones
 
     def get_stone(self):
         """ Has no parameters. Returns the player's stone as a string: 'w' or 'b' """
@@ -0,0 +1,402 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  A compact copy of a Gess position for replaying archived games
+#               and searching without Qt signals.  Applies the same rules as
+#               BoardController and Game.
+
+
+import random
+from models.IllegalMove import IllegalMove
+from models.Layout import DIRECTIONS, LAYOUT
+
+
+# Squares are stored in a flat list; the square (row, col) is at row * SIZE + col.
+# The tables are compiled from the layout, see Layout.
+SIZE = LAYOUT.get_size()
+PLAYABLE = LAYOUT.get_playable()
+RING_CENTERS = LAYOUT.get_ring_centers()
+GUTTER = LAYOUT.get_gutter_squares()
+FOOTPRINTS = LAYOUT.get_footprints()
+RAYS = LAYOUT.get_rays()
+RING_NEIGHBORS = LAYOUT.get_ring_neighbors()
+
+COLORS = {'b': "BLACK", 'w': "WHITE"}
+OPPONENT = {'b': 'w', 'w': 'b'}
+
+# Zobrist keys; the fixed seed keeps hashes stable between runs so they can be stored
+_random = random.Random(0x6E55)
+ZOBRIST = {stone: tuple(_random.getrandbits(64) for _ in range(SIZE * SIZE)) for stone in ('b', 'w')}
+ZOBRIST_WHITE_TO_MOVE = _random.getrandbits(64)
+del _random
+
+
+def _build_symmetries():
+    """ Returns the symmetries of the rules in the form (squares, swap), where
+        squares maps every square to its image and swap is True if the colours
+        and the player to move are swapped.  Each symmetry is its own inverse. """
+    last = SIZE - 1
+    symmetries = []
+
+    for flip in (False, True):
+        for mirror in (False, True):
+            squares = tuple((last - row if flip else row) * SIZE + (last - col if mirror else col)
+                            for row in range(SIZE) for col in range(SIZE))
+            # Turning the board upside down gives each player the other's side
+            symmetries.append((squares, flip))
+
+    return tuple(symmetries)
+
+
+# The identity, the left to right mirror, the vertical flip and the half turn,
+# the last two swapping colours and the player to move
+SYMMETRIES = _build_symmetries()
+
+# Zobrist keys of each square as seen through every symmetry, in the form
+# {stone: ((key of symmetry 0, key of symmetry 1, ...) for square)}
+SYMMETRY_ZOBRIST = {stone: tuple(tuple(ZOBRIST[OPPONENT[stone] if swap else stone][squares[square]]
+                                       for squares, swap in SYMMETRIES)
+                                 for square in range(SIZE * SIZE))
+                    for stone in ('b', 'w')}
+
+# Squares outside the playable area which are never cleared.  The rules are
+# only symmetric while these are empty, see Board.clear_gutter.
+UNCLEARED = tuple(square for square in range(SIZE * SIZE)
+                  if not FOOTPRINTS[square] and square not in GUTTER)
+
+
+class Position:
+    """ Represents a Gess position: the stones on the board, the player to move,
+        the rings of each player, and the state of the game.  Squares and moves
+        are flat indices into the board so positions are cheap to copy, hash
+        and update in place. Has one optional parameter, squares, a SIZE x SIZE
+        matrix as returned by Board.get_squares. """
+    __slots__ = ("_cells", "_active", "_game_state", "_rings", "_hashes", "_stones")
+    _initial_squares = None
+
+    def __init__(self, squares=None, active='b', game_state='UNFINISHED'):
+        if squares is None:
+            squares = self.initial_squares()
+
+        self._cells = [stone for row in squares for stone in row]
+        self._active = active
+        self._game_state = game_state
+        self._rings = {}
+        # Hashes of the position seen through each symmetry, in the order of
+        # SYMMETRIES; the first is the hash of the position itself
+        self._hashes = tuple(ZOBRIST_WHITE_TO_MOVE if (active == 'w') != swap else 0 for _, swap in SYMMETRIES)
+
+        # Stones of each color, kept up to date by make_move
+        self._stones = {'b': self._cells.count('b'), 'w': self._cells.count('w')}
+
+        for square, stone in enumerate(self._cells):
+            if stone != "":
+                self._hashes = tuple(map(int.__xor__, self._hashes, SYMMETRY_ZOBRIST[stone][square]))
+
+        for center in RING_CENTERS:
+            self._update_ring(center)
+
+    @classmethod
+    def initial_squares(cls):
+        """ Returns the squares of a new Board, from the layout. """
+        if cls._initial_squares is None:
+            cls._initial_squares = LAYOUT.get_initial_squares()
+
+        return cls._initial_squares
+
+    @classmethod
+    def from_game(cls, game):
+        """ Returns a copy of the position held by a Game. """
+        return cls(game.get_board().get_squares(), game.get_active_player().get_stone(), game.get_game_state())
+
+    def copy(self):
+        """ Returns an independent copy of the position. """
+        position = Position.__new__(Position)
+        position._cells = self._cells[:]
+        position._active = self._active
+        position._game_state = self._game_state
+        position._rings = dict(self._rings)
+        position._hashes = self._hashes
+        position._stones = self._stones
+
+        return position
+
+    def get_cells(self):
+        """ Returns the flat list of stones, indexed by row * SIZE + col. """
+        return self._cells
+
+    def get_squares(self):
+        """ Returns the stones as a matrix in the form of Board.get_squares. """
+        return [self._cells[row * SIZE:(row + 1) * SIZE] for row in range(SIZE)]
+
+    def get_active(self):
+        """ Returns the stone of the player to move, 'b' or 'w'. """
+        return self._active
+
+    def get_game_state(self):
+        """ Returns the state of the game in the form of Game.get_game_state. """
+        return self._game_state
+
+    def get_hash(self):
+        """ Returns the 64 bit Zobrist hash of the stones and the player to move. """
+        return self._hashes[0]
+
+    def get_canonical(self):
+        """ Returns the smallest hash of the position seen through the
+            symmetries of the rules, and the index into SYMMETRIES giving it,
+            in the form (hash, symmetry).  Positions which are mirror images,
+            or the same with colours and the player to move swapped, share a
+            canonical hash.  Moves are mapped to and from the canonical position
+            with transform_move. """
+        if any(self._cells[square] != "" for square in UNCLEARED):
+            return self._hashes[0], 0
+
+        hashes = self._hashes
+        canonical = min(hashes)
+
+        return canonical, hashes.index(canonical)
+
+    def get_canonical_hash(self):
+        """ Returns the hash shared by all positions symmetric to this one. """
+        return self.get_canonical()[0]
+
+    def transform(self, symmetry):
+        """ Returns the position seen through one of SYMMETRIES. """
+        squares, swap = SYMMETRIES[symmetry]
+        cells = [""] * (SIZE * SIZE)
+        for square, stone in enumerate(self._cells):
+            cells[squares[square]] = OPPONENT[stone] if swap and stone != "" else stone
+
+        active = OPPONENT[self._active] if swap else self._active
+        game_state = self._game_state
+        if swap:
+            game_state = {"BLACK_WON": "WHITE_WON", "WHITE_WON": "BLACK_WON"}.get(game_state, game_state)
+
+        return Position([cells[row * SIZE:(row + 1) * SIZE] for row in range(SIZE)], active, game_state)
+
+    @staticmethod
+    def transform_move(move, symmetry):
+        """ Returns a move in the form (source, target) seen through one of
+            SYMMETRIES.  Symmetries are their own inverse, so the same call maps
+            a move back. """
+        squares = SYMMETRIES[symmetry][0]
+
+        return squares[move[0]], squares[move[1]]
+
+    def get_stones(self, stone):
+        """ Returns the number of stones of a color on the board. """
+        return self._stones[stone]
+
+    def get_rings(self, stone=None):
+        """ Returns the centers of the rings on the board, or only those of the
+            passed stone. """
+        if stone is None:
+            return list(self._rings)
+
+        return [center for center, ring_stone in self._rings.items() if ring_stone == stone]
+
+    def is_player_piece(self, center, stone=None):
+        """ Returns True if the piece at center has at least one stone and
+            all of its stones belong to the player. """
+        if stone is None:
+            stone = self._active
+
+        cells = self._cells
+        owned = False
+
+        for square in FOOTPRINTS[center]:
+            if cells[square] == stone:
+                owned = True
+            elif cells[square] != "":
+                return False
+
+        return owned
+
+    def is_legal_move(self, source, target):
+        """ Checks a move between two centers the same way BoardController does.
+            Does not check for an illegal break of the player's own last ring. """
+        if self._game_state != 'UNFINISHED' or source == target:
+            return False
+
+        if not (FOOTPRINTS[source] and FOOTPRINTS[target] and self.is_player_piece(source)):
+            return False
+
+        row_delta = target // SIZE - source // SIZE
+        col_delta = target % SIZE - source % SIZE
+
+        if not (row_delta == 0 or col_delta == 0 or abs(row_delta) == abs(col_delta)):
+            return False
+
+        distance = max(abs(row_delta), abs(col_delta))
+        direction = DIRECTIONS.index(((row_delta > 0) - (row_delta < 0), (col_delta > 0) - (col_delta < 0)))
+
+        for target_square, entered in self._ray(source, direction):
+            if target_square == target:
+                return True
+            if any(self._cells[square] != "" for square in entered):
+                return False
+
+        return False
+
+    def _ray(self, source, direction):
+        """ Returns the targets the piece at source may move to in a direction
+            before accounting for blocking stones. """
+        footprint = FOOTPRINTS[source]
+        row_delta, col_delta = DIRECTIONS[direction]
+
+        # The piece needs a stone on the side it moves towards
+        if self._cells[footprint[(row_delta + 1) * 3 + col_delta + 1]] == "":
+            return ()
+
+        ray = RAYS[source][direction]
+
+        # Without a center stone a piece moves at most 3 squares. Matches
+        # BoardController.is_legal_distance, which only counts rows moved.
+        if self._cells[source] == "" and row_delta != 0:
+            ray = ray[:3]
+
+        return ray
+
+    def pseudo_legal_moves(self):
+        """ Yields every move in the form (source, target) allowed by
+            is_legal_move, including those breaking the player's last ring. """
+        if self._game_state != 'UNFINISHED':
+            return
+
+        cells = self._cells
+
+        for source in PLAYABLE:
+            if cells[source] not in ("", self._active) or not self.is_player_piece(source):
+                continue
+
+            for direction in range(8):
+                for target, entered in self._ray(source, direction):
+                    yield source, target
+
+                    for square in entered:
+                        if cells[square] != "":
+                            break
+                    else:
+                        continue
+                    break
+
+    def legal_moves(self):
+        """ Returns every legal move in the form [(source, target)]. """
+        return [move for move in self.pseudo_legal_moves() if self.keeps_a_ring(*move)]
+
+    def keeps_a_ring(self, source, target):
+        """ Returns True if the player to move still has a ring after the move. """
+        # A ring away from both pieces survives the move
+        nearby = RING_NEIGHBORS[source] + RING_NEIGHBORS[target]
+        for center, stone in self._rings.items():
+            if stone == self._active and center not in nearby:
+                return True
+
+        try:
+            undo = self.make_move(source, target)
+        except IllegalMove:
+            return False
+        self.unmake_move(undo)
+
+        return True
+
+    def make_null_move(self):
+        """ Passes the turn to the opponent, for asking what the opponent could
+            do if it were their move. Returns a record for unmake_move. """
+        undo = [], self._rings, self._hashes, self._stones, self._game_state
+        self._active = OPPONENT[self._active]
+        self._hashes = tuple(position_hash ^ ZOBRIST_WHITE_TO_MOVE for position_hash in self._hashes)
+
+        return undo
+
+    def make_move(self, source, target):
+        """ Moves the piece at source to target, overwriting all stones, clears
+            the gutter, updates rings and the game state and switches turns.
+            The move is assumed to pass is_legal_move. Raises IllegalMove and
+            leaves the position unchanged if the move breaks the player's last
+            ring.  Returns a record for unmake_move. """
+        cells = self._cells
+        source_squares = FOOTPRINTS[source]
+        target_squares = FOOTPRINTS[target]
+        saved = [(square, cells[square]) for square in source_squares + target_squares]
+        stones = [cells[square] for square in source_squares]
+        undo = (saved, self._rings, self._hashes, self._stones, self._game_state)
+
+        # Stones taken off and put on, in the form [(stone, square)]
+        changed = []
+        counts = dict(self._stones)
+        for square in source_squares:
+            if cells[square] != "":
+                changed.append((cells[square], square))
+                counts[cells[square]] -= 1
+                cells[square] = ""
+
+        for square, stone in zip(target_squares, stones):
+            if square in GUTTER:
+                stone = ""
+            if cells[square] != "":
+                changed.append((cells[square], square))
+                counts[cells[square]] -= 1
+            if stone != "":
+                changed.append((stone, square))
+                counts[stone] += 1
+            cells[square] = stone
+        self._stones = counts
+
+        h0, h1, h2, h3 = self._hashes
+        for stone, square in changed:
+            k0, k1, k2, k3 = SYMMETRY_ZOBRIST[stone][square]
+            h0 ^= k0
+            h1 ^= k1
+            h2 ^= k2
+            h3 ^= k3
+
+        self._rings = dict(self._rings)
+        for center in set(RING_NEIGHBORS[source]).union(RING_NEIGHBORS[target]):
+            self._update_ring(center)
+
+        # Prevent the active player from destroying their last ring
+        if self._active not in self._rings.values():
+            self._restore(undo)
+            raise IllegalMove
+
+        opponent = OPPONENT[self._active]
+        if opponent not in self._rings.values():
+            self._game_state = COLORS[self._active] + "_WON"
+
+        self._active = opponent
+        self._hashes = (h0 ^ ZOBRIST_WHITE_TO_MOVE, h1 ^ ZOBRIST_WHITE_TO_MOVE,
+                        h2 ^ ZOBRIST_WHITE_TO_MOVE, h3 ^ ZOBRIST_WHITE_TO_MOVE)
+
+        return undo
+
+    def unmake_move(self, undo):
+        """ Takes back the move which returned undo from make_move. """
+        self._restore(undo)
+        self._active = OPPONENT[self._active]
+
+    def resign_game(self):
+        """ The active player loses the game. """
+        self._game_state = COLORS[OPPONENT[self._active]] + "_WON"
+
+    def _restore(self, undo):
+        """ Restores the squares, rings, hashes, stone counts and game state saved in undo. """
+        saved, self._rings, self._hashes, self._stones, self._game_state = undo
+
+        for square, stone in saved:
+            self._cells[square] = stone
+
+    def _update_ring(self, center):
+        """ Adds or removes the ring at center according to the stones around it. """
+        cells = self._cells
+        footprint = FOOTPRINTS[center]
+        stone = cells[footprint[0]]
+
+        if stone != "" and cells[center] == "" and \
+                all(cells[square] == stone for square in footprint if square != center):
+            self._rings[center] = stone
+        else:
+            self._rings.pop(center, None)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,223 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Writes single positions as short strings or fixed size records
+#               and converts whole arrays of them at a time with NumPy.
+
+
+import re
+import numpy as np
+from models.Position import OPPONENT, PLAYABLE, Position, SIZE, UNCLEARED
+
+
+# Game states as written in the last field of a position string and in the
+# flags of a record
+STATES = ('UNFINISHED', 'BLACK_WON', 'WHITE_WON')
+STATE_CODES = ('-', 'b', 'w')
+
+# Bytes of a stone mask over the playable squares, 41 in the standard layout
+MASK_BYTES = (len(PLAYABLE) + 7) // 8
+
+# Flags of the last byte of a record
+WHITE_TO_MOVE = 0x01
+STATE_SHIFT = 1                     # Two bits, the index into STATES
+UNCLEARED_BLACK = 0x08              # Stones on the square Board.clear_gutter misses
+UNCLEARED_WHITE = 0x10
+
+# Input planes of networks, each SIZE x SIZE, see to_planes
+PLANES = ("black", "white", "white_to_move", "gutter")
+
+_PLAYABLE = np.array(PLAYABLE, dtype=np.intp)
+_UNCLEARED = UNCLEARED[0] if UNCLEARED else None
+_OUTSIDE = np.setdiff1d(np.arange(SIZE * SIZE), np.append(_PLAYABLE, UNCLEARED))
+
+# Squares outside the playable area, the same for every position
+_GUTTER_PLANE = np.ones(SIZE * SIZE, dtype=np.uint8)
+_GUTTER_PLANE[_PLAYABLE] = 0
+_GUTTER_PLANE = _GUTTER_PLANE.reshape(SIZE, SIZE)
+
+_EMPTY, _BLACK, _WHITE = ord("."), ord("b"), ord("w")
+_RUN = re.compile(r"\.+")
+_DIGITS = re.compile(r"\d+")
+
+
+class PositionCodec:
+    """ Encodes positions in two forms.  Strings list the rows of the board
+        from the top, separated by '/', with 'b' and 'w' for stones and runs of
+        empty squares as numbers, then the player to move and the state of the
+        game as '-', 'b' or 'w' for the winner, e.g. "20/.../20 b -".
+        Records are RECORD_BYTES long: a mask of the black stones and one of
+        the white stones over the playable squares in the order of PLAYABLE,
+        lowest bit first, then a byte of flags.  Many records are held as rows
+        of a uint8 array, which can be saved with np.save and memory mapped. """
+    RECORD_BYTES = 2 * MASK_BYTES + 1
+
+    @staticmethod
+    def to_string(position):
+        """ Returns the string of a Position. """
+        return PositionCodec.to_strings(PositionCodec.encode([position]))[0]
+
+    @staticmethod
+    def from_string(text):
+        """ Returns the Position written in a string. Raises ValueError if the
+            string is malformed. """
+        return PositionCodec.decode(PositionCodec.from_strings([text]))[0]
+
+    @staticmethod
+    def to_bytes(position):
+        """ Returns the record of a Position as bytes. """
+        return PositionCodec.encode([position])[0].tobytes()
+
+    @staticmethod
+    def from_bytes(data):
+        """ Returns the Position in a record. """
+        return PositionCodec.decode(np.frombuffer(data, dtype=np.uint8).reshape(1, -1))[0]
+
+    @staticmethod
+    def encode(positions):
+        """ Returns the records of a sequence of Positions as an array of shape
+            (len(positions), RECORD_BYTES). Raises ValueError if a position has
+            stones in the gutter, which no move leaves behind. """
+        # Squares are joined with a '.' after each, which is much faster than
+        # writing each one, so the character before every '.' is the stone on
+        # that square or, for an empty square, the '.' of the one before
+        text = "." + "".join([".".join(position.get_cells()) + "." for position in positions])
+        characters = np.frombuffer(text.encode(), dtype=np.uint8)
+        cells = characters[np.flatnonzero(characters == _EMPTY)[1:] - 1].reshape(-1, SIZE * SIZE)
+        white = np.array([position.get_active() == 'w' for position in positions], dtype=bool)
+        states = np.array([STATES.index(position.get_game_state()) for position in positions], dtype=np.uint8)
+
+        return PositionCodec._pack(cells, white, states)
+
+    @staticmethod
+    def decode(records):
+        """ Returns the Positions of an array of records. """
+        cells, white, states = PositionCodec._unpack(records)
+        rows = cells.reshape(-1, SIZE).tobytes().decode()
+        positions = []
+
+        for i in range(len(cells)):
+            squares = [[stone if stone != "." else "" for stone in rows[row * SIZE:(row + 1) * SIZE]]
+                       for row in range(i * SIZE, (i + 1) * SIZE)]
+            positions.append(Position(squares, "w" if white[i] else "b", STATES[states[i]]))
+
+        return positions
+
+    @staticmethod
+    def unpack(records):
+        """ Returns the stones and players to move of an array of records as
+            (black, white, white_to_move), boolean arrays of shapes
+            (n, SIZE, SIZE), (n, SIZE, SIZE) and (n,). """
+        records = np.asarray(records, dtype=np.uint8)
+        flags = records[:, -1]
+        stones = []
+
+        for mask, uncleared in ((slice(0, MASK_BYTES), UNCLEARED_BLACK),
+                                (slice(MASK_BYTES, 2 * MASK_BYTES), UNCLEARED_WHITE)):
+            squares = np.zeros((len(records), SIZE * SIZE), dtype=bool)
+            squares[:, _PLAYABLE] = np.unpackbits(records[:, mask], axis=1, count=len(PLAYABLE), bitorder="little")
+            if _UNCLEARED is not None:
+                squares[:, _UNCLEARED] = flags & uncleared
+            stones.append(squares.reshape(-1, SIZE, SIZE))
+
+        return stones[0], stones[1], (flags & WHITE_TO_MOVE).astype(bool)
+
+    @staticmethod
+    def to_planes(records):
+        """ Returns the input planes of an array of records, a uint8 array of
+            shape (n, len(PLANES), SIZE, SIZE) marking the black stones, the
+            white stones, every square if white is to move, and the squares
+            outside the playable area. """
+        black, white, white_to_move = PositionCodec.unpack(records)
+        planes = np.empty((len(black), len(PLANES), SIZE, SIZE), dtype=np.uint8)
+
+        planes[:, 0] = black
+        planes[:, 1] = white
+        planes[:, 2] = white_to_move[:, None, None]
+        planes[:, 3] = _GUTTER_PLANE
+
+        return planes
+
+    @staticmethod
+    def to_strings(records):
+        """ Returns the strings of an array of records. """
+        cells, white, states = PositionCodec._unpack(records)
+        rows = cells.reshape(-1, SIZE).tobytes().decode()
+        strings = []
+
+        for i in range(len(cells)):
+            board = "/".join(_RUN.sub(lambda run: str(len(run.group())), rows[row * SIZE:(row + 1) * SIZE])
+                             for row in range(i * SIZE, (i + 1) * SIZE))
+            strings.append("{} {} {}".format(board, "w" if white[i] else "b", STATE_CODES[states[i]]))
+
+        return strings
+
+    @staticmethod
+    def from_strings(texts):
+        """ Returns the records of a sequence of strings as an array. Raises
+            ValueError if a string is malformed. """
+        boards = []
+        white = np.empty(len(texts), dtype=bool)
+        states = np.empty(len(texts), dtype=np.uint8)
+
+        for i, text in enumerate(texts):
+            fields = text.split()
+            if len(fields) != 3 or fields[1] not in OPPONENT or fields[2] not in STATE_CODES:
+                raise ValueError("Not a position: " + text)
+
+            rows = fields[0].split("/")
+            board = "".join(_DIGITS.sub(lambda run: "." * int(run.group()), row) for row in rows)
+            if len(rows) != SIZE or len(board) != SIZE * SIZE or board.strip(".bw"):
+                raise ValueError("Not a position: " + text)
+
+            boards.append(board)
+            white[i] = fields[1] == 'w'
+            states[i] = STATE_CODES.index(fields[2])
+
+        cells = np.frombuffer("".join(boards).encode(), dtype=np.uint8).reshape(-1, SIZE * SIZE)
+
+        return PositionCodec._pack(cells, white, states)
+
+    @staticmethod
+    def _pack(cells, white, states):
+        """ Returns the records of positions given as an array of the
+            characters of their squares, '.', 'b' or 'w', and arrays of the
+            players to move and indices into STATES. """
+        if (cells[:, _OUTSIDE] != _EMPTY).any():
+            raise ValueError("Stones in the gutter can not be encoded")
+
+        records = np.empty((len(cells), PositionCodec.RECORD_BYTES), dtype=np.uint8)
+        playable = cells[:, _PLAYABLE]
+        records[:, :MASK_BYTES] = np.packbits(playable == _BLACK, axis=1, bitorder="little")
+        records[:, MASK_BYTES:2 * MASK_BYTES] = np.packbits(playable == _WHITE, axis=1, bitorder="little")
+
+        flags = white.astype(np.uint8) | (states << STATE_SHIFT)
+        if _UNCLEARED is not None:
+            flags |= np.where(cells[:, _UNCLEARED] == _BLACK, UNCLEARED_BLACK, 0).astype(np.uint8)
+            flags |= np.where(cells[:, _UNCLEARED] == _WHITE, UNCLEARED_WHITE, 0).astype(np.uint8)
+        records[:, -1] = flags
+
+        return records
+
+    @staticmethod
+    def _unpack(records):
+        """ Returns the squares, players to move and states of an array of
+            records, in the form taken by _pack. """
+        records = np.asarray(records, dtype=np.uint8)
+        count = len(records)
+        black = np.unpackbits(records[:, :MASK_BYTES], axis=1, count=len(PLAYABLE), bitorder="little")
+        white = np.unpackbits(records[:, MASK_BYTES:2 * MASK_BYTES], axis=1, count=len(PLAYABLE), bitorder="little")
+        flags = records[:, -1]
+
+        # The characters differ by fixed amounts, so they are summed in place
+        # without larger intermediate arrays
+        cells = np.full((count, SIZE * SIZE), _EMPTY, dtype=np.uint8)
+        cells[:, _PLAYABLE] += black * np.uint8(_BLACK - _EMPTY) + white * np.uint8(_WHITE - _EMPTY)
+        if _UNCLEARED is not None:
+            cells[:, _UNCLEARED] += ((flags & UNCLEARED_BLACK) > 0) * np.uint8(_BLACK - _EMPTY)
+            cells[:, _UNCLEARED] += ((flags & UNCLEARED_WHITE) > 0) * np.uint8(_WHITE - _EMPTY)
+
+        return cells, (flags & WHITE_TO_MOVE).astype(bool), (flags >> STATE_SHIFT) & 0x03
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,126 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Steps back and forth through the moves of a game for reviewing
+#               it, reporting only the squares each step changes.
+
+
+from models.Layout import LAYOUT
+from models.Move import Move
+from models.Notation import Notation
+from models.Position import Position
+from PySide2.QtCore import QObject, Signal
+
+
+class Review(QObject):
+    """ Replays a list of Move records over a copy of the board.  Starts at the
+        last move with the squares of the finished game and undoes or redoes
+        one move at a time, so going to any ply only touches the pieces of the
+        moves in between.  Has 2 parameters, squares, the matrix
+        returned by Board.get_squares after the last move, and moves, a list
+        of Move records as kept by History. """
+    # Passes the changed squares in the form {(row, col): stone}
+    squares_changed = Signal(dict)
+    ply_changed = Signal(int)
+
+    def __init__(self, squares, moves):
+        super(Review, self).__init__()
+
+        self._squares = [list(row) for row in squares]
+        self._moves = list(moves)
+        self._ply = len(self._moves)
+
+        self._gutter = {divmod(square, LAYOUT.get_size()) for square in LAYOUT.get_gutter_squares()}
+
+    @classmethod
+    def from_notation(cls, moves):
+        """ Returns a review of a saved game given as moves in notation in the
+            form [('f6', 'f9')], replayed from the starting position. """
+        position = Position()
+        records = []
+
+        for origin, destination in moves:
+            source, target = Notation.to_indices(origin), Notation.to_indices(destination)
+            squares = position.get_squares()
+            records.append(Move(source, target,
+                                [squares[row][col] for row, col in Move.get_footprint(source)],
+                                [squares[row][col] for row, col in Move.get_footprint(target)]))
+            position.make_move(Notation.to_center(origin), Notation.to_center(destination))
+
+        return cls(position.get_squares(), records)
+
+    def get_squares(self):
+        """ Returns the squares at the current ply. """
+        return self._squares
+
+    def get_moves(self):
+        """ Returns the moves of the game in the form [Move]. """
+        return self._moves
+
+    def get_ply(self):
+        """ Returns the number of moves played on the board shown. """
+        return self._ply
+
+    def get_plies(self):
+        """ Returns the number of moves in the game. """
+        return len(self._moves)
+
+    def step_forward(self):
+        """ Redoes the next move, if any. """
+        self.go_to(self._ply + 1)
+
+    def step_back(self):
+        """ Undoes the last move shown, if any. """
+        self.go_to(self._ply - 1)
+
+    def go_to(self, ply):
+        """ Shows the board after ply moves. Emits the squares which differ
+            from the board shown before. """
+        ply = max(0, min(ply, len(self._moves)))
+        if ply == self._ply:
+            return
+
+        # In the form {(row, col): stone before the first step}
+        touched = {}
+
+        while self._ply < ply:
+            self._redo(self._moves[self._ply], touched)
+            self._ply += 1
+        while self._ply > ply:
+            self._ply -= 1
+            self._undo(self._moves[self._ply], touched)
+
+        changes = {}
+        for square, stone in touched.items():
+            if self._squares[square[0]][square[1]] != stone:
+                changes[square] = self._squares[square[0]][square[1]]
+
+        # noinspection PyUnresolvedReferences
+        self.squares_changed.emit(changes)
+        # noinspection PyUnresolvedReferences
+        self.ply_changed.emit(self._ply)
+
+    def _set(self, square, stone, touched):
+        """ Sets a square, remembering what it held before the first change. """
+        if square not in touched:
+            touched[square] = self._squares[square[0]][square[1]]
+        self._squares[square[0]][square[1]] = stone
+
+    def _redo(self, move, touched):
+        """ Moves the piece as Board.move_piece and Board.clear_gutter do. """
+        for square in Move.get_footprint(move.get_source()):
+            self._set(square, "", touched)
+
+        for square, stone in zip(Move.get_footprint(move.get_target()), move.get_stones()):
+            self._set(square, "" if square in self._gutter else stone, touched)
+
+    def _undo(self, move, touched):
+        """ Puts back the stones under both pieces as they were before the move. """
+        for square, stone in zip(Move.get_footprint(move.get_target()), move.get_captured()):
+            self._set(square, stone, touched)
+
+        for square, stone in zip(Move.get_footprint(move.get_source()), move.get_stones()):
+            self._set(square, stone, touched)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,116 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Removes repeated games from archives, counting games which are
+#               mirror images of each other as the same game.
+
+
+import argparse
+import hashlib
+import struct
+from models.GameRecord import GameRecord
+from models.IllegalMove import IllegalMove
+from models.Notation import Notation
+from models.Position import Position
+
+
+class Deduplicator:
+    """ Replays archived games and keeps the first of each set of equivalent
+        games.  Games are compared by the canonical hash of every position
+        reached and their result, so games passing through symmetric positions
+        move for move are the same game.  Only a 16 byte digest is kept per
+        game, so memory stays small for large archives.  With
+        count_positions the distinct positions of all games are counted the
+        same way, which keeps a hash of every one, so memory grows with the
+        positions instead. """
+    def __init__(self, count_positions=False):
+        self._digests = set()
+        self._positions = set() if count_positions else None
+        self._games = 0
+        self._duplicates = 0
+
+    def get_games(self):
+        """ Returns the number of games added. """
+        return self._games
+
+    def get_duplicates(self):
+        """ Returns the number of games found to repeat an earlier one. """
+        return self._duplicates
+
+    def get_positions(self):
+        """ Returns the number of distinct positions reached, counting
+            symmetric positions once, or None if they are not counted. """
+        if self._positions is None:
+            return None
+
+        return len(self._positions)
+
+    def add_game(self, record):
+        """ Returns True if the GameRecord is new, or False if it repeats a
+            game added before. """
+        digest = self.get_digest(record)
+        self._games += 1
+
+        if digest in self._digests:
+            self._duplicates += 1
+            return False
+
+        self._digests.add(digest)
+        return True
+
+    def filter_archive(self, path):
+        """ Yields the games of an archive which are new. """
+        for record in GameRecord.read_archive(path):
+            if self.add_game(record):
+                yield record
+
+    def get_digest(self, record):
+        """ Returns the digest of a GameRecord shared by the games equivalent
+            to it.  Moves from the first illegal or unreadable one on are
+            compared as written. """
+        digest = hashlib.blake2b(record.get_result().encode(), digest_size=16)
+        position = Position()
+        moves = record.get_moves()
+
+        for ply, (origin, destination) in enumerate(moves):
+            try:
+                source, target = Notation.to_center(origin), Notation.to_center(destination)
+            except ValueError:
+                break
+            if not position.is_legal_move(source, target):
+                break
+            try:
+                position.make_move(source, target)
+            except IllegalMove:
+                break
+            position_hash = position.get_canonical_hash()
+            if self._positions is not None:
+                self._positions.add(position_hash)
+            digest.update(struct.pack("<Q", position_hash))
+        else:
+            return digest.digest()
+
+        digest.update(GameRecord(moves[ply:]).to_line().encode())
+        return digest.digest()
+
+
+def main():
+    """ Writes the games of the archives given on the command line without repeats. """
+    parser = argparse.ArgumentParser(description="Removes repeated and mirrored games from Gess archives.")
+    parser.add_argument("archives", nargs="+", help="archives with one game per line")
+    parser.add_argument("-o", "--output", default="unique.txt", help="the archive to write")
+    parser.add_argument("--count-positions", action="store_true",
+                        help="count the distinct positions, keeping a hash of each")
+    args = parser.parse_args()
+
+    deduplicator = Deduplicator(args.count_positions)
+    records = (record for path in args.archives for record in deduplicator.filter_archive(path))
+    GameRecord.write_archive(args.output, records)
+
+    print("Kept", deduplicator.get_games() - deduplicator.get_duplicates(), "of", deduplicator.get_games(),
+          "games in", args.output)
+    if args.count_positions:
+        print("Reaching", deduplicator.get_positions(), "distinct positions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Plays random move sequences through the reference rules and an
+#               alternative engine side by side, comparing them after every
+#               ply and shrinking any difference to a minimal sequence.
+
+
+import argparse
+import concurrent.futures
+import importlib
+import json
+import os
+import random
+import time
+from models.GessGame import GessGame
+from models.IllegalMove import IllegalMove
+from models.Notation import Notation
+from models.Position import PLAYABLE, Position, SIZE
+
+
+def load_engine(name):
+    """ Returns the class named in the form "module:Class". """
+    module_name, _, class_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def reference_state(game):
+    """ Returns the state of a GessGame for comparison: the squares, the ring
+        centers of each player as (row, col), the player to move and the game
+        state. """
+    return {
+        "squares": [list(row) for row in game.get_board().get_squares()],
+        "rings": {player.get_stone(): sorted(tuple(ring) for ring in player.get_rings())
+                  for player in game.get_game().get_players()},
+        "active": game.get_active_player().get_stone(),
+        "game_state": game.get_game_state()
+    }
+
+
+def engine_state(position):
+    """ Returns the state of an engine with the interface of Position, in the
+        form of reference_state. """
+    return {
+        "squares": position.get_squares(),
+        "rings": {stone: sorted(divmod(center, SIZE) for center in position.get_rings(stone)) for stone in ('b', 'w')},
+        "active": position.get_active(),
+        "game_state": position.get_game_state()
+    }
+
+
+def play(engine, moves):
+    """ Plays the moves in the form [(source, target)], flat centers, through a
+        new GessGame and a new engine. Illegal moves are rejected by both.
+        Returns None if they agree after every ply, otherwise the first
+        difference in the form {"ply": n, "move": [source, target],
+        "field": name, "reference": value, "engine": value}. """
+    game = GessGame()
+    position = engine()
+
+    for ply, (source, target) in enumerate(moves):
+        accepted = game.make_move(Notation.from_center(source), Notation.from_center(target))
+
+        made = position.is_legal_move(source, target)
+        if made:
+            try:
+                position.make_move(source, target)
+            except IllegalMove:
+                made = False
+
+        expected = reference_state(game)
+        expected["accepted"] = accepted
+        actual = engine_state(position)
+        actual["accepted"] = made
+
+        for field in ("accepted", "squares", "rings", "active", "game_state"):
+            if expected[field] != actual[field]:
+                return {"ply": ply, "move": [source, target], "field": field,
+                        "reference": expected[field], "engine": actual[field]}
+
+    return None
+
+
+def generate(seed, plies, illegal=0.3):
+    """ Returns a random sequence of plies moves in the form [(source, target)].
+        Most moves are legal in the position reached; a share of about illegal
+        are not: moves of any center in a straight line, into or out of the
+        gutter, or breaking the player's last ring. """
+    rng = random.Random(seed)
+    position = Position()
+    squares = range(SIZE * SIZE)
+    moves = []
+
+    for _ in range(plies):
+        # Checking every move for a ring break is slow, so moves are drawn from
+        # the pseudo legal ones and the few which break a ring are kept
+        candidates = list(position.pseudo_legal_moves())
+        roll = rng.random()
+
+        if candidates and roll >= illegal:
+            move = rng.choice(candidates)
+        elif roll < illegal / 3:
+            move = rng.choice(squares), rng.choice(squares)
+        elif roll < illegal * 2 / 3:
+            # Lines from a playable center, which may leave the board
+            source = rng.choice(PLAYABLE)
+            row_delta, col_delta = rng.choice(((1, 0), (0, 1), (1, 1), (1, -1)))
+            distance = rng.choice((-1, 1)) * rng.randint(1, SIZE)
+            row = min(max(source // SIZE + row_delta * distance, 0), SIZE - 1)
+            col = min(max(source % SIZE + col_delta * distance, 0), SIZE - 1)
+            move = source, row * SIZE + col
+        else:
+            breaking = [move for move in candidates if not position.keeps_a_ring(*move)]
+            move = rng.choice(breaking or candidates or [(rng.choice(squares), rng.choice(squares))])
+
+        moves.append(move)
+        if position.is_legal_move(*move):
+            try:
+                position.make_move(*move)
+            except IllegalMove:
+                pass
+
+        if position.get_game_state() != 'UNFINISHED':
+            # Keep going with a new game so long sequences stay useful
+            position = Position()
+            moves.append(None)
+
+    return moves
+
+
+def fuzz(task):
+    """ Runs in a worker process. Plays the sequences of a batch and returns
+        (plies played, failures), where each failure is in the form
+        {"seed": n, "moves": [[source, target]], "difference": {...}}. """
+    engine = load_engine(task["engine"])
+    played = 0
+    failures = []
+
+    for seed in range(task["first_seed"], task["first_seed"] + task["sequences"]):
+        for game in _split(generate(seed, task["plies"], task["illegal"])):
+            difference = play(engine, game)
+            if difference is not None:
+                played += difference["ply"] + 1
+                failures.append({"seed": seed, "moves": [list(move) for move in game[:difference["ply"] + 1]],
+                                 "difference": difference})
+                break
+            played += len(game)
+
+    return played, failures
+
+
+def _split(moves):
+    """ Splits a generated sequence into games at the markers between them. """
+    game = []
+    for move in moves:
+        if move is None:
+            yield game
+            game = []
+        else:
+            game.append(move)
+    if game:
+        yield game
+
+
+class DifferentialFuzzer:
+    """ Compares an alternative rules engine against the reference rules of
+        Board, BoardController and Game.  The engine is named in the form
+        "module:Class" and must have the interface of Position: a constructor
+        for the starting position, is_legal_move, make_move raising
+        IllegalMove, get_squares, get_rings, get_active and get_game_state.
+        Sequences are generated from consecutive seeds, so any failure can be
+        reproduced from its seed, and are played batch_size at a time in
+        processes worker processes, or in this process if processes is 1. """
+    def __init__(self, engine="models.Position:Position", plies=200, illegal=0.3, processes=None, batch_size=20):
+        self._engine = engine
+        self._plies = plies
+        self._illegal = illegal
+        self._processes = processes or os.cpu_count() or 1
+        self._batch_size = batch_size
+
+        self._played = 0
+        self._sequences = 0
+        self._failures = []
+
+    def get_played(self):
+        """ Returns the number of plies compared so far. """
+        return self._played
+
+    def get_sequences(self):
+        """ Returns the number of sequences played so far. """
+        return self._sequences
+
+    def get_failures(self):
+        """ Returns the failures found so far, shrunk, in the form of fuzz. """
+        return self._failures
+
+    def run(self, sequences=None, seconds=None, first_seed=0, callback=None):
+        """ Plays sequences from first_seed on until sequences have been played
+            or seconds have passed. callback is called with each shrunk failure. """
+        deadline = time.monotonic() + seconds if seconds is not None else None
+        tasks = self._tasks(first_seed, sequences)
+
+        if self._processes == 1:
+            for task in tasks:
+                self._record(fuzz(task), task, callback)
+                if deadline is not None and time.monotonic() > deadline:
+                    break
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(self._processes) as pool:
+            running = {}
+            while True:
+                # Keep a couple of batches per process queued so a deadline is met promptly
+                while len(running) < self._processes * 2 and (deadline is None or time.monotonic() < deadline):
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    running[pool.submit(fuzz, task)] = task
+
+                if not running:
+                    return
+
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    self._record(future.result(), running.pop(future), callback)
+
+    def shrink(self, moves):
+        """ Returns a shortest found subsequence of moves in the form
+            [(source, target)] on which the engines still differ, removing
+            chunks of moves and then single moves for as long as they do. """
+        engine = load_engine(self._engine)
+        moves = [tuple(move) for move in moves]
+        chunk = max(1, len(moves) // 2)
+
+        while chunk >= 1:
+            start = 0
+            removed = False
+            while start < len(moves):
+                candidate = moves[:start] + moves[start + chunk:]
+                difference = play(engine, candidate) if candidate else None
+                if difference is not None:
+                    # Nothing after the first difference is needed
+                    moves = candidate[:difference["ply"] + 1]
+                    removed = True
+                else:
+                    start += chunk
+            if not removed:
+                chunk //= 2
+
+        return moves
+
+    def _tasks(self, first_seed, sequences):
+        """ Yields batches of seeds to play. """
+        seed = first_seed
+        while sequences is None or seed < first_seed + sequences:
+            count = self._batch_size if sequences is None else min(self._batch_size, first_seed + sequences - seed)
+            yield {"engine": self._engine, "first_seed": seed, "sequences": count,
+                   "plies": self._plies, "illegal": self._illegal}
+            seed += count
+
+    def _record(self, result, task, callback):
+        """ Counts a finished batch and shrinks its failures. """
+        played, failures = result
+        self._played += played
+        self._sequences += task["sequences"]
+
+        for failure in failures:
+            moves = self.shrink(failure["moves"])
+            failure = {"seed": failure["seed"], "moves": [list(move) for move in moves],
+                       "difference": play(load_engine(self._engine), moves)}
+            self._failures.append(failure)
+            if callback is not None:
+                callback(failure)
+
+
+def main():
+    """ Fuzzes an engine against the reference rules, writing each shrunk
+        failure to the output as a line of JSON. """
+    parser = argparse.ArgumentParser(description="Compares a Gess rules engine against the reference rules.")
+    parser.add_argument("--engine", default="models.Position:Position", help="the engine in the form module:Class")
+    parser.add_argument("--sequences", type=int, help="the number of sequences to play")
+    parser.add_argument("--seconds", type=float, help="stop starting new sequences after this long")
+    parser.add_argument("--plies", type=int, default=200, help="the number of moves per sequence")
+    parser.add_argument("--illegal", type=float, default=0.3, help="the share of illegal moves")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the first sequence")
+    parser.add_argument("--processes", type=int, help="the number of worker processes; all cores by default")
+    parser.add_argument("-o", "--output", default="failures.jsonl", help="the file to write failures to")
+    args = parser.parse_args()
+
+    if args.sequences is None and args.seconds is None:
+        args.sequences = 100
+
+    fuzzer = DifferentialFuzzer(args.engine, args.plies, args.illegal, args.processes)
+    start = time.monotonic()
+
+    with open(args.output, "a") as output:
+        def report(failure):
+            output.write(json.dumps(failure) + "\n")
+            output.flush()
+            print("Seed {}: {} moves, {} differs at ply {}".format(
+                failure["seed"], len(failure["moves"]), failure["difference"]["field"],
+                failure["difference"]["ply"]))
+
+        fuzzer.run(args.sequences, args.seconds, args.seed, report)
+
+    elapsed = time.monotonic() - start
+    print("{} sequences, {} plies in {:.1f} s ({:.0f} plies per second), {} failures".format(
+        fuzzer.get_sequences(), fuzzer.get_played(), elapsed, fuzzer.get_played() / elapsed if elapsed else 0,
+        len(fuzzer.get_failures())))
+
+
+if __name__ == "__main__":
+    main()
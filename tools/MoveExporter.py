@@ -0,0 +1,251 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Exports every move of archived games as columns for analysis,
+#               as Parquet when pyarrow is installed or NumPy .npy shards.
+
+
+import argparse
+import os
+import numpy as np
+from models.GameRecord import GameRecord
+from models.IllegalMove import IllegalMove
+from models.Notation import Notation
+from models.Position import FOOTPRINTS, GUTTER, OPPONENT, SIZE, Position
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+# Game results stored in the result column
+RESULTS = {'UNFINISHED': 0, 'BLACK_WON': 1, 'WHITE_WON': 2}
+
+
+class MoveExporter:
+    """ Replays archived games with the rules of Position and writes one row
+        per move. Rows are collected chunk_size at a time and written as a
+        Parquet row group or as a directory of .npy files, one per column, so
+        memory does not grow with the archive. Set parquet to False to write
+        .npy shards even when pyarrow is installed. """
+    COLUMNS = (
+        ("game", np.int64),                     # Index of the game in the archives
+        ("ply", np.int16),                      # Moves played before this one
+        ("stone", np.uint8),                    # 0 for black, 1 for white
+        ("source_row", np.int8),                # Center of the piece moved, as matrix indices
+        ("source_col", np.int8),
+        ("target_row", np.int8),
+        ("target_col", np.int8),
+        ("row_direction", np.int8),             # -1, 0 or 1
+        ("col_direction", np.int8),
+        ("distance", np.int8),                  # Squares moved
+        ("stones", np.uint8),                   # Stones in the piece moved
+        ("captured", np.uint8),                 # Opponent stones overwritten
+        ("overwritten", np.uint8),              # Own stones overwritten by the piece
+        ("gutter", np.uint8),                   # Stones of the piece lost to the gutter
+        ("rings_before", np.uint8),             # Rings of the player moving
+        ("opponent_rings_before", np.uint8),
+        ("rings_after", np.uint8),
+        ("opponent_rings_after", np.uint8),
+        ("result", np.uint8)                    # Final state of the game, see RESULTS
+    )
+
+    def __init__(self, output, chunk_size=65536, parquet=True):
+        self._output = output
+        self._chunk_size = chunk_size
+        self._parquet = parquet and pyarrow is not None
+        self._writer = None
+        self._chunks = 0
+        self._rows = 0
+        self._games = 0
+        self._skipped = 0
+
+        self._chunk = {name: np.empty(chunk_size, dtype=dtype) for name, dtype in self.COLUMNS}
+        self._filled = 0
+
+    def get_rows(self):
+        """ Returns the number of moves written so far. """
+        return self._rows
+
+    def get_games(self):
+        """ Returns the number of games exported so far. """
+        return self._games
+
+    def get_skipped(self):
+        """ Returns the number of games stopped early by an illegal move. """
+        return self._skipped
+
+    def is_parquet(self):
+        """ Returns True if the output is a Parquet file. """
+        return self._parquet
+
+    def add_archive(self, path):
+        """ Exports every game of an archive. """
+        for record in GameRecord.read_archive(path):
+            self.add_game(record)
+
+    def add_history(self, history, result='UNFINISHED'):
+        """ Exports the moves kept by a History. """
+        moves = [(Notation.to_notation(move.get_source()), Notation.to_notation(move.get_target()))
+                 for move in history.get_history()]
+        self.add_game(GameRecord(moves, result))
+
+    def add_game(self, record):
+        """ Exports the moves of a GameRecord up to the first illegal or
+            unreadable move. """
+        rows = []
+        position = Position()
+
+        for ply, (origin, destination) in enumerate(record.get_moves()):
+            try:
+                source, target = Notation.to_center(origin), Notation.to_center(destination)
+            except ValueError:
+                self._skipped += 1
+                break
+            if not position.is_legal_move(source, target):
+                self._skipped += 1
+                break
+
+            row = self._describe(position, ply, source, target)
+            try:
+                position.make_move(source, target)
+            except IllegalMove:
+                self._skipped += 1
+                break
+
+            stone = OPPONENT[position.get_active()]
+            row["rings_after"] = len(position.get_rings(stone))
+            row["opponent_rings_after"] = len(position.get_rings(OPPONENT[stone]))
+            rows.append(row)
+
+        # The result is only known once the game has been replayed
+        result = position.get_game_state()
+        if result == 'UNFINISHED':
+            result = record.get_result()
+
+        for row in rows:
+            row["game"] = self._games
+            row["result"] = RESULTS.get(result, 0)
+            self._append(row)
+
+        self._games += 1
+
+    def _describe(self, position, ply, source, target):
+        """ Returns the columns of a move known before it is made. """
+        cells = position.get_cells()
+        stone = position.get_active()
+        source_row, source_col = divmod(source, SIZE)
+        target_row, target_col = divmod(target, SIZE)
+        row_delta, col_delta = target_row - source_row, target_col - source_col
+        stones = [cells[square] for square in FOOTPRINTS[source]]
+        source_squares = set(FOOTPRINTS[source])
+
+        captured = overwritten = gutter = 0
+        for square, moved in zip(FOOTPRINTS[target], stones):
+            if cells[square] == OPPONENT[stone]:
+                captured += 1
+            elif cells[square] == stone and square not in source_squares:
+                overwritten += 1
+            if moved != "" and square in GUTTER:
+                gutter += 1
+
+        return {
+            "ply": ply,
+            "stone": 0 if stone == 'b' else 1,
+            "source_row": source_row,
+            "source_col": source_col,
+            "target_row": target_row,
+            "target_col": target_col,
+            "row_direction": (row_delta > 0) - (row_delta < 0),
+            "col_direction": (col_delta > 0) - (col_delta < 0),
+            "distance": max(abs(row_delta), abs(col_delta)),
+            "stones": sum(1 for moved in stones if moved != ""),
+            "captured": captured,
+            "overwritten": overwritten,
+            "gutter": gutter,
+            "rings_before": len(position.get_rings(stone)),
+            "opponent_rings_before": len(position.get_rings(OPPONENT[stone]))
+        }
+
+    def _append(self, row):
+        """ Adds a row to the chunk, writing the chunk when it is full. """
+        for name, value in row.items():
+            self._chunk[name][self._filled] = value
+        self._filled += 1
+
+        if self._filled == self._chunk_size:
+            self.flush()
+
+    def flush(self):
+        """ Writes the rows collected so far. """
+        if self._filled == 0:
+            return
+
+        columns = {name: column[:self._filled] for name, column in self._chunk.items()}
+
+        if self._parquet:
+            table = pyarrow.table(columns)
+            if self._writer is None:
+                self._writer = pyarrow.parquet.ParquetWriter(self._output, table.schema)
+            self._writer.write_table(table)
+        else:
+            shard = os.path.join(self._output, "part-{:05d}".format(self._chunks))
+            os.makedirs(shard, exist_ok=True)
+            for name, column in columns.items():
+                np.save(os.path.join(shard, name + ".npy"), column)
+
+        self._rows += self._filled
+        self._chunks += 1
+        self._filled = 0
+
+    def close(self):
+        """ Writes the remaining rows and closes the output. """
+        self.flush()
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    @staticmethod
+    def open_shards(path):
+        """ Returns the shards of a directory of .npy shards, each memory
+            mapped, in the form [{name: array}]. """
+        shards = sorted(os.path.join(path, shard) for shard in os.listdir(path) if shard.startswith("part-"))
+
+        return [{name: np.load(os.path.join(shard, name + ".npy"), mmap_mode="r") for name, _ in
+                 MoveExporter.COLUMNS} for shard in shards]
+
+    @staticmethod
+    def read_shards(path):
+        """ Returns the columns of a directory of .npy shards joined, in the
+            form {name: array}. The columns are copied into memory; use
+            open_shards for exports too large for that. """
+        shards = MoveExporter.open_shards(path)
+
+        return {name: np.concatenate([shard[name] for shard in shards]) if shards else np.empty(0)
+                for name, _ in MoveExporter.COLUMNS}
+
+
+def main():
+    """ Exports the moves of the archives given on the command line. """
+    parser = argparse.ArgumentParser(description="Exports the moves of archived Gess games as columns.")
+    parser.add_argument("archives", nargs="+", help="archives with one game per line")
+    parser.add_argument("-o", "--output", default="moves", help="a Parquet file, or a directory of .npy shards")
+    parser.add_argument("--chunk-size", type=int, default=65536, help="the number of moves written at once")
+    parser.add_argument("--npy", action="store_true", help="write .npy shards even if pyarrow is installed")
+    args = parser.parse_args()
+
+    exporter = MoveExporter(args.output, args.chunk_size, not args.npy)
+    for path in args.archives:
+        exporter.add_archive(path)
+    exporter.close()
+
+    print("Exported", exporter.get_rows(), "moves of", exporter.get_games(), "games to", args.output,
+          "as Parquet" if exporter.is_parquet() else "as .npy shards")
+    if exporter.get_skipped():
+        print(exporter.get_skipped(), "games stopped at an illegal move")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Optional instrumentation of the hot paths of the game.  Counts
+#               calls and records their timings while a session is played.
+
+
+import functools
+import importlib
+import inspect
+import json
+import sys
+import time
+
+
+class Profiler:
+    """ Records the number of calls and the time taken by each call of the
+        methods in TARGETS.  Nothing is patched until install is called, so a
+        session without profiling runs the original methods.  Install before
+        the models and views are created; Qt connections made earlier keep
+        calling the original methods. """
+    TARGETS = (
+        ("models.Game", "Game", "make_move"),
+        ("models.Game", "Game", "update_rings"),
+        ("models.Board", "Board", "check_for_rings"),
+        ("controllers.BoardController", "BoardController", "handle_square_click"),
+        ("views.BoardView", "BoardView", "apply_changes")
+    )
+
+    def __init__(self):
+        # In the form {"Class.method": [nanoseconds]}
+        self._timings = {}
+        self._originals = []
+
+    def install(self):
+        """ Replaces each target with a timed wrapper. """
+        for module_name, class_name, method_name in self.TARGETS:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            original = getattr(cls, method_name)
+            self._originals.append((cls, method_name, original))
+            setattr(cls, method_name, self._wrap(class_name + "." + method_name, original))
+
+    def uninstall(self):
+        """ Restores the original methods. """
+        for cls, method_name, original in self._originals:
+            setattr(cls, method_name, original)
+        self._originals = []
+
+    def _wrap(self, name, method):
+        """ Returns method wrapped to record its timings under name. """
+        timings = self._timings.setdefault(name, [])
+
+        # Qt passes a slot only as many signal arguments as it accepts, which
+        # it reads from the slot's signature; the wrapper has to do the same
+        parameters = inspect.signature(method).parameters.values()
+        if any(parameter.kind == parameter.VAR_POSITIONAL for parameter in parameters):
+            accepted = None
+        else:
+            accepted = len(parameters)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return method(*args[:accepted], **kwargs)
+            finally:
+                timings.append(time.perf_counter_ns() - start)
+
+        return wrapper
+
+    def get_report(self):
+        """ Returns the statistics of each target called at least once in the
+            form {name: {"calls": n, "total_ms": t, "mean_us": t, "p50_us": t,
+            "p90_us": t, "p99_us": t, "max_us": t}}. """
+        report = {}
+
+        for name, timings in self._timings.items():
+            if not timings:
+                continue
+
+            ordered = sorted(timings)
+            report[name] = {
+                "calls": len(ordered),
+                "total_ms": sum(ordered) / 1e6,
+                "mean_us": sum(ordered) / len(ordered) / 1e3,
+                "p50_us": self.percentile(ordered, 50) / 1e3,
+                "p90_us": self.percentile(ordered, 90) / 1e3,
+                "p99_us": self.percentile(ordered, 99) / 1e3,
+                "max_us": ordered[-1] / 1e3
+            }
+
+        return report
+
+    @staticmethod
+    def percentile(ordered, percent):
+        """ Returns the nearest rank percentile of a sorted list. """
+        rank = max(0, -(-len(ordered) * percent // 100) - 1)
+        return ordered[rank]
+
+    def dump(self, path=None):
+        """ Writes the report as JSON to path, or as a table to stderr. """
+        report = self.get_report()
+
+        if path is not None:
+            with open(path, "w") as output:
+                json.dump(report, output, indent=2)
+            return
+
+        print("{:38} {:>8} {:>10} {:>9} {:>9} {:>9} {:>9}".format(
+            "", "calls", "total ms", "mean us", "p50 us", "p90 us", "p99 us"), file=sys.stderr)
+        for name, stats in sorted(report.items(), key=lambda item: -item[1]["total_ms"]):
+            print("{:38} {calls:>8} {total_ms:>10.1f} {mean_us:>9.1f} {p50_us:>9.1f} {p90_us:>9.1f} {p99_us:>9.1f}"
+                  .format(name, **stats), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    pass
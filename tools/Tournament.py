@@ -0,0 +1,321 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Plays round robin matches between engine configurations over a
+#               process pool and estimates their Elo differences.
+
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import math
+import os
+import random
+from engine.Search import Search
+from models.IllegalMove import IllegalMove
+from models.Position import Position
+
+
+# Scores for the first engine of a pair
+WIN = 1.0
+DRAW = 0.5
+LOSS = 0.0
+
+
+def play_game(task):
+    """ Plays one game and returns its result. task is a dict with the keys
+        black and white, each a dict of Search arguments with a name; seed,
+        for the random opening moves; opening_plies; and max_plies, after which
+        the game is a draw, along with the pair, first and game it belongs to.
+        Runs in the worker processes. """
+    engines = {}
+    for stone in ('b', 'w'):
+        settings = dict(task[{'b': "black", 'w': "white"}[stone]])
+        settings.pop("name", None)
+        engines[stone] = Search(**settings)
+
+    position = Position()
+    moves = []
+
+    # Both games of a pair of colors start from the same random opening
+    opening = random.Random(task["seed"])
+    for _ in range(task["opening_plies"]):
+        legal_moves = position.legal_moves()
+        if not legal_moves:
+            break
+        move = opening.choice(legal_moves)
+        position.make_move(*move)
+        moves.append(move)
+
+    while position.get_game_state() == 'UNFINISHED' and len(moves) < task["max_plies"]:
+        move = engines[position.get_active()].search(position)[0]
+        if move is None:
+            break
+        try:
+            position.make_move(*move)
+        except IllegalMove:
+            break
+        moves.append(move)
+
+    return {
+        "pair": task["pair"],
+        "first": task["first"],
+        "game": task["game"],
+        "black": task["black"]["name"],
+        "white": task["white"]["name"],
+        "result": position.get_game_state() if position.get_game_state() != 'UNFINISHED' else "DRAW",
+        "plies": len(moves)
+    }
+
+
+class Tournament:
+    """ Plays games between every pair of engine configurations.  The engines
+        swap colors every game and each two games share a random opening.
+        Results are appended to the results file as they finish, one JSON
+        object per line, so an interrupted tournament resumes where it stopped.
+        A pair stops early once its sequential probability ratio test decides
+        between elo0 and elo1. configs is a list of dicts of Search arguments,
+        each with a name. """
+
+    def __init__(self, configs, results_path, games=100, processes=None, opening_plies=4, max_plies=200,
+                 elo0=0, elo1=10, alpha=0.05, beta=0.05):
+        self._configs = configs
+        self._results_path = results_path
+        self._games = games
+        self._processes = processes or os.cpu_count()
+        self._opening_plies = opening_plies
+        self._max_plies = max_plies
+        self._elo0 = elo0
+        self._elo1 = elo1
+        self._alpha = alpha
+        self._beta = beta
+
+        # In the form {pair: [results]}
+        self._results = {}
+        if os.path.exists(results_path):
+            self._load_results()
+
+    def _load_results(self):
+        """ Reads the results of an earlier run. A last line without a newline
+            was cut off when the run was interrupted, so it is removed from the
+            file before more results are appended. """
+        with open(self._results_path, "rb+") as results_file:
+            data = results_file.read()
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                results_file.truncate(complete)
+
+        for line in data[:complete].decode().splitlines():
+            if line.strip():
+                result = json.loads(line)
+                self._results.setdefault(result["pair"], []).append(result)
+
+    def get_pairs(self):
+        """ Returns every pair of configuration names in the form "first-second". """
+        return [first["name"] + "-" + second["name"] for first, second in itertools.combinations(self._configs, 2)]
+
+    def get_results(self, pair):
+        """ Returns the results recorded for a pair. """
+        return self._results.get(pair, [])
+
+    def get_score(self, pair):
+        """ Returns (wins, draws, losses) of the first engine of a pair. """
+        counts = [0, 0, 0]
+
+        for result in self.get_results(pair):
+            score = self.score_result(result, result["first"])
+            counts[{WIN: 0, DRAW: 1, LOSS: 2}[score]] += 1
+
+        return tuple(counts)
+
+    def is_decided(self, pair):
+        """ Returns True if the pair has played all its games or the test has
+            accepted one of its hypotheses. """
+        wins, draws, losses = self.get_score(pair)
+
+        return wins + draws + losses >= self._games or self.sprt(wins, draws, losses) is not None
+
+    def run(self, callback=None):
+        """ Plays the remaining games of every pair. callback is called with
+            each result as it is recorded. """
+        tasks = iter(self._tasks())
+
+        if self._processes == 1:
+            for task in tasks:
+                if not self.is_decided(task["pair"]):
+                    self._record(play_game(task), callback)
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(self._processes) as pool:
+            running = set()
+            while True:
+                # Keep only a couple of games per process queued, so games of
+                # pairs which stop early are never started
+                for task in tasks:
+                    if not self.is_decided(task["pair"]):
+                        running.add(pool.submit(play_game, task))
+                    if len(running) >= self._processes * 2:
+                        break
+
+                if not running:
+                    break
+
+                done, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    self._record(future.result(), callback)
+
+    def _tasks(self):
+        """ Yields the games not yet played, in order of the game number so
+            every pair makes progress. """
+        configs = list(itertools.combinations(self._configs, 2))
+        played = {(result["pair"], result["game"]) for results in self._results.values() for result in results}
+
+        for game in range(self._games):
+            for first, second in configs:
+                pair = first["name"] + "-" + second["name"]
+                if (pair, game) in played:
+                    continue
+
+                black, white = (first, second) if game % 2 == 0 else (second, first)
+                yield {
+                    "pair": pair,
+                    "game": game,
+                    "black": black,
+                    "white": white,
+                    "first": first["name"],
+                    "seed": self._seed(pair, game // 2),
+                    "opening_plies": self._opening_plies,
+                    "max_plies": self._max_plies
+                }
+
+    @staticmethod
+    def _seed(pair, opening):
+        """ Returns a seed for the opening which is the same in every process. """
+        return sum(ord(character) * 31 ** i for i, character in enumerate(pair)) % (1 << 31) + opening
+
+    def _record(self, result, callback):
+        """ Appends a result to the results file. """
+        self._results.setdefault(result["pair"], []).append(result)
+
+        with open(self._results_path, "a") as results_file:
+            results_file.write(json.dumps(result) + "\n")
+
+        if callback is not None:
+            callback(result)
+
+    def sprt(self, wins, draws, losses):
+        """ Returns "H1" if the first engine is at least elo1 stronger, "H0" if
+            it is at most elo0 stronger, or None while the test is undecided. """
+        llr = self.log_likelihood_ratio(wins, draws, losses, self._elo0, self._elo1)
+        if llr is None:
+            return None
+
+        if llr >= math.log((1 - self._beta) / self._alpha):
+            return "H1"
+        if llr <= math.log(self._beta / (1 - self._alpha)):
+            return "H0"
+
+        return None
+
+    @staticmethod
+    def score_result(result, name):
+        """ Returns the score of the engine called name in a result. """
+        if result["result"] == "DRAW":
+            return DRAW
+
+        winner = result["black"] if result["result"] == "BLACK_WON" else result["white"]
+
+        return WIN if winner == name else LOSS
+
+    @staticmethod
+    def expected_score(elo):
+        """ Returns the expected score of an engine elo points stronger. """
+        return 1 / (1 + 10 ** (-elo / 400))
+
+    @staticmethod
+    def log_likelihood_ratio(wins, draws, losses, elo0, elo1):
+        """ Returns the log likelihood ratio of elo1 against elo0 using the
+            normal approximation of the game scores, or None before any game.
+            Scores of a single kind, such as a clean sweep, have no variance,
+            so half a win and half a loss are added to them. """
+        games = wins + draws + losses
+        if games == 0:
+            return None
+
+        if wins == games or draws == games or losses == games:
+            wins, losses, games = wins + 0.5, losses + 0.5, games + 1
+
+        score = (wins + draws / 2) / games
+        variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+
+        score0 = Tournament.expected_score(elo0)
+        score1 = Tournament.expected_score(elo1)
+
+        return games * (score1 - score0) * (2 * score - score0 - score1) / (2 * variance)
+
+    @staticmethod
+    def elo(wins, draws, losses, z=1.96):
+        """ Returns (elo, low, high): the Elo difference for a score and its
+            confidence interval, z standard errors wide. Bounds are infinite
+            when the score is all wins or all losses. """
+        games = wins + draws + losses
+        if games == 0:
+            return 0.0, -math.inf, math.inf
+
+        score = (wins + draws / 2) / games
+        variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+        error = math.sqrt(variance / games)
+
+        return Tournament.score_to_elo(score), Tournament.score_to_elo(score - z * error), \
+            Tournament.score_to_elo(score + z * error)
+
+    @staticmethod
+    def score_to_elo(score):
+        """ Returns the Elo difference giving an expected score. """
+        if score <= 0:
+            return -math.inf
+        if score >= 1:
+            return math.inf
+
+        return -400 * math.log10(1 / score - 1)
+
+    def get_report(self):
+        """ Returns a line of results for every pair. """
+        lines = []
+
+        for pair in self.get_pairs():
+            wins, draws, losses = self.get_score(pair)
+            elo, low, high = self.elo(wins, draws, losses)
+            lines.append("{:32} {:>5} games  +{} ={} -{}  Elo {:+.1f} [{:+.1f}, {:+.1f}]  {}".format(
+                pair, wins + draws + losses, wins, draws, losses, elo, low, high,
+                self.sprt(wins, draws, losses) or ""))
+
+        return lines
+
+
+def main():
+    """ Runs a tournament between the configurations in a JSON file. """
+    parser = argparse.ArgumentParser(description="Plays Gess engine configurations against each other.")
+    parser.add_argument("configs", help="a JSON list of Search arguments, each with a name")
+    parser.add_argument("-o", "--output", default="tournament.jsonl", help="the results file, resumed if it exists")
+    parser.add_argument("--games", type=int, default=100, help="the most games per pair")
+    parser.add_argument("--processes", type=int, help="the number of games played at once")
+    parser.add_argument("--opening-plies", type=int, default=4, help="the number of random opening moves")
+    parser.add_argument("--max-plies", type=int, default=200, help="the length of a game counted as a draw")
+    parser.add_argument("--elo0", type=float, default=0, help="the Elo difference of the null hypothesis")
+    parser.add_argument("--elo1", type=float, default=10, help="the Elo difference of the alternative")
+    args = parser.parse_args()
+
+    with open(args.configs) as configs_file:
+        configs = json.load(configs_file)
+
+    tournament = Tournament(configs, args.output, args.games, args.processes, args.opening_plies,
+                            args.max_plies, args.elo0, args.elo1)
+    tournament.run(lambda result: print(result["pair"], result["game"], result["result"], flush=True))
+
+    for line in tournament.get_report():
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
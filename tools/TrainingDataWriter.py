@@ -0,0 +1,270 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Writes positions of archived or self-played games as shuffled,
+#               sharded NumPy arrays of input planes, target moves and results
+#               for training networks.
+
+
+import argparse
+import concurrent.futures
+import os
+import random
+import numpy as np
+from engine.Search import Search
+from models.GameRecord import GameRecord
+from models.IllegalMove import IllegalMove
+from models.Notation import Notation
+from models.Position import Position
+from models.PositionCodec import PositionCodec
+
+
+def self_play(task):
+    """ Plays one game of Search against itself after a few random opening
+        moves. task is a dict with the keys seed, opening_plies, max_plies and
+        settings, a dict of Search arguments. Returns the GameRecord. Runs in
+        the worker processes. """
+    search = Search(**task["settings"])
+    opening = random.Random(task["seed"])
+    position = Position()
+    moves = []
+
+    while position.get_game_state() == 'UNFINISHED' and len(moves) < task["max_plies"]:
+        if len(moves) < task["opening_plies"]:
+            legal_moves = position.legal_moves()
+            move = opening.choice(legal_moves) if legal_moves else None
+        else:
+            move = search.search(position)[0]
+        if move is None:
+            break
+        try:
+            position.make_move(*move)
+        except IllegalMove:
+            break
+        moves.append((Notation.from_center(move[0]), Notation.from_center(move[1])))
+
+    return GameRecord(moves, position.get_game_state())
+
+
+class TrainingDataWriter:
+    """ Replays games with the rules of Position and writes a sample for every
+        move: the position before it, the move as the centers of its source
+        and target, and the result of the game for the player to move, 1 for a
+        win, -1 for a loss and 0 for an unfinished game.  Samples pass through
+        a shuffle buffer of buffer_size samples, held as PositionCodec records,
+        so the samples of a game are spread over the output while memory stays
+        bounded.  They are written shard_size at a time to a directory of
+        shards, each a directory of .npy files named after COLUMNS, which
+        open_shards memory maps.  Planes are uint8 arrays of shape
+        (samples, 4, SIZE, SIZE), ready to be fed to a trainer. """
+    COLUMNS = (
+        ("planes", np.uint8),               # See PositionCodec.to_planes
+        ("source", np.int16),               # Centers as flat indices, row * SIZE + col
+        ("target", np.int16),
+        ("result", np.int8)                 # For the player to move
+    )
+
+    def __init__(self, output, shard_size=65536, buffer_size=262144, seed=0):
+        self._output = output
+        self._shard_size = shard_size
+        self._random = np.random.default_rng(seed)
+        self._shards = 0
+        self._samples = 0
+        self._games = 0
+        self._skipped = 0
+
+        self._buffer = self._allocate(buffer_size)
+        self._buffered = 0
+        self._shard = self._allocate(shard_size)
+        self._filled = 0
+
+    def get_samples(self):
+        """ Returns the number of samples written so far. """
+        return self._samples
+
+    def get_games(self):
+        """ Returns the number of games added so far. """
+        return self._games
+
+    def get_skipped(self):
+        """ Returns the number of games stopped early by an illegal move. """
+        return self._skipped
+
+    def add_archive(self, path):
+        """ Adds every game of an archive. """
+        for record in GameRecord.read_archive(path):
+            self.add_game(record)
+
+    def add_history(self, history, result='UNFINISHED'):
+        """ Adds the moves kept by a History. """
+        moves = [(Notation.to_notation(move.get_source()), Notation.to_notation(move.get_target()))
+                 for move in history.get_history()]
+        self.add_game(GameRecord(moves, result))
+
+    def add_self_play(self, games, settings=None, seed=0, opening_plies=4, max_plies=200, processes=1):
+        """ Plays games of Search with the passed arguments against itself, in
+            processes worker processes, and adds them. """
+        tasks = [{"seed": seed + game, "opening_plies": opening_plies, "max_plies": max_plies,
+                  "settings": settings or {}} for game in range(games)]
+
+        if processes == 1:
+            for task in tasks:
+                self.add_game(self_play(task))
+            return
+
+        with concurrent.futures.ProcessPoolExecutor(processes) as pool:
+            for record in pool.map(self_play, tasks):
+                self.add_game(record)
+
+    def add_game(self, record):
+        """ Adds the moves of a GameRecord up to the first illegal or
+            unreadable move. """
+        position = Position()
+        positions = []
+        moves = []
+
+        for origin, destination in record.get_moves():
+            try:
+                source, target = Notation.to_center(origin), Notation.to_center(destination)
+            except ValueError:
+                self._skipped += 1
+                break
+            if not position.is_legal_move(source, target):
+                self._skipped += 1
+                break
+
+            before = position.copy()
+            try:
+                position.make_move(source, target)
+            except IllegalMove:
+                self._skipped += 1
+                break
+            positions.append(before)
+            moves.append((source, target))
+
+        self._games += 1
+        if not positions:
+            return
+
+        # The result is only known once the game has been replayed
+        result = position.get_game_state()
+        if result == 'UNFINISHED':
+            result = record.get_result()
+        winner = {'BLACK_WON': 'b', 'WHITE_WON': 'w'}.get(result)
+
+        samples = {
+            "records": PositionCodec.encode(positions),
+            "source": np.array([source for source, _ in moves], dtype=np.int16),
+            "target": np.array([target for _, target in moves], dtype=np.int16),
+            "result": np.array([0 if winner is None else 1 if p.get_active() == winner else -1 for p in positions],
+                               dtype=np.int8)
+        }
+        self._shuffle(samples)
+
+    def _shuffle(self, samples):
+        """ Puts samples into the shuffle buffer. Once it is full each sample
+            takes the place of a random one, which is written out. """
+        count = len(samples["result"])
+        capacity = len(self._buffer["result"])
+
+        # Fill the free space first
+        free = min(count, capacity - self._buffered)
+        for name, column in samples.items():
+            self._buffer[name][self._buffered:self._buffered + free] = column[:free]
+        self._buffered += free
+
+        # Games longer than the buffer are taken in parts, as slots are drawn
+        # without replacement
+        for start in range(free, count, capacity):
+            stop = min(count, start + capacity)
+            slots = self._random.choice(capacity, stop - start, replace=False)
+            self._write({name: column[slots] for name, column in self._buffer.items()})
+            for name, column in samples.items():
+                self._buffer[name][slots] = column[start:stop]
+
+    def _write(self, samples):
+        """ Adds samples to the shard being filled, writing it when it is full. """
+        count = len(samples["result"])
+        start = 0
+
+        while start < count:
+            taken = min(count - start, self._shard_size - self._filled)
+            for name, column in samples.items():
+                self._shard[name][self._filled:self._filled + taken] = column[start:start + taken]
+            self._filled += taken
+            start += taken
+
+            if self._filled == self._shard_size:
+                self.flush()
+
+    def flush(self):
+        """ Writes the samples of the shard being filled. """
+        if self._filled == 0:
+            return
+
+        columns = {name: column[:self._filled] for name, column in self._shard.items()}
+        columns["planes"] = PositionCodec.to_planes(columns.pop("records"))
+
+        shard = os.path.join(self._output, "shard-{:05d}".format(self._shards))
+        os.makedirs(shard, exist_ok=True)
+        for name, _ in self.COLUMNS:
+            np.save(os.path.join(shard, name + ".npy"), columns[name])
+
+        self._samples += self._filled
+        self._shards += 1
+        self._filled = 0
+
+    def close(self):
+        """ Writes the samples left in the shuffle buffer, in random order, and
+            the last shard. """
+        order = self._random.permutation(self._buffered)
+        self._write({name: column[:self._buffered][order] for name, column in self._buffer.items()})
+        self._buffered = 0
+        self.flush()
+
+    @staticmethod
+    def open_shards(path):
+        """ Returns the shards of a directory, each memory mapped, in the form
+            [{name: array}]. """
+        shards = sorted(os.path.join(path, shard) for shard in os.listdir(path) if shard.startswith("shard-"))
+
+        return [{name: np.load(os.path.join(shard, name + ".npy"), mmap_mode="r") for name, _ in
+                 TrainingDataWriter.COLUMNS} for shard in shards]
+
+    @staticmethod
+    def _allocate(size):
+        """ Returns empty columns of size samples, positions held as records. """
+        columns = {"records": np.empty((size, PositionCodec.RECORD_BYTES), dtype=np.uint8)}
+        columns.update((name, np.empty(size, dtype=dtype)) for name, dtype in TrainingDataWriter.COLUMNS[1:])
+
+        return columns
+
+
+def main():
+    """ Writes the samples of the archives given on the command line, and of
+        self-played games. """
+    parser = argparse.ArgumentParser(description="Writes Gess positions as shuffled training data shards.")
+    parser.add_argument("archives", nargs="*", help="archives with one game per line")
+    parser.add_argument("-o", "--output", default="training", help="the directory of shards to write")
+    parser.add_argument("--shard-size", type=int, default=65536, help="the number of samples per shard")
+    parser.add_argument("--buffer-size", type=int, default=262144, help="the number of samples shuffled at once")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the shuffle and of self-play openings")
+    parser.add_argument("--self-play", type=int, default=0, metavar="GAMES", help="the number of games to self-play")
+    parser.add_argument("--depth", type=int, default=1, help="the search depth of self-play")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="the number of worker processes for self-play")
+    args = parser.parse_args()
+
+    writer = TrainingDataWriter(args.output, args.shard_size, args.buffer_size, args.seed)
+    for path in args.archives:
+        writer.add_archive(path)
+    if args.self_play:
+        writer.add_self_play(args.self_play, {"depth": args.depth}, args.seed, processes=args.processes)
+    writer.close()
+
+    print("Wrote", writer.get_samples(), "samples of", writer.get_games(), "games to", args.output)
+    if writer.get_skipped():
+        print(writer.get_skipped(), "games stopped at an illegal move")
+
+
+if __name__ == "__main__":
+    main()
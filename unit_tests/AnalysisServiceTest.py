@@ -0,0 +1,75 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the AnalysisService
+
+
+from controllers.BoardController import BoardController
+from engine.AnalysisService import AnalysisService
+from models.Board import Board
+from models.Game import Game
+from models.Notation import Notation
+from models.Player import Player
+from models.Position import Position
+from PySide2.QtCore import QCoreApplication
+import time
+import unittest
+
+
+class AnalysisServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+        self.game = Game((Player('b'), Player('w')), Board())
+        self.controller = BoardController(self.game)
+        self.service = AnalysisService(self.game, depth=1)
+        self.updates = []
+        self.finished = []
+        self.service.analysis_updated.connect(lambda *update: self.updates.append(update))
+        self.service.analysis_finished.connect(lambda: self.finished.append(len(self.updates)))
+
+    def tearDown(self):
+        self.service.shutdown()
+
+    def wait_until_finished(self, count, timeout=30):
+        """ Runs the event loop until the analysis has finished count times. """
+        start = time.monotonic()
+        while len(self.finished) < count and time.monotonic() - start < timeout:
+            self.app.processEvents()
+            time.sleep(0.01)
+
+    def test_start(self):
+        """ Tests receiving a legal principal variation for the game's position. """
+        self.service.start()
+        self.wait_until_finished(1)
+
+        depth, score, variation, nodes = self.updates[-1]
+        origin, destination = variation[0].split("-")
+        self.assertEqual(1, depth)
+        self.assertGreater(nodes, 0)
+        self.assertIn((Notation.to_center(origin), Notation.to_center(destination)), Position().legal_moves())
+
+    def test_restart(self):
+        """ Tests that a move restarts the analysis for the new position. """
+        self.service.start()
+        self.game.make_move(self.controller.get_piece((14, 11)), self.controller.get_piece((11, 11)))
+        self.wait_until_finished(1)
+
+        origin = self.updates[-1][2][0].split("-")[0]
+        self.assertTrue(Position.from_game(self.game).is_player_piece(Notation.to_center(origin), 'w'))
+
+    def test_stop(self):
+        """ Tests that nothing is emitted after stopping. """
+        self.service.start()
+        self.service.stop()
+        self.wait_until_finished(1, 2)
+
+        self.assertFalse(self.service.is_running())
+        self.assertEqual([], self.updates)
+
+
+def main():
+    """ Runs unit tests for the AnalysisService class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,8 @@
 # Description:  Unit tests for the Board of a Gess game
 
 
-from Gess import Board, Player, IllegalMove
+from Gess import Board, Player
+from models.IllegalMove import IllegalMove
 import unittest
 
 
@@ -626,6 +627,43 @@ class BoardTest(unittest.TestCase):
 
         self.assertDictEqual(expected_piece, b.get_piece(square))
 
+    def test_get_stones1(self):
+        """ Tests the stones counted on a new board. """
+        b = Board()
+
+        self.assertEqual(43, b.get_stones('b'))
+        self.assertEqual(43, b.get_stones('w'))
+        self.assertEqual(0, b.get_stones_lost('b'))
+
+    def test_get_stones2(self):
+        """ Tests that stones are counted as pieces are removed, placed and
+            pushed into the gutter. """
+        b = Board()
+
+        b.remove_piece({(1, 1): "", (1, 2): "w", (1, 3): ""})
+        self.assertEqual(42, b.get_stones('w'))
+
+        b.place_piece({(5, 0): "b", (5, 1): "b", (1, 4): "b"})
+        self.assertEqual(46, b.get_stones('b'))
+        self.assertEqual(41, b.get_stones('w'))
+
+        b.clear_gutter()
+        self.assertEqual(45, b.get_stones('b'))
+        self.assertEqual(2, b.get_stones_lost('w'))
+
+    def test_get_stones3(self):
+        """ Tests that the counts match the squares after a move. """
+        b = Board()
+        origin = {(r, c): b.get_squares()[r][c] for r in (15, 16, 17) for c in (10, 11, 12)}
+        target = {(r, c): b.get_squares()[r][c] for r in (2, 3, 4) for c in (10, 11, 12)}
+
+        b.move_piece(origin, target)
+        b.clear_gutter()
+
+        for stone in ('b', 'w'):
+            self.assertEqual(sum(row.count(stone) for row in b.get_squares()), b.get_stones(stone))
+
+
 def main():
     unittest.main()
 
@@ -0,0 +1,69 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for removing repeated games from archives
+
+
+from models.GameRecord import GameRecord
+from models.Notation import Notation
+from tools.Deduplicator import Deduplicator
+import os
+import tempfile
+import unittest
+
+
+class DeduplicatorTest(unittest.TestCase):
+    def test_add_game(self):
+        """ Tests that a repeated game is found and a different result is not. """
+        d = Deduplicator(count_positions=True)
+
+        self.assertTrue(d.add_game(GameRecord([('l6', 'l9'), ('c15', 'c12')], 'UNFINISHED')))
+        self.assertFalse(d.add_game(GameRecord([('l6', 'l9'), ('c15', 'c12')], 'UNFINISHED')))
+        self.assertTrue(d.add_game(GameRecord([('l6', 'l9'), ('c15', 'c12')], 'BLACK_WON')))
+        self.assertTrue(d.add_game(GameRecord([('l6', 'l9')], 'UNFINISHED')))
+
+        self.assertEqual(4, d.get_games())
+        self.assertEqual(1, d.get_duplicates())
+        self.assertEqual(2, d.get_positions())
+        self.assertIsNone(Deduplicator().get_positions())
+
+    def test_add_game_illegal(self):
+        """ Tests that moves after an illegal one are compared as written. """
+        d = Deduplicator()
+
+        self.assertTrue(d.add_game(GameRecord([('l6', 'l9'), ('a1', 'a2')])))
+        self.assertTrue(d.add_game(GameRecord([('l6', 'l9'), ('a1', 'a3')])))
+        self.assertFalse(d.add_game(GameRecord([('l6', 'l9'), ('a1', 'a3')])))
+
+    def test_add_game_unreadable(self):
+        """ Tests that squares off the board are compared as written. """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.txt")
+            with open(path, "w") as archive:
+                archive.write("BLACK_WON\tc3-c4 q99-c5\nBLACK_WON\tc3-c4 zz-c5\nBLACK_WON\tc3-c4 zz-c5\n")
+
+            d = Deduplicator()
+            records = list(d.filter_archive(path))
+
+        self.assertEqual(2, len(records))
+        self.assertEqual(3, d.get_games())
+        self.assertRaises(ValueError, Notation.to_center, 'c0')
+
+    def test_filter_archive(self):
+        """ Tests that only the first of each game is kept. """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.txt")
+            GameRecord.write_archive(path, [GameRecord([('l6', 'l9')]), GameRecord([('f6', 'f9')]),
+                                            GameRecord([('l6', 'l9')])])
+
+            records = list(Deduplicator().filter_archive(path))
+
+        self.assertListEqual([[('l6', 'l9')], [('f6', 'f9')]], [record.get_moves() for record in records])
+
+
+def main():
+    """ Runs unit tests for the Deduplicator class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
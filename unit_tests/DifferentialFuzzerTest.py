@@ -0,0 +1,77 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for comparing rules engines against the reference rules
+
+
+from models.Notation import Notation
+from models.Position import Position, SIZE
+from tools.DifferentialFuzzer import DifferentialFuzzer, generate, play
+import unittest
+
+
+class ShortPosition(Position):
+    """ A Position which wrongly refuses moves of more than 3 rows. """
+    def is_legal_move(self, source, target):
+        if abs(source // SIZE - target // SIZE) > 3:
+            return False
+
+        return super(ShortPosition, self).is_legal_move(source, target)
+
+
+ENGINE = __name__ + ":ShortPosition"
+
+
+class DifferentialFuzzerTest(unittest.TestCase):
+    def test_generate(self):
+        """ Tests that sequences are the same for a seed and include illegal moves. """
+        moves = generate(3, 100)
+
+        self.assertListEqual(moves, generate(3, 100))
+        self.assertEqual(100, len([move for move in moves if move is not None]))
+        self.assertIsNone(play(Position, [move for move in moves if move is not None][:20]))
+
+    def test_play(self):
+        """ Tests that an engine refusing a legal move is caught at that ply. """
+        moves = [(Notation.to_center(origin), Notation.to_center(destination))
+                 for origin, destination in [('f8', 'f7'), ('i15', 'i12'), ('c2', 'b3'), ('i18', 'i14')]]
+
+        self.assertIsNone(play(ShortPosition, moves[:3]))
+        difference = play(ShortPosition, moves)
+
+        self.assertEqual(3, difference["ply"])
+        self.assertEqual("accepted", difference["field"])
+        self.assertTrue(difference["reference"])
+
+    def test_run(self):
+        """ Tests that the engine agrees with the reference rules. """
+        fuzzer = DifferentialFuzzer(plies=60, processes=1, batch_size=2)
+        fuzzer.run(sequences=4)
+
+        self.assertListEqual([], fuzzer.get_failures())
+        self.assertEqual(4, fuzzer.get_sequences())
+        self.assertEqual(240, fuzzer.get_played())
+
+    def test_shrink(self):
+        """ Tests that a failing sequence is shrunk until removing any one move
+            makes it pass. """
+        fuzzer = DifferentialFuzzer(ENGINE, plies=60, processes=1)
+        failures = []
+        fuzzer.run(sequences=2, callback=failures.append)
+
+        self.assertTrue(failures)
+        for failure in failures:
+            moves = failure["moves"]
+            self.assertLessEqual(len(moves), 10)
+            self.assertIsNotNone(play(ShortPosition, moves))
+            self.assertEqual(len(moves) - 1, failure["difference"]["ply"])
+            for ply in range(len(moves)):
+                self.assertIsNone(play(ShortPosition, moves[:ply] + moves[ply + 1:]))
+
+
+def main():
+    """ Runs unit tests for the DifferentialFuzzer class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the EndgameSolver
+
+
+from engine.EndgameSolver import EndgameSolver, WIN, LOSS, UNKNOWN
+from models.Notation import Notation
+from models.Position import Position
+import os
+import tempfile
+import unittest
+
+
+def play(moves):
+    """ Returns the Position after the moves in notation. """
+    p = Position()
+    for origin, destination in moves:
+        p.make_move(Notation.to_center(origin), Notation.to_center(destination))
+
+    return p
+
+
+# Black can break white's ring with l13 - l16
+ENDGAME = [('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12'), ('c12', 'c9'), ('l12', 'l13'), ('c9', 'c8')]
+
+
+class EndgameSolverTest(unittest.TestCase):
+    def test_solve1(self):
+        """ Tests finding a win in one move. """
+        s = EndgameSolver()
+        p = play(ENDGAME)
+
+        result, plies, move = s.solve(p, 1)
+
+        self.assertEqual((WIN, 1), (result, plies))
+        p.make_move(*move)
+        self.assertEqual('BLACK_WON', p.get_game_state())
+
+    def test_solve2(self):
+        """ Tests that a finished game is lost for the player to move. """
+        s = EndgameSolver()
+        p = play(ENDGAME + [('l13', 'l16')])
+
+        self.assertEqual((LOSS, 0, None), s.solve(p, 3))
+
+    def test_solve3(self):
+        """ Tests that the opening is not solved at a shallow depth. """
+        s = EndgameSolver()
+
+        self.assertEqual(UNKNOWN, s.solve(Position(), 1)[0])
+        self.assertIsNone(s.probe(Position()))
+
+    def test_solve4(self):
+        """ Tests that a position with too many rings is not searched. """
+        s = EndgameSolver(max_rings=1)
+
+        self.assertTupleEqual((UNKNOWN, 0, None), s.solve(Position(), 3))
+        self.assertEqual(0, s.get_nodes())
+
+    def test_find_winning_move(self):
+        """ Tests that no winning move exists in the opening. """
+        s = EndgameSolver()
+
+        self.assertIsNone(s.find_winning_move(Position()))
+        self.assertIsNotNone(s.find_winning_move(play(ENDGAME)))
+
+    def test_save_cache(self):
+        """ Tests that proven results are reused from the cache file. """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solved.bin")
+            p = play(ENDGAME)
+
+            s1 = EndgameSolver(cache_path=path)
+            expected = s1.solve(p, 1)
+            s1.save_cache()
+
+            s2 = EndgameSolver(cache_path=path)
+
+            self.assertEqual(expected, s2.probe(p))
+            self.assertTrue(s2.is_endgame(p))
+
+
+def main():
+    """ Runs unit tests for the EndgameSolver class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the EnginePlayer
+
+
+from controllers.BoardController import BoardController
+from engine.EnginePlayer import EnginePlayer
+from engine.TimeControl import TimeControl
+from models.Board import Board
+from models.Game import Game
+from models.Notation import Notation
+from models.Player import Player
+from models.Position import Position
+from PySide2.QtCore import QCoreApplication
+import time
+import unittest
+
+
+class EnginePlayerTest(unittest.TestCase):
+    def setUp(self):
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+        self.game = Game((Player('b'), Player('w')), Board())
+        self.controller = BoardController(self.game)
+        self.engine = EnginePlayer(self.game, self.controller, 'w', TimeControl(total=120, moves_to_go=10),
+                                   max_depth=2)
+        self.moves = []
+        self.predictions = []
+        self.ponders = []
+        self.engine.move_played.connect(lambda origin, destination: self.moves.append((origin, destination)))
+        self.engine.pondering_started.connect(self.predictions.append)
+        self.engine.ponder_finished.connect(self.ponders.append)
+
+    def tearDown(self):
+        self.engine.shutdown()
+
+    def play(self, origin, destination):
+        """ Makes a move for the player. """
+        self.game.make_move(self.controller.get_piece(Notation.to_indices(origin)),
+                            self.controller.get_piece(Notation.to_indices(destination)))
+
+    def wait_for_moves(self, count, timeout=60):
+        """ Runs the event loop until the engine has played count moves. """
+        start = time.monotonic()
+        while len(self.moves) < count and time.monotonic() - start < timeout:
+            self.app.processEvents()
+            time.sleep(0.01)
+
+    def test_start(self):
+        """ Tests that the engine answers a move with a legal one and ponders
+            the reply it expects. """
+        self.engine.start()
+        self.play('l6', 'l9')
+        position = Position.from_game(self.game)
+        self.assertFalse(self.controller.is_enabled())
+
+        self.wait_for_moves(1)
+
+        origin, destination = self.moves[0]
+        self.assertIn((Notation.to_center(origin), Notation.to_center(destination)), position.legal_moves())
+        self.assertEqual('b', self.game.get_active_player().get_stone())
+        self.assertTrue(self.controller.is_enabled())
+        self.assertLess(self.engine.get_time_control().get_remaining('w'), 120)
+        self.assertEqual(1, len(self.predictions))
+        self.assertTrue(self.engine.is_pondering())
+
+    def test_ponder_hit(self):
+        """ Tests that playing the expected reply continues the ponder search. """
+        self.engine.start()
+        self.play('l6', 'l9')
+        self.wait_for_moves(1)
+
+        self.play(*self.predictions[0].split("-"))
+        self.wait_for_moves(2)
+
+        self.assertListEqual([True], self.ponders)
+        self.assertEqual(1, self.engine.get_ponder_hits())
+        self.assertEqual(2, len(self.moves))
+
+    def test_ponder_miss(self):
+        """ Tests that another reply starts a new search. """
+        self.engine.start()
+        self.play('l6', 'l9')
+        self.wait_for_moves(1)
+
+        position = Position.from_game(self.game)
+        reply = next(move for move in position.legal_moves()
+                     if "-".join(map(Notation.from_center, move)) != self.predictions[0])
+        self.play(*map(Notation.from_center, reply))
+        self.wait_for_moves(2)
+
+        self.assertListEqual([False], self.ponders)
+        self.assertEqual(0, self.engine.get_ponder_hits())
+        self.assertEqual(2, len(self.moves))
+
+    def test_paused(self):
+        """ Tests that a move found while paused is held, the board left as the
+            pausing side set it, until play resumes. """
+        self.engine.start()
+        self.play('l6', 'l9')
+        self.engine.set_paused(True)
+        self.controller.set_enabled(False)
+
+        start = time.monotonic()
+        while self.engine._held is None and time.monotonic() - start < 60:
+            self.app.processEvents()
+            time.sleep(0.01)
+
+        self.assertEqual([], self.moves)
+        self.assertEqual('w', self.game.get_active_player().get_stone())
+        self.assertFalse(self.controller.is_enabled())
+
+        self.engine.set_paused(False)
+
+        self.assertEqual(1, len(self.moves))
+        self.assertEqual('b', self.game.get_active_player().get_stone())
+        self.assertTrue(self.controller.is_enabled())
+
+    def test_restores_enabled(self):
+        """ Tests that clicks stay ignored after the engine's move if they were
+            before its turn. """
+        self.controller.set_enabled(False)
+        self.engine.start()
+        self.play('l6', 'l9')
+        self.wait_for_moves(1)
+
+        self.assertEqual(1, len(self.moves))
+        self.assertFalse(self.controller.is_enabled())
+
+    def test_stop(self):
+        """ Tests that nothing is played after stopping. """
+        self.engine.start()
+        self.play('l6', 'l9')
+        self.engine.stop()
+        self.wait_for_moves(1, 2)
+
+        self.assertFalse(self.engine.is_running())
+        self.assertEqual([], self.moves)
+        self.assertEqual('w', self.game.get_active_player().get_stone())
+
+
+def main():
+    """ Runs unit tests for the EnginePlayer class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
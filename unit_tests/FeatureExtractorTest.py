@@ -0,0 +1,57 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the FeatureExtractor of a Gess game
+
+
+from engine.FeatureExtractor import FeatureExtractor
+from models.Board import Board
+from models.Notation import Notation
+from models.Player import Player
+from models.Position import Position
+import numpy as np
+import unittest
+
+
+class FeatureExtractorTest(unittest.TestCase):
+    def test_extract(self):
+        """ Tests the features of a new board. """
+        f = FeatureExtractor()
+
+        features = f.extract(Board(), Player('b'))
+
+        self.assertEqual(f.size(), len(features))
+        self.assertListEqual([43, 43, 1, 1], list(features[:4]))
+        self.assertListEqual([0, 0], list(features[12:14]))
+
+    def test_extract_batch1(self):
+        """ Tests filling a preallocated array from a Board and a Position. """
+        f = FeatureExtractor(batch_size=1)
+        out = np.zeros((2, f.size()), dtype=np.float64)
+
+        p = Position()
+        p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+        result = f.extract_batch([(Board(), Player('w')), p], out)
+
+        self.assertIs(out, result)
+        self.assertListEqual(list(f.extract(Board(), Player('w'))), list(out[0]))
+        self.assertEqual(1, out[1][12] + out[1][13])
+
+    def test_extract_batch2(self):
+        """ Tests that a broken ring is not counted. """
+        f = FeatureExtractor()
+        b = Board()
+        b.place_piece({(17, 11): "b"})
+
+        features = f.extract_batch([(b, Player('b'))])
+
+        self.assertEqual(0, features[0][2])
+        self.assertEqual(1, features[0][3])
+
+
+def main():
+    """ Runs unit tests for the FeatureExtractor class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the signals of a Game
+
+
+from controllers.BoardController import BoardController
+from models.Board import Board
+from models.Game import Game
+from models.Player import Player
+import unittest
+
+
+class GameTest(unittest.TestCase):
+    def setUp(self):
+        self.game = Game((Player('b'), Player('w')), Board())
+        self.controller = BoardController(self.game)
+        self.signals = []
+
+        self.game.board_updated.connect(lambda origin, destination, changes: self.signals.append(changes))
+        self.game.status_updated.connect(lambda: self.signals.append("status"))
+        self.game.get_board().piece_deselected.connect(lambda: self.signals.append("deselected"))
+
+    def test_make_move1(self):
+        """ Tests that a move emits a single signal with all of its changes. """
+        self.game.get_board().set_selected(self.controller.get_piece((14, 11)))
+        self.game.make_move(self.controller.get_piece((14, 11)), self.controller.get_piece((11, 11)))
+
+        self.assertEqual(1, len(self.signals))
+        self.assertDictEqual({"squares": {(13, 11): "", (10, 11): "b"}, "status": True, "deselected": True},
+                             self.signals[0])
+        self.assertIsNone(self.game.get_board().get_selected())
+
+    def test_make_move2(self):
+        """ Tests that the changed squares include stones pushed into the gutter. """
+        self.game.make_move(self.controller.get_piece((2, 2)), self.controller.get_piece((1, 1)))
+
+        squares = self.game.get_board().get_squares()
+        changes = self.signals[0]["squares"]
+
+        self.assertEqual("", changes[(2, 3)])
+        self.assertNotIn((0, 1), changes)
+        for (row, col), stone in changes.items():
+            self.assertEqual(squares[row][col], stone)
+
+    def test_make_move3(self):
+        """ Tests that breaking the last ring only updates the status. """
+        self.game.make_move(self.controller.get_piece((17, 9)), self.controller.get_piece((15, 9)))
+
+        self.assertListEqual(["status"], self.signals)
+
+    def test_set_status_message(self):
+        """ Tests that status messages outside of a move are emitted at once. """
+        self.game.set_status_message("Message")
+
+        self.assertListEqual(["status"], self.signals)
+
+
+def main():
+    """ Runs unit tests for the Game class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@
 # Date:  5/22/20
 # Description:  Unit tests for the GessGame class of the Gess Game
 
-from Gess import GessGame, IllegalMove
+from models.GessGame import GessGame
+from models.IllegalMove import IllegalMove
 import unittest
 
 
@@ -171,30 +172,30 @@ class GessGameTest(unittest.TestCase):
         g = GessGame()
 
         target = {
-            (18, 3): "", (18, 4): "w", (18, 5): "w",
-            (17, 3): "w", (17, 4): "w", (17, 5): "w",
-            (16, 3): "", (16, 4): "w", (16, 5): "w"
+            (3, 3): "", (3, 4): "w", (3, 5): "w",
+            (2, 3): "w", (2, 4): "w", (2, 5): "w",
+            (1, 3): "", (1, 4): "w", (1, 5): "w"
         }
 
         g._board.place_piece(target)
         g.update_rings()
 
-        self.assertListEqual([(17, 6), (17, 11)], g._players[1].get_rings())
+        self.assertListEqual([(2, 6), (2, 11)], g._players[1].get_rings())
 
     def test_update_rings2(self):
         """ Test adding a new ring for black. """
         g = GessGame()
 
         target = {
-            (3, 3): "", (3, 4): "b", (3, 5): "b",
-            (2, 3): "b", (2, 4): "b", (2, 5): "b",
-            (1, 3): "", (1, 4): "b", (1, 5): "b"
+            (18, 3): "", (18, 4): "b", (18, 5): "b",
+            (17, 3): "b", (17, 4): "b", (17, 5): "b",
+            (16, 3): "", (16, 4): "b", (16, 5): "b"
         }
 
         g._board.place_piece(target)
         g.update_rings()
 
-        self.assertListEqual([(2, 6), (2, 11)], g._players[0].get_rings())
+        self.assertListEqual([(17, 6), (17, 11)], g._players[0].get_rings())
 
 
     def test_update_rings3(self):
@@ -202,9 +203,9 @@ class GessGameTest(unittest.TestCase):
         g = GessGame()
 
         target = {
-            (18, 8): "", (18, 9): "w", (18, 10): "",
-            (17, 8): "w", (17, 9): "w", (17, 10): "",
-            (16, 8): "", (16, 9): "w", (16, 10): ""
+            (3, 8): "", (3, 9): "w", (3, 10): "",
+            (2, 8): "w", (2, 9): "w", (2, 10): "",
+            (1, 8): "", (1, 9): "w", (1, 10): ""
         }
 
         g._board.place_piece(target)
@@ -217,9 +218,9 @@ class GessGameTest(unittest.TestCase):
         g = GessGame()
 
         target = {
-            (3, 8): "", (3, 9): "b", (3, 10): "",
-            (2, 8): "b", (2, 9): "b", (2, 10): "",
-            (1, 8): "", (1, 9): "b", (1, 10): ""
+            (18, 8): "", (18, 9): "b", (18, 10): "",
+            (17, 8): "b", (17, 9): "b", (17, 10): "",
+            (16, 8): "", (16, 9): "b", (16, 10): ""
         }
 
         g._board.place_piece(target)
@@ -295,6 +296,40 @@ class GessGameTest(unittest.TestCase):
 
         self.assertEqual('WHITE_WON', g.get_game_state())
 
+    def test_apply_moves1(self):
+        """ Tests applying a whole game at once. """
+        g = GessGame()
+
+        failed = g.apply_moves([('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12'), ('c12', 'c9'),
+                                ('l12', 'l13'), ('c9', 'c8'), ('l13', 'l16')])
+
+        self.assertIsNone(failed)
+        self.assertEqual('BLACK_WON', g.get_game_state())
+        self.assertListEqual([], g._players[1].get_rings())
+
+    def test_apply_moves2(self):
+        """ Tests stopping at an illegal move. """
+        g = GessGame()
+
+        failed = g.apply_moves([('k8', 'l7'), ('c13', 'c14'), ('j3', 'j5'), ('l6', 'l7')])
+
+        self.assertEqual(2, failed)
+        self.assertEqual('b', g.get_active_player().get_stone())
+        self.assertListEqual([(17, 11)], g._players[0].get_rings())
+
+    def test_apply_moves3(self):
+        """ Tests that a batch matches the same moves made one at a time. """
+        g1 = GessGame()
+        g2 = GessGame()
+        moves = [('f6', 'f9'), ('l15', 'l12'), ('f9', 'f12'), ('l12', 'l9'), ('zz', 'f13')]
+
+        for origin, destination in moves:
+            g1.make_move(origin, destination)
+
+        self.assertEqual(4, g2.apply_moves(moves))
+        self.assertListEqual(g1._board.get_squares(), g2._board.get_squares())
+        self.assertEqual(g1.get_active_player().get_stone(), g2.get_active_player().get_stone())
+
 
 def main():
     """ Runs unit tests for the GessGame class. """
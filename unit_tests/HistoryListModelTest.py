@@ -0,0 +1,75 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the HistoryListModel
+
+
+from controllers.BoardController import BoardController
+from models.Board import Board
+from models.Game import Game
+from models.History import History
+from models.HistoryListModel import HistoryListModel
+from models.Player import Player
+import unittest
+
+
+class HistoryListModelTest(unittest.TestCase):
+    def setUp(self):
+        self.game = Game((Player('b'), Player('w')), Board())
+        self.history = History(self.game)
+        self.controller = BoardController(self.game)
+        self.model = HistoryListModel(self.history)
+
+    def move(self, source, target):
+        self.game.make_move(self.controller.get_piece(source), self.controller.get_piece(target))
+
+    def test_add_move1(self):
+        """ Tests that black's move starts a row and white's completes it. """
+        inserted = []
+        changed = []
+        self.model.rowsInserted.connect(lambda parent, first, last: inserted.append(first))
+        self.model.dataChanged.connect(lambda first, last, roles: changed.append(first.row()))
+
+        self.move((14, 11), (11, 11))
+        self.assertEqual(1, self.model.rowCount())
+        self.assertEqual("1.  l6 - l9", self.model.data(self.model.index(0)))
+
+        self.move((5, 11), (8, 11))
+        self.assertEqual(1, self.model.rowCount())
+        self.assertEqual("1.  l6 - l9       l15 - l12", self.model.data(self.model.index(0)))
+        self.assertEqual(([0], [0]), (inserted, changed))
+
+    def test_add_move2(self):
+        """ Tests a long game adds one row for every two moves. """
+        origin = self.controller.get_piece((14, 11))
+        destination = self.controller.get_piece((11, 11))
+        for _ in range(2001):
+            self.history.add_move(origin, destination)
+
+        self.assertEqual(1001, self.model.rowCount())
+        self.assertEqual("1001.  l6 - l9", self.model.data(self.model.index(1000)))
+
+    def test_remove_move(self):
+        """ Tests that removing moves shortens and then drops the last row. """
+        self.move((14, 11), (11, 11))
+        self.move((5, 11), (8, 11))
+
+        self.history.remove_move()
+        self.assertEqual("1.  l6 - l9", self.model.data(self.model.index(0)))
+
+        self.history.remove_move()
+        self.assertEqual(0, self.model.rowCount())
+
+    def test_model_over_existing_history(self):
+        """ Tests a model made after moves were played. """
+        self.move((14, 11), (11, 11))
+
+        self.assertEqual(1, HistoryListModel(self.history).rowCount())
+
+
+def main():
+    """ Runs unit tests for the HistoryListModel class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the Layout
+
+
+from models.Board import Board
+from models.Layout import Layout, LAYOUT, LAYOUTS
+from models.Position import Position
+import os
+import subprocess
+import sys
+import unittest
+
+
+class LayoutTest(unittest.TestCase):
+    def test_standard(self):
+        """ Tests that the standard layout is the board of the rules. """
+        self.assertEqual(20, LAYOUT.get_size())
+        self.assertEqual(1, LAYOUT.get_gutter())
+        self.assertEqual(18 * 18, len(LAYOUT.get_playable()))
+        self.assertEqual(17 * 17, len(LAYOUT.get_ring_centers()))
+        self.assertEqual([(17, 11)], LAYOUT.get_initial_rings('b'))
+        self.assertEqual([(2, 11)], LAYOUT.get_initial_rings('w'))
+
+        squares = Board().get_squares()
+        self.assertEqual(43, sum(row.count('b') for row in squares))
+        self.assertEqual(43, sum(row.count('w') for row in squares))
+        self.assertEqual(['', '', 'w', '', 'w', '', 'w', 'w', 'w', 'w', 'w', 'w', 'w', 'w', '', 'w', '', 'w', '', ''],
+                         squares[1])
+
+    def test_gutter_squares(self):
+        """ Tests that the gutter leaves out the last square, as Board.clear_gutter does. """
+        gutter = LAYOUT.get_gutter_squares()
+
+        self.assertEqual(4 * 19 - 1, len(gutter))
+        self.assertIn(0, gutter)
+        self.assertIn(19 * 20, gutter)
+        self.assertNotIn(20 * 20 - 1, gutter)
+        self.assertFalse(LAYOUT.is_playable(0, 5))
+        self.assertTrue(LAYOUT.is_playable(18, 18))
+
+    def test_footprints(self):
+        """ Tests that footprints are the 9 squares around a playable center. """
+        footprints = LAYOUT.get_footprints()
+
+        self.assertEqual((0, 1, 2, 20, 21, 22, 40, 41, 42), footprints[21])
+        self.assertEqual((), footprints[0])
+
+    def test_initial_squares(self):
+        """ Tests that every board gets its own squares. """
+        squares = LAYOUT.get_initial_squares()
+        squares[1][2] = ""
+
+        self.assertEqual('w', LAYOUT.get_initial_squares()[1][2])
+
+    def test_load_large(self):
+        """ Tests loading a larger layout file. """
+        layout = Layout.load(os.path.join(LAYOUTS, "large.json"))
+
+        self.assertEqual(26, layout.get_size())
+        self.assertEqual(24 * 24, len(layout.get_playable()))
+        self.assertEqual([(23, 14)], layout.get_initial_rings('b'))
+        self.assertEqual([(2, 14)], layout.get_initial_rings('w'))
+        self.assertEqual(8, len(layout.get_rays()[14 * 26 + 14]))
+
+    def test_too_large(self):
+        """ Tests that boards wider than the notation allows are refused. """
+        with self.assertRaises(ValueError):
+            Layout(27, 1, {})
+
+    def test_play_large(self):
+        """ Tests that the board and the position agree on a larger layout. """
+        script = ("from models.Board import Board\n"
+                  "from models.Position import Position\n"
+                  "p = Position()\n"
+                  "assert p.get_squares() == Board().get_squares()\n"
+                  "assert p.get_rings('b') == [23 * 26 + 14]\n"
+                  "assert p.is_legal_move(20 * 26 + 14, 17 * 26 + 14)\n"
+                  "p.make_move(20 * 26 + 14, 17 * 26 + 14)\n"
+                  "print(len(p.get_squares()), p.get_active())\n")
+        environment = dict(os.environ, GESS_LAYOUT="large")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+        output = subprocess.run([sys.executable, "-c", script], cwd=root, env=environment,
+                                capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual("26 w", output.strip())
+
+    def test_position(self):
+        """ Tests that positions start from the layout. """
+        self.assertEqual(Board().get_squares(), Position().get_squares())
+
+
+def main():
+    """ Runs unit tests for the Layout class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the MoveExporter
+
+
+from benchmarks.Benchmark import CORPUS
+from controllers.BoardController import BoardController
+from models.Board import Board
+from models.Game import Game
+from models.GameRecord import GameRecord
+from models.History import History
+from models.Player import Player
+from tools.MoveExporter import MoveExporter, RESULTS, pyarrow
+import numpy as np
+import os
+import tempfile
+import unittest
+
+
+class MoveExporterTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "moves")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_add_archive(self):
+        """ Tests that every corpus move is written in chunks. """
+        records = list(GameRecord.read_archive(CORPUS))
+        e = MoveExporter(self.path, chunk_size=100, parquet=False)
+        e.add_archive(CORPUS)
+        e.close()
+
+        columns = MoveExporter.read_shards(self.path)
+        moves = sum(len(record.get_moves()) for record in records)
+
+        self.assertEqual(moves, e.get_rows())
+        self.assertEqual(moves, len(columns["ply"]))
+        self.assertEqual((moves + 99) // 100, len(os.listdir(self.path)))
+        self.assertEqual(list(range(len(records[0].get_moves()))), list(columns["ply"][:len(records[0].get_moves())]))
+        self.assertEqual(len(records) - 1, columns["game"][-1])
+
+        shards = MoveExporter.open_shards(self.path)
+        self.assertEqual(len(os.listdir(self.path)), len(shards))
+        self.assertIsInstance(shards[0]["ply"], np.memmap)
+        self.assertEqual(moves, sum(len(shard["ply"]) for shard in shards))
+
+    def test_add_game(self):
+        """ Tests the columns of a capture and a win. """
+        moves = [('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12'), ('c12', 'c9'), ('l12', 'l13'), ('c9', 'c8'),
+                 ('l13', 'l16')]
+        e = MoveExporter(self.path, parquet=False)
+        e.add_game(GameRecord(moves))
+        e.close()
+        columns = MoveExporter.read_shards(self.path)
+
+        self.assertEqual([0, 1] * 3 + [0], list(columns["stone"]))
+        self.assertEqual((14, 11, 11, 11), (columns["source_row"][0], columns["source_col"][0],
+                                            columns["target_row"][0], columns["target_col"][0]))
+        self.assertEqual((-1, 0, 3), (columns["row_direction"][0], columns["col_direction"][0],
+                                      columns["distance"][0]))
+        self.assertGreater(columns["captured"][-1], 0)
+        self.assertEqual((1, 0), (columns["opponent_rings_before"][-1], columns["opponent_rings_after"][-1]))
+        self.assertTrue(all(result == RESULTS['BLACK_WON'] for result in columns["result"]))
+
+    def test_add_game_unreadable(self):
+        """ Tests that a game is exported up to a square off the board. """
+        e = MoveExporter(self.path, parquet=False)
+        e.add_game(GameRecord([('l6', 'l9'), ('q99', 'c5')], 'BLACK_WON'))
+        e.add_game(GameRecord([('zz', 'l9')], 'BLACK_WON'))
+        e.close()
+
+        self.assertEqual(1, e.get_rows())
+        self.assertEqual(2, e.get_skipped())
+
+    def test_add_history(self):
+        """ Tests exporting the moves of a History. """
+        g = Game((Player('b'), Player('w')), Board())
+        h = History(g)
+        c = BoardController(g)
+        g.make_move(c.get_piece((14, 11)), c.get_piece((11, 11)))
+
+        e = MoveExporter(self.path, parquet=False)
+        e.add_history(h)
+        e.close()
+
+        self.assertEqual(1, e.get_rows())
+        self.assertEqual(0, e.get_skipped())
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        """ Tests writing row groups to a Parquet file. """
+        import pyarrow.parquet
+        e = MoveExporter(self.path + ".parquet", chunk_size=100)
+        e.add_archive(CORPUS)
+        e.close()
+
+        f = pyarrow.parquet.ParquetFile(self.path + ".parquet")
+        self.assertEqual(e.get_rows(), f.metadata.num_rows)
+        self.assertEqual((e.get_rows() + 99) // 100, f.num_row_groups)
+
+
+def main():
+    """ Runs unit tests for the MoveExporter class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
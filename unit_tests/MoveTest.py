@@ -0,0 +1,73 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the Move
+
+
+from models.Board import Board
+from models.Game import Game
+from models.History import History
+from models.Move import Move
+from models.Player import Player
+from controllers.BoardController import BoardController
+import unittest
+
+
+class MoveTest(unittest.TestCase):
+    def test_from_pieces(self):
+        """ Tests that a move gives back the pieces it was made from. """
+        b = Board()
+        c = BoardController(Game((Player('b'), Player('w')), b))
+        origin = c.get_piece((16, 11))
+        destination = c.get_piece((13, 11))
+
+        m = Move.from_pieces(origin, destination)
+
+        self.assertEqual(((16, 11), (13, 11)), (m.get_source(), m.get_target()))
+        self.assertEqual(origin, m.get_origin())
+        self.assertEqual(destination, m.get_destination())
+        self.assertEqual(tuple(destination.values()), m.get_captured())
+
+    def test_get_footprint(self):
+        """ Tests that pieces at the same center share their coordinates. """
+        b = Board()
+        c = BoardController(Game((Player('b'), Player('w')), b))
+
+        first = list(c.get_piece((10, 10)).keys())
+        second = list(c.get_piece((10, 10)).keys())
+
+        self.assertEqual((9, 9), first[0])
+        self.assertTrue(all(a is b for a, b in zip(first, second)))
+        self.assertIs(Move.get_footprint((10, 10)), Move.get_footprint((10, 10)))
+
+    def test_shared_stones(self):
+        """ Tests that moves with the same stones share them. """
+        first = Move((5, 5), (8, 5), ['b'] * 9, [''] * 9)
+        second = Move((6, 6), (9, 6), ['b'] * 9, [''] * 9)
+
+        self.assertIs(first.get_stones(), second.get_stones())
+        self.assertIs(first.get_source(), Move.get_footprint((5, 5))[4])
+
+    def test_history(self):
+        """ Tests that the history keeps moves as Move records. """
+        g = Game((Player('b'), Player('w')), Board())
+        h = History(g)
+        c = BoardController(g)
+
+        g.make_move(c.get_piece((17, 11)), c.get_piece((14, 11)))
+
+        self.assertEqual(1, len(h.get_history()))
+        self.assertEqual((14, 11), h.get_history()[0].get_target())
+
+    def test_slots(self):
+        """ Tests that players keep no per-instance dictionary. """
+        self.assertFalse(hasattr(Player('b'), "__dict__"))
+        self.assertFalse(hasattr(Move((5, 5), (8, 5), [''] * 9, [''] * 9), "__dict__"))
+
+
+def main():
+    """ Runs unit tests for the Move class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the NetworkEvaluator
+
+
+from engine.MaterialEvaluator import MaterialEvaluator
+from engine.NetworkEvaluator import INPUTS, NetworkEvaluator
+from models.Notation import Notation
+from models.Position import Position, SIZE, SYMMETRIES
+from models.PositionCodec import PositionCodec
+import numpy as np
+import os
+import tempfile
+import unittest
+
+
+class NetworkEvaluatorTest(unittest.TestCase):
+    def setUp(self):
+        self.positions = [Position()]
+        for origin, destination in [('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12'), ('c12', 'c9'), ('l12', 'l13')]:
+            p = self.positions[-1].copy()
+            p.make_move(Notation.to_center(origin), Notation.to_center(destination))
+            self.positions.append(p)
+
+    def test_evaluate1(self):
+        """ Tests a linear model counting black stones against white ones. """
+        weights = np.zeros((INPUTS, 1))
+        weights[:SIZE * SIZE] = 0.01                            # Black stones
+        weights[SIZE * SIZE:2 * SIZE * SIZE] = -0.01            # White stones
+        n = NetworkEvaluator([(weights, np.zeros(1))], scale=1000)
+        material = MaterialEvaluator(stone_weight=1, ring_weight=0)
+
+        # Positions are scored as their canonical form
+        for p in self.positions:
+            canonical = p.transform(p.get_canonical()[1])
+            stones = material.evaluate_position(canonical) * (1 if canonical.get_active() == 'b' else -1)
+            self.assertEqual(round(np.tanh(stones / 100) * 1000), n.evaluate([p])[0])
+
+    def test_evaluate2(self):
+        """ Tests that a batch is scored the same as each position alone. """
+        n = NetworkEvaluator.initialize((16, 8), seed=1)
+
+        scores = n.evaluate(self.positions)
+
+        self.assertEqual(len(self.positions), len(scores))
+        self.assertListEqual([n.evaluate_position(p) for p in self.positions], scores)
+        self.assertListEqual([], n.evaluate([]))
+        self.assertTrue(all(-100 <= score <= 100 for score in scores))
+
+    def test_evaluate3(self):
+        """ Tests that symmetric positions get the same score. """
+        n = NetworkEvaluator.initialize((16, 8), seed=1)
+
+        for p in self.positions:
+            variants = [p.transform(symmetry) for symmetry in range(len(SYMMETRIES))]
+            scores = n.evaluate(variants)
+
+            canonical = [p.transform(p.get_canonical()[1])]
+            self.assertEqual(1, len(set(scores)))
+            self.assertEqual(n.evaluate_planes(PositionCodec.to_planes(PositionCodec.encode(canonical)))[0], scores[0])
+
+    def test_load(self):
+        """ Tests that saved weights are loaded back and checked. """
+        n = NetworkEvaluator.initialize((16,), seed=1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "network.npz")
+            n.save(path)
+            loaded = NetworkEvaluator.load(path)
+
+            np.savez(path, weights_0=np.zeros((10, 1)), bias_0=np.zeros(1))
+            self.assertRaises(ValueError, NetworkEvaluator.load, path)
+
+        self.assertEqual(2, len(loaded.get_layers()))
+        self.assertListEqual(n.evaluate(self.positions), loaded.evaluate(self.positions))
+
+
+def main():
+    """ Runs unit tests for the NetworkEvaluator class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
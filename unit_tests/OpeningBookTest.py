@@ -0,0 +1,114 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for building and reading an opening book
+
+
+from models.GameRecord import GameRecord
+from models.Notation import Notation
+from models.OpeningBook import OpeningBook
+from models.OpeningBookBuilder import OpeningBookBuilder
+from models.Position import Position
+import os
+import tempfile
+import unittest
+
+
+class OpeningBookTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._archive = os.path.join(self._directory.name, "games.txt")
+        self._book = os.path.join(self._directory.name, "book.bin")
+
+        GameRecord.write_archive(self._archive, [
+            GameRecord([('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12')], 'BLACK_WON'),
+            GameRecord([('l6', 'l9'), ('l15', 'l12')], 'WHITE_WON'),
+            GameRecord([('f6', 'f9')], 'UNFINISHED')
+        ])
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_read_archive(self):
+        """ Tests that games are read back as written. """
+        records = list(GameRecord.read_archive(self._archive))
+
+        self.assertEqual(3, len(records))
+        self.assertListEqual([('l6', 'l9'), ('l15', 'l12')], records[1].get_moves())
+        self.assertEqual('WHITE_WON', records[1].get_result())
+
+    def test_get_moves1(self):
+        """ Tests the counts of moves from the initial position. """
+        builder = OpeningBookBuilder()
+        builder.add_archive(self._archive)
+        builder.save(self._book)
+        book = OpeningBook(self._book)
+
+        moves = book.get_moves(Position())
+        book.close()
+
+        self.assertEqual(2, len(moves))
+        self.assertEqual((Notation.to_center('l6'), Notation.to_center('l9'), 2, 1, 1), tuple(moves[0]))
+        self.assertEqual((Notation.to_center('f6'), Notation.to_center('f9'), 1, 0, 0), tuple(moves[1]))
+
+    def test_get_moves2(self):
+        """ Tests a position after one move. """
+        builder = OpeningBookBuilder()
+        builder.add_archive(self._archive)
+        builder.save(self._book)
+        book = OpeningBook(self._book)
+
+        p = Position()
+        p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+        moves = book.get_moves(p.get_canonical_hash())
+        book.close()
+
+        self.assertEqual(2, len(moves))
+
+    def test_get_moves3(self):
+        """ Tests that a symmetric position finds the moves mapped onto it. """
+        builder = OpeningBookBuilder()
+        builder.add_archive(self._archive)
+        builder.save(self._book)
+        book = OpeningBook(self._book)
+
+        # The start flipped over, with colours and the player to move swapped
+        moves = book.get_moves(Position(active='w'))
+        book.close()
+
+        self.assertEqual((Notation.to_center('l15'), Notation.to_center('l12'), 2, 1, 1), tuple(moves[0]))
+        self.assertEqual((Notation.to_center('f15'), Notation.to_center('f12'), 1, 0, 0), tuple(moves[1]))
+
+    def test_add_game_unreadable(self):
+        """ Tests that a game counts up to a square off the board. """
+        builder = OpeningBookBuilder()
+        builder.add_game(GameRecord([('l6', 'l9'), ('q99', 'c5')], 'BLACK_WON'))
+        builder.save(self._book)
+        book = OpeningBook(self._book)
+
+        self.assertEqual(1, len(book))
+        self.assertEqual((Notation.to_center('l6'), Notation.to_center('l9'), 1, 1, 0),
+                         tuple(book.get_moves(Position())[0]))
+        book.close()
+
+    def test_get_move(self):
+        """ Tests leaving out rare moves and missing positions. """
+        builder = OpeningBookBuilder(max_plies=1)
+        builder.add_archive(self._archive)
+        builder.save(self._book, min_games=2)
+        book = OpeningBook(self._book)
+
+        self.assertEqual(1, len(book))
+        self.assertTupleEqual((Notation.to_center('l6'), Notation.to_center('l9')), book.get_move(Position()))
+        p = Position()
+        p.make_move(Notation.to_center('f6'), Notation.to_center('f9'))
+        self.assertIsNone(book.get_move(p))
+        book.close()
+
+
+def main():
+    """ Runs unit tests for the opening book. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
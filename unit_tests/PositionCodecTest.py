@@ -0,0 +1,112 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the string and record forms of a position
+
+
+from models.Notation import Notation
+from models.Position import Position, SIZE
+from models.PositionCodec import PositionCodec
+import numpy as np
+import unittest
+
+
+class PositionCodecTest(unittest.TestCase):
+    def setUp(self):
+        # A few positions of a game, the last one won by black
+        self.positions = [Position()]
+        for origin, destination in [('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12'), ('r15', 'r12'), ('l12', 'l15'),
+                                    ('i15', 'i12'), ('l15', 'l18')]:
+            p = self.positions[-1].copy()
+            p.make_move(Notation.to_center(origin), Notation.to_center(destination))
+            self.positions.append(p)
+
+    def assertSamePosition(self, expected, actual):
+        self.assertListEqual(expected.get_cells(), actual.get_cells())
+        self.assertEqual(expected.get_active(), actual.get_active())
+        self.assertEqual(expected.get_game_state(), actual.get_game_state())
+        self.assertEqual(expected.get_hash(), actual.get_hash())
+        self.assertDictEqual(dict.fromkeys(expected.get_rings()), dict.fromkeys(actual.get_rings()))
+
+    def test_to_string(self):
+        """ Tests the string of a new board. """
+        rows = PositionCodec.to_string(Position()).split()[0].split("/")
+
+        self.assertEqual(SIZE, len(rows))
+        self.assertEqual("20", rows[0])
+        self.assertEqual("2w2w2w2w2w2w2", rows[6])
+        self.assertEqual("1bbb1b1bbbb1b1b1bbb1", rows[17])
+        self.assertTrue(PositionCodec.to_string(Position()).endswith(" b -"))
+
+    def test_from_string1(self):
+        """ Tests that positions are read back from their strings. """
+        for p in self.positions:
+            self.assertSamePosition(p, PositionCodec.from_string(PositionCodec.to_string(p)))
+
+        self.assertEqual('BLACK_WON', self.positions[-1].get_game_state())
+        self.assertTrue(PositionCodec.to_string(self.positions[-1]).endswith(" w b"))
+
+    def test_from_string2(self):
+        """ Tests that malformed strings are rejected. """
+        text = PositionCodec.to_string(Position())
+
+        for malformed in (text[:-2], text.replace(" b -", " x -"), text.replace("20/", "19/", 1),
+                          text.replace("20/", "10x9/", 1), text.replace("20/", "", 1)):
+            self.assertRaises(ValueError, PositionCodec.from_string, malformed)
+
+    def test_from_bytes(self):
+        """ Tests that positions are read back from their records. """
+        for p in self.positions:
+            data = PositionCodec.to_bytes(p)
+
+            self.assertEqual(PositionCodec.RECORD_BYTES, len(data))
+            self.assertSamePosition(p, PositionCodec.from_bytes(data))
+
+        self.assertEqual(83, PositionCodec.RECORD_BYTES)
+
+    def test_encode1(self):
+        """ Tests that a batch of records matches the records of each position,
+            and the strings of the batch. """
+        records = PositionCodec.encode(self.positions)
+
+        self.assertTupleEqual((len(self.positions), PositionCodec.RECORD_BYTES), records.shape)
+        for p, record in zip(self.positions, records):
+            self.assertEqual(PositionCodec.to_bytes(p), record.tobytes())
+
+        strings = PositionCodec.to_strings(records)
+        self.assertListEqual([PositionCodec.to_string(p) for p in self.positions], strings)
+        self.assertTrue(np.array_equal(records, PositionCodec.from_strings(strings)))
+
+        for p, decoded in zip(self.positions, PositionCodec.decode(records)):
+            self.assertSamePosition(p, decoded)
+
+    def test_encode2(self):
+        """ Tests the square Board.clear_gutter misses and the rest of the gutter. """
+        squares = [list(row) for row in Position.initial_squares()]
+        squares[SIZE - 1][SIZE - 1] = 'w'
+        p = Position(squares, 'w')
+
+        self.assertSamePosition(p, PositionCodec.from_bytes(PositionCodec.to_bytes(p)))
+        self.assertSamePosition(p, PositionCodec.from_string(PositionCodec.to_string(p)))
+
+        squares[0][SIZE - 1] = 'b'
+        self.assertRaises(ValueError, PositionCodec.to_bytes, Position(squares))
+
+    def test_unpack(self):
+        """ Tests the stones and players to move of a batch of records. """
+        black, white, white_to_move = PositionCodec.unpack(PositionCodec.encode(self.positions))
+
+        self.assertTupleEqual((len(self.positions), SIZE, SIZE), black.shape)
+        for i, p in enumerate(self.positions):
+            squares = np.array(p.get_squares())
+            self.assertTrue(np.array_equal(squares == 'b', black[i]))
+            self.assertTrue(np.array_equal(squares == 'w', white[i]))
+            self.assertEqual(p.get_active() == 'w', white_to_move[i])
+
+
+def main():
+    """ Runs unit tests for the PositionCodec class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the Position of a Gess game
+
+
+from models.Board import Board
+from models.IllegalMove import IllegalMove
+from models.Notation import Notation
+from models.Position import Position
+import unittest
+
+
+class PositionTest(unittest.TestCase):
+    def test_initial_squares(self):
+        """ Tests that a new position matches a new board. """
+        p = Position()
+
+        self.assertListEqual(Board().get_squares(), p.get_squares())
+
+    def test_initial_rings(self):
+        """ Tests that each player starts with one ring. """
+        p = Position()
+
+        self.assertListEqual([Notation.to_center('l3')], p.get_rings('b'))
+        self.assertListEqual([Notation.to_center('l18')], p.get_rings('w'))
+
+    def test_is_legal_move1(self):
+        """ Tests a legal move to the north. """
+        p = Position()
+
+        self.assertTrue(p.is_legal_move(Notation.to_center('l6'), Notation.to_center('l7')))
+
+    def test_is_legal_move2(self):
+        """ Tests a move in an illegal direction. """
+        p = Position()
+
+        self.assertFalse(p.is_legal_move(Notation.to_center('c6'), Notation.to_center('d8')))
+
+    def test_is_legal_move3(self):
+        """ Tests moving the opponent's piece. """
+        p = Position()
+
+        self.assertFalse(p.is_legal_move(Notation.to_center('c15'), Notation.to_center('c14')))
+
+    def test_make_move1(self):
+        """ Tests destroying the last ring as the active player. """
+        p = Position()
+        squares = p.get_squares()
+
+        with self.assertRaises(IllegalMove):
+            p.make_move(Notation.to_center('j3'), Notation.to_center('j5'))
+
+        self.assertListEqual(squares, p.get_squares())
+        self.assertEqual('b', p.get_active())
+
+    def test_make_move2(self):
+        """ Tests a natural win for the black player. """
+        p = Position()
+
+        for origin, destination in [('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12'), ('c12', 'c9'),
+                                    ('l12', 'l13'), ('c9', 'c8'), ('l13', 'l16')]:
+            self.assertTrue(p.is_legal_move(Notation.to_center(origin), Notation.to_center(destination)))
+            p.make_move(Notation.to_center(origin), Notation.to_center(destination))
+
+        self.assertEqual('BLACK_WON', p.get_game_state())
+        self.assertListEqual([], p.legal_moves())
+
+    def test_unmake_move(self):
+        """ Tests that taking back a move restores the position. """
+        p = Position()
+        squares = p.get_squares()
+        position_hash = p.get_hash()
+
+        undo = p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+        self.assertNotEqual(position_hash, p.get_hash())
+        p.unmake_move(undo)
+
+        self.assertListEqual(squares, p.get_squares())
+        self.assertEqual(position_hash, p.get_hash())
+        self.assertEqual('b', p.get_active())
+
+    def test_get_hash(self):
+        """ Tests that the hash depends on the player to move. """
+        self.assertNotEqual(Position().get_hash(), Position(active='w').get_hash())
+
+    def test_legal_moves(self):
+        """ Tests that every generated move is legal. """
+        p = Position()
+
+        for source, target in p.legal_moves():
+            self.assertTrue(p.is_legal_move(source, target))
+
+    def test_get_stones(self):
+        """ Tests that stone counts follow moves made and taken back. """
+        p = Position()
+        undo = p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+        p.make_move(Notation.to_center('l15'), Notation.to_center('l11'))
+
+        for stone in ('b', 'w'):
+            self.assertEqual(p.get_cells().count(stone), p.get_stones(stone))
+
+        p = Position()
+        undo = p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+        p.unmake_move(undo)
+        self.assertEqual(43, p.get_stones('b'))
+
+    def test_get_canonical1(self):
+        """ Tests that symmetric positions share their canonical hash. """
+        p = Position()
+        p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+
+        for symmetry in range(4):
+            q = p.transform(symmetry)
+            self.assertEqual(p.get_canonical_hash(), q.get_canonical_hash())
+            self.assertListEqual(p.get_squares(), q.transform(symmetry).get_squares())
+
+        self.assertEqual('b', p.transform(2).get_active())
+        self.assertNotEqual(p.get_canonical_hash(), Position().get_canonical_hash())
+
+    def test_get_canonical2(self):
+        """ Tests that the flipped start with white to move is the start. """
+        self.assertEqual(Position().get_canonical_hash(), Position(active='w').get_canonical_hash())
+        self.assertNotEqual(Position().get_hash(), Position(active='w').get_hash())
+
+    def test_get_canonical3(self):
+        """ Tests that the canonical hash follows moves made and taken back. """
+        p = Position()
+        undo = p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+        canonical = p.get_canonical()
+        p.unmake_move(undo)
+        p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+
+        self.assertTupleEqual(canonical, p.get_canonical())
+        self.assertEqual(p.get_canonical_hash(),
+                         Position(p.get_squares(), p.get_active()).get_canonical_hash())
+
+    def test_get_canonical4(self):
+        """ Tests that a stone on the uncleared corner turns symmetries off. """
+        squares = Position().get_squares()
+        squares[19][19] = 'b'
+        p = Position(squares)
+
+        self.assertTupleEqual((p.get_hash(), 0), p.get_canonical())
+
+    def test_transform_move(self):
+        """ Tests that legal moves are the same seen through a symmetry. """
+        p = Position()
+        p.make_move(Notation.to_center('l6'), Notation.to_center('l9'))
+
+        for symmetry in range(4):
+            moves = sorted(p.transform_move(move, symmetry) for move in p.legal_moves())
+            self.assertListEqual(sorted(p.transform(symmetry).legal_moves()), moves)
+
+        self.assertTupleEqual((Notation.to_center('i6'), Notation.to_center('i9')),
+                              p.transform_move((Notation.to_center('l6'), Notation.to_center('l9')), 1))
+
+
+def main():
+    """ Runs unit tests for the Position class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
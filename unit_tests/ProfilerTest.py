@@ -0,0 +1,60 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the Profiler
+
+
+from controllers.BoardController import BoardController
+from models.Board import Board
+from models.Game import Game
+from models.Player import Player
+from tools.Profiler import Profiler
+import unittest
+
+
+class ProfilerTest(unittest.TestCase):
+    def test_get_report1(self):
+        """ Tests counting calls made directly and through a signal. """
+        p = Profiler()
+        p.install()
+        try:
+            g = Game((Player('b'), Player('w')), Board())
+            c = BoardController(g)
+            g.make_move(c.get_piece((14, 11)), c.get_piece((13, 11)))
+            # noinspection PyUnresolvedReferences
+            c.move_legal.emit(c.get_piece((4, 11)), c.get_piece((5, 11)))
+        finally:
+            p.uninstall()
+
+        report = p.get_report()
+
+        self.assertEqual(2, report["Game.make_move"]["calls"])
+        self.assertEqual(2, report["Game.update_rings"]["calls"])
+        self.assertEqual(2, report["Board.check_for_rings"]["calls"])
+        self.assertNotIn("BoardView.apply_changes", report)
+
+    def test_get_report2(self):
+        """ Tests that nothing is recorded after uninstalling. """
+        p = Profiler()
+        p.install()
+        p.uninstall()
+
+        Board().check_for_rings()
+
+        self.assertDictEqual({}, p.get_report())
+
+    def test_percentile(self):
+        """ Tests nearest rank percentiles. """
+        ordered = list(range(1, 101))
+
+        self.assertEqual(50, Profiler.percentile(ordered, 50))
+        self.assertEqual(99, Profiler.percentile(ordered, 99))
+        self.assertEqual(1, Profiler.percentile([1], 90))
+
+
+def main():
+    """ Runs unit tests for the Profiler class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
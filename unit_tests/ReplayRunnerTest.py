@@ -0,0 +1,59 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for replaying the regression corpus
+
+
+from benchmarks.ReplayRunner import ReplayRunner, replay
+from models.GameRecord import GameRecord
+import json
+import os
+import tempfile
+import unittest
+
+
+class ReplayRunnerTest(unittest.TestCase):
+    def test_run(self):
+        """ Tests that every game of the corpus ends as recorded. """
+        report = ReplayRunner(processes=1).run()
+
+        self.assertListEqual([], report["mismatches"])
+        self.assertEqual(len(ReplayRunner().get_cases()), report["games"])
+        self.assertGreater(report["moves_per_second"], 0)
+
+    def test_corpus(self):
+        """ Tests that the corpus has finished games of both results. """
+        results = {case["result"] for case in ReplayRunner().get_cases()}
+
+        self.assertSetEqual({'UNFINISHED', 'BLACK_WON', 'WHITE_WON'}, results)
+
+    def test_replay(self):
+        """ Tests that a changed expectation is reported. """
+        case = dict(ReplayRunner().get_cases()[0])
+        case["active"] = 'w' if case["active"] == 'b' else 'b'
+        case["moves"] += " a1-a2"
+
+        made, _, mismatches = replay(case)
+
+        self.assertEqual(len(ReplayRunner().get_cases()[0]["moves"].split()), made)
+        self.assertListEqual(["moves", "active"], [mismatch[0] for mismatch in mismatches])
+
+    def test_record(self):
+        """ Tests that a recorded corpus replays without mismatches. """
+        with tempfile.TemporaryDirectory() as directory:
+            archive = os.path.join(directory, "games.txt")
+            corpus = os.path.join(directory, "replays.jsonl")
+            GameRecord.write_archive(archive, [GameRecord([('l6', 'l9'), ('l15', 'l12'), ('z1', 'z2')])])
+
+            self.assertEqual(1, ReplayRunner.record([archive], corpus))
+            with open(corpus) as corpus_file:
+                self.assertEqual("l6-l9 l15-l12", json.loads(corpus_file.readline())["moves"])
+            self.assertListEqual([], ReplayRunner(corpus, processes=1).run()["mismatches"])
+
+
+def main():
+    """ Runs unit tests for the ReplayRunner class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
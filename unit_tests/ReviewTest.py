@@ -0,0 +1,84 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the Review
+
+
+from benchmarks.Benchmark import CORPUS
+from controllers.BoardController import BoardController
+from models.Board import Board
+from models.Game import Game
+from models.GameRecord import GameRecord
+from models.History import History
+from models.Notation import Notation
+from models.Player import Player
+from models.Position import Position
+from models.Review import Review
+import unittest
+
+
+class ReviewTest(unittest.TestCase):
+    def test_go_to1(self):
+        """ Tests every ply of the corpus games against a replay. """
+        for record in GameRecord.read_archive(CORPUS):
+            moves = record.get_moves()
+            r = Review.from_notation(moves)
+
+            positions = [Position()]
+            for origin, destination in moves:
+                positions.append(positions[-1].copy())
+                positions[-1].make_move(Notation.to_center(origin), Notation.to_center(destination))
+
+            for ply in list(range(len(moves), -1, -1)) + [len(moves) // 2, len(moves), 0]:
+                r.go_to(ply)
+                self.assertEqual(positions[ply].get_squares(), r.get_squares())
+
+    def test_go_to2(self):
+        """ Tests that exactly the changed squares are sent. """
+        moves = [('l6', 'l9'), ('l15', 'l12')]
+        r = Review.from_notation(moves)
+        changes = []
+        plies = []
+        r.squares_changed.connect(changes.append)
+        r.ply_changed.connect(plies.append)
+
+        squares = [Position().get_squares()]
+        for ply in range(len(moves)):
+            squares.append(Review.from_notation(moves[:ply + 1]).get_squares())
+
+        def difference(before, after):
+            return {(row, col): after[row][col] for row in range(20) for col in range(20)
+                    if before[row][col] != after[row][col]}
+
+        r.step_back()
+        r.step_back()
+        r.step_back()
+        r.go_to(2)
+
+        self.assertEqual([1, 0, 2], plies)
+        self.assertEqual([difference(squares[2], squares[1]), difference(squares[1], squares[0]),
+                          difference(squares[0], squares[2])], changes)
+
+    def test_history(self):
+        """ Tests reviewing the moves kept by a History back to the start. """
+        b = Board()
+        g = Game((Player('b'), Player('w')), b)
+        h = History(g)
+        c = BoardController(g)
+        for origin, destination in [('l6', 'l9'), ('l15', 'l12'), ('l9', 'l10')]:
+            g.make_move(c.get_piece(Notation.to_indices(origin)), c.get_piece(Notation.to_indices(destination)))
+
+        r = Review(b.get_squares(), h.get_history())
+        r.go_to(0)
+
+        self.assertEqual(3, r.get_plies())
+        self.assertEqual(Board().get_squares(), r.get_squares())
+        self.assertNotEqual(Board().get_squares(), b.get_squares())
+
+
+def main():
+    """ Runs unit tests for the Review class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
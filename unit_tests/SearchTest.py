@@ -0,0 +1,149 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the Search
+
+
+from engine.EndgameSolver import EndgameSolver
+from engine.NetworkEvaluator import NetworkEvaluator
+from engine.Search import Search
+from models.Position import Position
+from unit_tests.EndgameSolverTest import play, ENDGAME
+import threading
+import unittest
+
+
+class SearchTest(unittest.TestCase):
+    def test_search1(self):
+        """ Tests finding a win in one move. """
+        s = Search()
+        p = play(ENDGAME)
+
+        move, score, variation = s.search(p, 2)
+
+        self.assertGreater(score, Search.WIN_SCORE - 1000)
+        self.assertEqual([move], variation)
+        p.make_move(*move)
+        self.assertEqual('BLACK_WON', p.get_game_state())
+
+    def test_search2(self):
+        """ Tests that the search returns a legal move and leaves the position alone. """
+        s = Search()
+        p = Position()
+        depths = []
+
+        move, score, variation = s.search(p, 1, callback=lambda depth, *args: depths.append(depth))
+
+        self.assertIn(move, p.legal_moves())
+        self.assertEqual(Position().get_hash(), p.get_hash())
+        self.assertEqual([1], depths)
+
+    def test_search3(self):
+        """ Tests that a stopped search still returns a legal move. """
+        s = Search()
+        p = Position()
+        stop = threading.Event()
+        stop.set()
+
+        move, score, variation = s.search(p, 3, stop=stop)
+
+        self.assertIn(move, p.legal_moves())
+
+    def test_search4(self):
+        """ Tests that a solver plays a proven win without searching. """
+        s = Search(solver=EndgameSolver())
+        p = play(ENDGAME)
+
+        move, score, variation = s.search(p)
+
+        self.assertEqual(0, s.get_nodes())
+        p.make_move(*move)
+        self.assertEqual('BLACK_WON', p.get_game_state())
+
+    def test_table_mate(self):
+        """ Tests that a win found at the root is one ply further away when
+            the table is probed deeper in the tree. """
+        s = Search()
+        p = play(ENDGAME)
+        score = s.search(p, 2)[1]
+
+        self.assertEqual(Search.WIN_SCORE - 1, score)
+        self.assertEqual(Search.WIN_SCORE - 3, s.negamax(p, 1, -Search.WIN_SCORE - 1, Search.WIN_SCORE + 1, 2))
+        self.assertEqual(-Search.WIN_SCORE + 4, Search.from_table(Search.to_table(-Search.WIN_SCORE + 4, 3), 3))
+        self.assertEqual(25, Search.to_table(25, 3))
+
+    def test_classify_move(self):
+        """ Tests counting the stones captured and the rings broken. """
+        p = play(ENDGAME)
+        winning_move = Search(solver=EndgameSolver()).search(p)[0]
+
+        self.assertEqual((0, 0), Search.classify_move(Position(), *Position().legal_moves()[0]))
+        captured, rings = Search.classify_move(p, *winning_move)
+        self.assertGreater(captured, 0)
+        self.assertEqual(1, rings)
+
+    def test_get_captures(self):
+        """ Tests that only capturing moves are extended by the quiescence search. """
+        s = Search()
+        p = play(ENDGAME[:4])
+        captures = list(s.get_captures(p))
+
+        self.assertEqual([], list(s.get_captures(Position())))
+        self.assertTrue(captures)
+        for source, target in captures:
+            self.assertGreater(Search.classify_move(p, source, target)[0], 0)
+
+    def test_order_moves(self):
+        """ Tests that captures are ordered before quiet moves, most stones first. """
+        s = Search()
+        p = play(ENDGAME[:4])
+        moves = s.order_moves(p, p.pseudo_legal_moves())
+        captured = [Search.classify_move(p, *move)[0] for move in moves]
+
+        self.assertEqual(len(list(p.pseudo_legal_moves())), len(moves))
+        self.assertGreater(captured[0], 0)
+        self.assertEqual(sorted(captured, reverse=True), captured)
+        self.assertEqual(moves[5], s.order_moves(p, moves, moves[5])[0])
+
+    def test_order_moves_first(self):
+        """ Tests that the table move is ordered ahead of a ring break. """
+        s = Search()
+        p = play(ENDGAME)
+        moves = list(p.pseudo_legal_moves())
+        quiet = next(move for move in moves if Search.classify_move(p, *move)[0] == 0)
+        ordered = s.order_moves(p, moves, quiet)
+
+        self.assertEqual(quiet, ordered[0])
+        self.assertEqual(1, Search.classify_move(p, *ordered[1])[1])
+
+    def test_quiesce(self):
+        """ Tests that the quiescence search never scores below the position itself. """
+        s = Search()
+        p = play(ENDGAME[:4])
+        score = s.evaluate(p)
+
+        self.assertEqual(score, s.quiesce(p, -Search.WIN_SCORE, Search.WIN_SCORE, 0, 0))
+        self.assertGreaterEqual(s.quiesce(p, -Search.WIN_SCORE, Search.WIN_SCORE, 0, 4), score)
+
+    def test_evaluator(self):
+        """ Tests that scoring leaves in batches finds the same move and score
+            as scoring them one at a time. """
+        batched = NetworkEvaluator.initialize((8,), seed=2)
+        single = NetworkEvaluator(batched.get_layers())
+        single.batched = False
+        p = play(ENDGAME[:4])
+
+        searches = [Search(depth=1, quiescence_depth=2, evaluator=evaluator) for evaluator in (batched, single)]
+        results = [search.search(p) for search in searches]
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(searches[0].get_nodes(), searches[1].get_nodes())
+        self.assertIn(results[0][0], p.legal_moves())
+
+
+def main():
+    """ Runs unit tests for the Search class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the ThreatDetector
+
+
+from engine.ThreatDetector import ATTACK_CENTERS, ThreatDetector
+from models.Notation import Notation
+from models.Position import Position
+from unit_tests.EndgameSolverTest import ENDGAME, play
+import unittest
+
+
+class ThreatDetectorTest(unittest.TestCase):
+    def test_get_ring_breaks1(self):
+        """ Tests that no ring can be reached in the opening. """
+        t = ThreatDetector()
+
+        self.assertListEqual([], t.get_ring_breaks(Position()))
+        self.assertListEqual([], t.get_threats(Position()))
+
+    def test_get_ring_breaks2(self):
+        """ Tests that the detector finds the same moves as checking every move. """
+        t = ThreatDetector()
+        p = play(ENDGAME)
+        ring = Notation.to_center('l18')
+
+        expected = sorted((source, target, (ring,)) for source, target in p.legal_moves()
+                          if target in ATTACK_CENTERS[ring])
+
+        self.assertListEqual(expected, sorted(t.get_ring_breaks(p)))
+        self.assertIn((Notation.to_center('l13'), Notation.to_center('l16')), t.get_winning_moves(p))
+
+    def test_get_threats(self):
+        """ Tests finding the opponent's threats against the player to move. """
+        t = ThreatDetector()
+        p = play(ENDGAME[:-1])
+        squares = p.get_squares()
+
+        threats = t.get_threats(p)
+
+        self.assertIn((Notation.to_center('l13'), Notation.to_center('l16'), (Notation.to_center('l18'),)), threats)
+        self.assertEqual('w', p.get_active())
+        self.assertListEqual(squares, p.get_squares())
+
+
+def main():
+    """ Runs unit tests for the ThreatDetector class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
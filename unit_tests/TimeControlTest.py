@@ -0,0 +1,57 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the TimeControl
+
+
+from engine.TimeControl import TimeControl
+import unittest
+
+
+class TimeControlTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.clock = TimeControl(total=60, increment=2, moves_to_go=20, clock=lambda: self.now)
+
+    def test_start(self):
+        """ Tests that only the running clock counts down. """
+        self.clock.start('b')
+        self.now = 5.0
+
+        self.assertEqual(55, self.clock.get_remaining('b'))
+        self.assertEqual(60, self.clock.get_remaining('w'))
+        self.assertEqual('b', self.clock.get_running())
+
+    def test_stop(self):
+        """ Tests that stopping a clock adds the increment and starting the
+            other clock stops it. """
+        self.clock.start('b')
+        self.now = 5.0
+        self.clock.start('w')
+        self.now = 8.0
+
+        self.assertEqual(3, self.clock.stop())
+        self.assertEqual(57, self.clock.get_remaining('b'))
+        self.assertEqual(59, self.clock.get_remaining('w'))
+        self.assertIsNone(self.clock.get_running())
+        self.assertEqual(0, self.clock.stop())
+
+    def test_allocate(self):
+        """ Tests spreading the remaining time over the moves to go. """
+        self.assertEqual(60 / 20 + 2, self.clock.allocate('b'))
+
+        self.clock.start('b')
+        self.now = 58.0
+        self.assertEqual(1, self.clock.allocate('b'))
+
+        self.now = 61.0
+        self.assertTrue(self.clock.is_flagged('b'))
+        self.assertEqual(0, self.clock.allocate('b'))
+
+
+def main():
+    """ Runs unit tests for the TimeControl class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
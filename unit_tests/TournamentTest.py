@@ -0,0 +1,109 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the Tournament
+
+
+from tools.Tournament import Tournament, play_game
+import math
+import os
+import tempfile
+import unittest
+
+
+CONFIGS = [{"name": "quiet", "depth": 1, "quiescence_depth": 0}, {"name": "quiescence", "depth": 1}]
+
+
+class TournamentTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_play_game(self):
+        """ Tests that a game stops at the ply limit as a draw. """
+        result = play_game({"pair": "quiet-quiescence", "first": "quiet", "game": 0, "black": CONFIGS[0],
+                            "white": CONFIGS[1], "seed": 1, "opening_plies": 2, "max_plies": 4})
+
+        self.assertEqual(("DRAW", 4), (result["result"], result["plies"]))
+        self.assertEqual(("quiet", "quiescence"), (result["black"], result["white"]))
+
+    def test_run1(self):
+        """ Tests that the engines alternate colors and the results are saved. """
+        t = Tournament(CONFIGS, self.path, games=2, processes=1, max_plies=2)
+        t.run()
+
+        results = t.get_results("quiet-quiescence")
+        self.assertEqual([0, 1], [result["game"] for result in results])
+        self.assertEqual(["quiet", "quiescence"], [result["black"] for result in results])
+        self.assertEqual((0, 2, 0), t.get_score("quiet-quiescence"))
+
+    def test_run2(self):
+        """ Tests resuming a tournament from its results file. """
+        Tournament(CONFIGS, self.path, games=1, processes=1, max_plies=2).run()
+        played = []
+
+        t = Tournament(CONFIGS, self.path, games=2, processes=1, max_plies=2)
+        t.run(played.append)
+
+        self.assertEqual([1], [result["game"] for result in played])
+        self.assertEqual(2, len(t.get_results("quiet-quiescence")))
+
+    def test_run_truncated(self):
+        """ Tests resuming after a result was cut off while being written. """
+        Tournament(CONFIGS, self.path, games=1, processes=1, max_plies=2).run()
+        with open(self.path, "a") as results_file:
+            results_file.write('{"pair": "quiet-quies')
+
+        t = Tournament(CONFIGS, self.path, games=2, processes=1, max_plies=2)
+        self.assertEqual(1, len(t.get_results("quiet-quiescence")))
+        t.run()
+
+        self.assertEqual([0, 1], [result["game"] for result in t.get_results("quiet-quiescence")])
+        self.assertEqual(2, len(Tournament(CONFIGS, self.path).get_results("quiet-quiescence")))
+
+    def test_run3(self):
+        """ Tests playing games over a process pool. """
+        t = Tournament(CONFIGS, self.path, games=2, processes=2, max_plies=2)
+        t.run()
+
+        self.assertEqual(2, sum(t.get_score("quiet-quiescence")))
+
+    def test_elo(self):
+        """ Tests Elo differences and their confidence intervals. """
+        self.assertEqual(0, Tournament.elo(10, 0, 10)[0])
+        self.assertAlmostEqual(-400 * math.log10(1 / 0.75 - 1), Tournament.elo(15, 0, 5)[0])
+
+        elo, low, high = Tournament.elo(30, 40, 20)
+        self.assertLess(low, elo)
+        self.assertLess(elo, high)
+        self.assertEqual(math.inf, Tournament.elo(3, 0, 0)[0])
+
+    def test_sprt(self):
+        """ Tests accepting each hypothesis and waiting while undecided. """
+        t = Tournament(CONFIGS, self.path, elo0=0, elo1=50)
+
+        self.assertIsNone(t.sprt(0, 0, 0))
+        self.assertIsNone(t.sprt(6, 2, 4))
+        self.assertEqual("H1", t.sprt(300, 100, 150))
+        self.assertEqual("H0", t.sprt(150, 100, 300))
+
+    def test_sprt_sweep(self):
+        """ Tests that a clean sweep stops the test once it is long enough. """
+        t = Tournament(CONFIGS, self.path, elo0=0, elo1=50)
+
+        self.assertIsNotNone(Tournament.log_likelihood_ratio(1, 0, 0, 0, 50))
+        self.assertIsNone(t.sprt(2, 0, 0))
+        self.assertEqual("H1", t.sprt(20, 0, 0))
+        self.assertEqual("H0", t.sprt(0, 0, 20))
+        self.assertEqual("H0", t.sprt(0, 200, 0))
+
+
+def main():
+    """ Runs unit tests for the Tournament class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Unit tests for the TrainingDataWriter
+
+
+from benchmarks.Benchmark import CORPUS
+from models.GameRecord import GameRecord
+from models.Notation import Notation
+from models.Position import Position
+from tools.TrainingDataWriter import TrainingDataWriter, self_play
+import numpy as np
+import os
+import tempfile
+import unittest
+
+
+class TrainingDataWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "training")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @staticmethod
+    def read(path):
+        """ Returns the columns of every shard joined. """
+        shards = TrainingDataWriter.open_shards(path)
+        return {name: np.concatenate([shard[name] for shard in shards]) for name, _ in TrainingDataWriter.COLUMNS}
+
+    def test_add_archive(self):
+        """ Tests that every corpus move is written once, shuffled, in shards. """
+        records = list(GameRecord.read_archive(CORPUS))
+        w = TrainingDataWriter(self.path, shard_size=100, buffer_size=30)
+        w.add_archive(CORPUS)
+        w.close()
+
+        columns = self.read(self.path)
+        moves = [(Notation.to_center(origin), Notation.to_center(destination))
+                 for record in records for origin, destination in record.get_moves()]
+
+        self.assertEqual(len(moves), w.get_samples())
+        self.assertEqual((len(moves) + 99) // 100, len(os.listdir(self.path)))
+        self.assertEqual(sorted(moves), sorted(zip(columns["source"].tolist(), columns["target"].tolist())))
+        self.assertNotEqual(moves, list(zip(columns["source"].tolist(), columns["target"].tolist())))
+
+    def test_add_game(self):
+        """ Tests the planes and results of a game won by black. """
+        moves = [('l6', 'l9'), ('c15', 'c12'), ('l9', 'l12'), ('c12', 'c9'), ('l12', 'l13'), ('c9', 'c8'),
+                 ('l13', 'l16')]
+        w = TrainingDataWriter(self.path, buffer_size=4, seed=1)
+        w.add_game(GameRecord(moves))
+        w.close()
+        columns = self.read(self.path)
+
+        # Find each position before a move by its move
+        p = Position()
+        samples = {(int(source), int(target)): i for i, (source, target) in enumerate(zip(columns["source"],
+                                                                                          columns["target"]))}
+        for origin, destination in moves:
+            move = Notation.to_center(origin), Notation.to_center(destination)
+            planes = columns["planes"][samples[move]]
+            squares = np.array(p.get_squares())
+
+            self.assertTrue(np.array_equal(squares == 'b', planes[0]))
+            self.assertTrue(np.array_equal(squares == 'w', planes[1]))
+            self.assertTrue((planes[2] == (p.get_active() == 'w')).all())
+            self.assertEqual(400 - 324, planes[3].sum())
+            self.assertEqual(1 if p.get_active() == 'b' else -1, columns["result"][samples[move]])
+            p.make_move(*move)
+
+        self.assertEqual('BLACK_WON', p.get_game_state())
+        self.assertTupleEqual((len(moves), 4, 20, 20), columns["planes"].shape)
+
+    def test_add_game_unreadable(self):
+        """ Tests that a game is added up to a square off the board. """
+        w = TrainingDataWriter(self.path, buffer_size=4)
+        w.add_game(GameRecord([('l6', 'l9'), ('q99', 'c5')], 'BLACK_WON'))
+        w.add_game(GameRecord([('zz', 'l9')], 'BLACK_WON'))
+        w.close()
+
+        self.assertEqual(2, w.get_games())
+        self.assertEqual(2, w.get_skipped())
+        self.assertEqual(1, w.get_samples())
+
+    def test_add_self_play(self):
+        """ Tests that self-played games are added as they were played. """
+        task = {"seed": 3, "opening_plies": 2, "max_plies": 4, "settings": {"depth": 1}}
+        w = TrainingDataWriter(self.path)
+        w.add_self_play(2, {"depth": 1}, seed=3, opening_plies=2, max_plies=4)
+        w.close()
+
+        self.assertEqual(4, len(self_play(task).get_moves()))
+        self.assertEqual(2, w.get_games())
+        self.assertEqual(8, w.get_samples())
+        self.assertTrue((self.read(self.path)["result"] == 0).all())
+
+
+def main():
+    """ Runs unit tests for the TrainingDataWriter class. """
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
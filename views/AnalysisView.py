@@ -0,0 +1,43 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Shows the engine's analysis of the position on the board.
+
+
+from PySide2.QtWidgets import QDockWidget, QLabel, QWidget
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QFont
+
+
+class AnalysisView(QDockWidget):
+    """ Displays the latest depth, score and best line sent by an
+        AnalysisService. """
+    def __init__(self, model):
+        super(AnalysisView, self).__init__()
+
+        self._service = model
+
+        self.setFeatures(self.NoDockWidgetFeatures)
+        self.setTitleBarWidget(QWidget())
+
+        self._analysis = QLabel()
+        self._analysis.setAlignment(Qt.AlignLeft)
+        self._analysis.setContentsMargins(10, 5, 10, 5)
+        self._analysis.setFont(QFont("Arial", 12))
+        self._analysis.setText("Analysing...")
+        self.setWidget(self._analysis)
+
+        self._service.analysis_updated.connect(self.update_analysis)
+        self._service.analysis_finished.connect(self.finish_analysis)
+
+    def update_analysis(self, depth, score, variation, nodes):
+        """ Shows the result of a completed depth. """
+        self._analysis.setText("Depth {}  {:+d}  {}  ({} positions)".format(depth, score, " ".join(variation), nodes))
+
+    def finish_analysis(self):
+        """ Marks the analysis shown as complete. """
+        if not self._analysis.text().endswith("done"):
+            self._analysis.setText(self._analysis.text() + "  done")
+
+
+if __name__ == "__main__":
+    pass
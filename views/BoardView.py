@@ -10,7 +10,7 @@ from views.SquareView import SquareView
 
 
 class BoardView(QWidget):
-    """ Creates a 20x20 grid of SquareViews. """
+    """ Creates a grid of SquareViews, one per square of the board. """
     def __init__(self, squares, model, controller):
         super(BoardView, self).__init__()
 
@@ -20,7 +20,11 @@ class BoardView(QWidget):
         self._controller = controller
         self._squares = squares
 
+        # Squares highlighted by the selection, in the form [(row, col)]
+        self._highlighted = []
+
         # Setup the layout
+        self.setStyleSheet(SquareView.style_sheet())
         layout = QGridLayout()
         layout.setHorizontalSpacing(2)
         layout.setVerticalSpacing(2)
@@ -42,7 +46,7 @@ class BoardView(QWidget):
                 self._squares[i][j].clicked.connect(self._controller.handle_square_click)
 
         # Column labels
-        for i in range(20):
+        for i in range(self._board_size):
             # ASCII code for 'a' + an offset
             col_label = self.create_label(chr(i + 97))
             col_label.setContentsMargins(0, 0, 0, 10)
@@ -55,7 +59,7 @@ class BoardView(QWidget):
         self.update_squares()
 
         # Set up connection to model updates.
-        self._game.board_updated.connect(self.update_squares)
+        self._game.board_updated.connect(self.apply_changes)
         self._board.piece_selected.connect(self.update_selection)
         self._board.piece_deselected.connect(self.clear_selection)
 
@@ -74,8 +78,8 @@ class BoardView(QWidget):
         return label
 
     def update_squares(self):
-        """ Updates the contents of the squares initially and
-            when the model updates. """
+        """ Updates the contents of every square, initially and when
+            returning from a review. """
         model_squares = self._board.get_squares()
 
         for i in range(self._board_size):
@@ -95,17 +99,35 @@ class BoardView(QWidget):
         # Piece is moved; remove selection indicator
         self.clear_selection()
 
+    def apply_changes(self, origin, destination, changes):
+        """ Updates the squares changed by a move and the selection, in one
+            pass, from the changes sent with Game.board_updated. """
+        self.update_changed(changes["squares"])
+
+        if changes["deselected"]:
+            self.clear_selection()
+
+    def update_changed(self, changes):
+        """ Updates only the squares in changes, a dictionary in the form
+            {(row, col): stone}, as sent by a Review. """
+        for (row, col), stone in changes.items():
+            if stone != "":
+                self._squares[row][col].place_stone(stone)
+            else:
+                self._squares[row][col].remove_stone()
+
     def update_selection(self, piece):
         """ Updates the appearance of squares when a piece has been selected.
             Piece is a dictionary in the form {(row, col): stone} """
         for square, stone in zip(piece.keys(), piece.values()):
             self._squares[square[0]][square[1]].highlight_as_peripheral()
+            self._highlighted.append(square)
 
     def clear_selection(self):
-        """ Changes the color of all squares back to the default color. """
-        for row in self._squares:
-            for square_view in row:
-                square_view.remove_highlight()
+        """ Changes the color of the highlighted squares back to the default color. """
+        for row, col in self._highlighted:
+            self._squares[row][col].remove_highlight()
+        self._highlighted = []
 
 
 if __name__ == "__main__":
@@ -6,17 +6,45 @@
 
 from PySide2.QtWidgets import QMainWindow
 from PySide2.QtCore import Qt
-from views.BoardView import BoardView
-from views.StatusView import StatusView
-from views.HistoryView import HistoryView
 
 
 class GameView(QMainWindow):
-    """ Composite view representing the main window of a Gess game. """
-    def __init__(self, board_view, status_view, history_view):
+    """ Composite view representing the main window of a Gess game. The history
+        view may be added after the window is shown. """
+    def __init__(self, board_view, status_view, history_view=None):
         super(GameView, self).__init__()
 
         self.setWindowTitle("Gess!")
         self.setCentralWidget(board_view)
         self.addDockWidget(Qt.TopDockWidgetArea, status_view)
-        self.addDockWidget(Qt.RightDockWidgetArea, history_view)
\ No newline at end of file
+        self._review_view = None
+        self._analysis_view = None
+
+        if history_view is not None:
+            self.set_history_view(history_view)
+
+    def set_history_view(self, history_view):
+        """ Docks the history of moves on the right of the board. """
+        self.addDockWidget(Qt.RightDockWidgetArea, history_view)
+
+    def set_review_view(self, review_view):
+        """ Docks the review controls below the board, replacing any shown.
+            Removes them if review_view is None. """
+        if self._review_view is not None:
+            self.removeDockWidget(self._review_view)
+            self._review_view.deleteLater()
+
+        self._review_view = review_view
+        if review_view is not None:
+            self.addDockWidget(Qt.BottomDockWidgetArea, review_view)
+
+    def set_analysis_view(self, analysis_view):
+        """ Docks the engine analysis below the board, replacing any shown.
+            Removes it if analysis_view is None. """
+        if self._analysis_view is not None:
+            self.removeDockWidget(self._analysis_view)
+            self._analysis_view.deleteLater()
+
+        self._analysis_view = analysis_view
+        if analysis_view is not None:
+            self.addDockWidget(Qt.BottomDockWidgetArea, analysis_view)
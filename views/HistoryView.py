@@ -3,15 +3,17 @@
 # Description:  Creates a view which displays the games completed moves.
 
 
-from PySide2.QtWidgets import (QDockWidget, QGridLayout,
-                               QVBoxLayout, QLabel, QWidget)
+from PySide2.QtWidgets import QDockWidget, QListView, QVBoxLayout, QLabel, QWidget, QAbstractItemView
 from PySide2.QtGui import QFont
-from PySide2.QtCore import Qt, QSize
+from PySide2.QtCore import Qt
+from models.HistoryListModel import HistoryListModel
 
 
 # TODO: At the end of the game, it should show a button to save the history
 class HistoryView(QDockWidget):
-    """ Displays the history of moves in the game. """
+    """ Displays the history of moves in the game. The moves are shown in a
+        list view over a HistoryListModel, which only draws the visible rows,
+        so long games scroll without a widget per move. """
     def __init__(self, model, controller):
         super(HistoryView, self).__init__()
 
@@ -19,9 +21,10 @@ class HistoryView(QDockWidget):
 
         self._history = model
         self._controller = controller
+        self._list_model = HistoryListModel(model)
 
         # Set up container
-        layout = QGridLayout()
+        layout = QVBoxLayout()
 
         container = QWidget()
         container.setLayout(layout)
@@ -35,48 +38,26 @@ class HistoryView(QDockWidget):
         title.setAlignment(Qt.AlignHCenter)
         title.setContentsMargins(5, 0, 10, 0)
 
-        # Setup the title section
-        layout.addWidget(title, 0, 0, 1, 3)
-        layout.setAlignment(Qt.AlignTop)
+        # Every row has the same height, so the view can skip measuring them
+        self._moves = QListView()
+        self._moves.setUniformItemSizes(True)
+        self._moves.setSelectionMode(QAbstractItemView.NoSelection)
+        self._moves.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._moves.setModel(self._list_model)
+
+        layout.addWidget(title)
+        layout.addWidget(self._moves)
 
         self.setWidget(container)
 
-        self._history.move_added.connect(self.add_move)
-
-    def add_move(self, origin, destination):
-        """ Responds to the updated model; adds a move to the history list. """
-        origin = self.piece_to_indices(origin)
-        destination = self.piece_to_indices(destination)
-        container = self.widget().layout()
-        rows = container.rowCount()
-
-        # TODO: Add new columns when notation goes past ~ 20 rows
-        #       with pagination
-
-        # Create the move notation
-        move = QLabel()
-        move.setFixedHeight(16)
-        move.setText(origin + " - " + destination)
-
-        # Add the notation to the correct cell
-        if len(self._history.get_history()) % 2 != 0:
-            count = QLabel(str(rows) + ".")
-            count.setFixedWidth(15)
-            container.addWidget(count, rows, 0)
-
-            container.addWidget(move, rows, 1)
-        else:
-            container.addWidget(move, rows - 1, 2)
-
-    @staticmethod
-    def piece_to_indices(piece):
-        """ Converts a piece in the form {(row, col): stone} to a letter, number
-            combination, indicating a center square on the board. """
-        # TODO: Add this and others like it to a utility module
-        center = list(piece.keys())[4]
-
-        # Convert to lower case column letter and row number
-        col = chr(center[1] + 97)
-        row = 20 - center[0]
-
-        return col + str(row)
\ No newline at end of file
+        # Scrolling on every new row would lay out the whole list each move;
+        # the scroll range only changes once the view lays itself out
+        self._moves.verticalScrollBar().rangeChanged.connect(self.show_last_move)
+
+    def show_last_move(self, minimum, maximum):
+        """ Keeps the latest move in view as the list grows. """
+        self._moves.verticalScrollBar().setValue(maximum)
+
+    def get_list_model(self):
+        """ Returns the list model shown by the view. """
+        return self._list_model
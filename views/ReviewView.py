@@ -0,0 +1,56 @@
+# Author:  Joshua Fogus
+# Date:  10/19/26
+# Description:  Controls for stepping through the moves of a game under review.
+
+
+from PySide2.QtWidgets import QDockWidget, QHBoxLayout, QLabel, QSlider, QWidget
+from PySide2.QtGui import QFont
+from PySide2.QtCore import Qt
+
+
+class ReviewView(QDockWidget):
+    """ A slider over the plies of a Review.  Dragging the slider, or the arrow,
+        Page Up, Page Down, Home and End keys while it has focus, shows the
+        board after that many moves. """
+    def __init__(self, model):
+        super(ReviewView, self).__init__()
+
+        self._review = model
+
+        self.setFeatures(self.NoDockWidgetFeatures)
+        self.setTitleBarWidget(QWidget())
+
+        self._slider = QSlider(Qt.Horizontal)
+        self._slider.setRange(0, self._review.get_plies())
+        self._slider.setPageStep(10)
+        self._slider.setValue(self._review.get_ply())
+
+        self._ply = QLabel()
+        self._ply.setFont(QFont("Arial", 12))
+        self._ply.setMinimumWidth(110)
+        self.update_ply(self._review.get_ply())
+
+        layout = QHBoxLayout()
+        layout.addWidget(self._slider)
+        layout.addWidget(self._ply)
+
+        container = QWidget()
+        container.setLayout(layout)
+        self.setWidget(container)
+
+        self._slider.valueChanged.connect(self._review.go_to)
+        self._review.ply_changed.connect(self.update_ply)
+
+    def focus(self):
+        """ Gives the slider keyboard focus so the keys step through moves. """
+        self._slider.setFocus()
+
+    def update_ply(self, ply):
+        """ Shows the ply reached and keeps the slider on it. """
+        self._ply.setText("Move {} of {}".format(ply, self._review.get_plies()))
+        if self._slider.value() != ply:
+            self._slider.setValue(ply)
+
+
+if __name__ == "__main__":
+    pass
@@ -14,6 +14,15 @@ class SquareView(QLabel):
         the squares coordinates within the Gess board. """
     clicked = Signal(tuple)
 
+    # Styles and stone images are shared by every square
+    # TODO: Factor styles into a separate file.
+    styles = {
+        "default": "border: 1px solid #A9A9A9;",
+        "center": "border: 1px solid #221CD9;",
+        "peripheral": "border: 1px solid #1BCF6C;"
+    }
+    stones = {}
+
     def __init__(self, coords):
         super(SquareView, self).__init__()
         self._coords = coords
@@ -23,23 +32,19 @@ class SquareView(QLabel):
         # self.setFrameStyle(QFrame.Panel)
         self.setAlignment(Qt.AlignCenter)
 
-        # Set styles
-        # TODO: Factor styles into a separate file.
-        self._styles = {
-            "default": "border: 1px solid #A9A9A9;",
-            "center": "border: 1px solid #221CD9;",
-            "peripheral": "border: 1px solid #1BCF6C;"
-        }
-
-        self.setStyleSheet(self._styles["default"])
+        # Only restyle or repaint a square when its appearance changes. The
+        # styles are applied by the style sheet of the parent, see style_sheet
+        self._style = "default"
+        self._stone = 'e'
+        self.setProperty("highlight", self._style)
 
-        # TODO: Move stones from instance variable to class variable
-        # Load stone images
-        self._stones = {
-            'w': QPixmap("assets/white_circle.png"),
-            'b': QPixmap("assets/black_circle.png"),
-            'e': QPixmap()
-        }
+        # Load stone images once, after the application has started
+        if not self.stones:
+            self.stones.update({
+                'w': QPixmap("assets/white_circle.png"),
+                'b': QPixmap("assets/black_circle.png"),
+                'e': QPixmap()
+            })
 
     def mousePressEvent(self, event: QMouseEvent):
         """ Emits a signal on mouse press with the row, col coordinates
@@ -55,26 +60,43 @@ class SquareView(QLabel):
     def highlight_as_center(self):
         """ Changes the color of a cell to indicate it as the center
             of a piece. """
-        self.setStyleSheet(self._styles["center"])
+        self.set_style("center")
 
     def highlight_as_peripheral(self):
         """ Changes the color of a cell to indicate it as a peripheral
             member of a piece. """
-        self.setStyleSheet(self._styles["peripheral"])
+        self.set_style("peripheral")
 
     def remove_highlight(self):
         """ Changes the color of the cell to its default color. """
-        self.setStyleSheet(self._styles["default"])
+        self.set_style("default")
+
+    def set_style(self, style):
+        """ Applies one of the styles if it is not already applied. """
+        if style != self._style:
+            self._style = style
+            self.setProperty("highlight", style)
+            self.style().unpolish(self)
+            self.style().polish(self)
+
+    @classmethod
+    def style_sheet(cls):
+        """ Returns a style sheet applying the styles to every square within
+            a widget, so it is only parsed once for the whole board. """
+        return " ".join('SquareView[highlight="{}"] {{ {} }}'.format(name, style)
+                        for name, style in cls.styles.items())
 
     def place_stone(self, stone):
         """ Receives a string indicating what color stone to place.
             'b' or 'w' Places a stone with the corresponding color
             in the square. """
-        self.setPixmap(self._stones[stone])
+        if stone != self._stone:
+            self._stone = stone
+            self.setPixmap(self.stones[stone])
 
     def remove_stone(self):
         """ Clears the square of any stone. """
-        self.setPixmap(self._stones['e'])
+        self.place_stone('e')
 
 
 if __name__ == "__main__":
@@ -30,6 +30,7 @@ class StatusView(QDockWidget):
         self.update_message()
 
         self._game.status_updated.connect(self.update_message)
+        self._game.board_updated.connect(self.apply_changes)
 
     def update_message(self):
         """ Updates the text of the label with a message. """
@@ -41,7 +42,13 @@ class StatusView(QDockWidget):
         if turn_msg != "" and status_msg != "":
             turn_msg += "; "
 
-        self._status.setText(turn_msg + status_msg)
+        self._status.setText(turn_msg + status_msg + "\n" + self.get_stones_msg())
+
+    def apply_changes(self, origin, destination, changes):
+        """ Updates the message once for a move, from the changes sent with
+            Game.board_updated. """
+        if changes["status"]:
+            self.update_message()
 
     def get_turn_msg(self):
         """ Creates a message indicating the player's turn. """
@@ -51,3 +58,9 @@ class StatusView(QDockWidget):
             message = ""
 
         return message
+
+    def get_stones_msg(self):
+        """ Creates a message with the stones each player has lost. """
+        board = self._game.get_board()
+
+        return "Stones lost: Black {}, White {}".format(board.get_stones_lost('b'), board.get_stones_lost('w'))